@@ -7,7 +7,7 @@ import sys
 from datetime import date
 from pathlib import Path
 
-from . import __version__
+from . import __version__, fastjson
 from .config import load_config
 from .recall import recall, list_entities
 
@@ -101,21 +101,22 @@ def cmd_surprise(args):
         llm = get_provider(cfg.extraction.provider, model=cfg.extraction.model)
         engine = PredictionErrorEngine(llm, cfg.memory_dir, cfg.long_term_memory)
         result = engine.compute_sync(date_str)
+        high, medium, mean = result.surprise_buckets()
         
         print(f"\n🧠 Prediction Error Report — {date_str}")
-        print(f"   Mean PE: {result.mean_surprise:.2f}")
+        print(f"   Mean PE: {mean:.2f}")
         print(f"   Predictions made: {len(result.predictions)}")
         print(f"   Events scored: {len(result.errors)}")
         
-        if result.high_surprise:
-            print(f"\n🔴 High surprise ({len(result.high_surprise)}):")
-            for e in result.high_surprise:
+        if high:
+            print(f"\n🔴 High surprise ({len(high)}):")
+            for e in high:
                 print(f"   [{e.prediction_error:.2f}] {e.event}")
                 print(f"         → {e.reason}")
         
-        if result.medium_surprise:
-            print(f"\n🟡 Medium surprise ({len(result.medium_surprise)}):")
-            for e in result.medium_surprise:
+        if medium:
+            print(f"\n🟡 Medium surprise ({len(medium)}):")
+            for e in medium:
                 print(f"   [{e.prediction_error:.2f}] {e.event}")
         
         if result.model_updates:
@@ -258,7 +259,7 @@ def cmd_reindex(args):
     print("🔄 Reindexing graph from entity files...")
     stats = reindex(cfg)
     
-    print(f"  📄 Scanned {stats['entities']} entities")
+    print(f"  📄 Scanned {stats['entities']} entities ({stats['parsed']} changed)")
     print(f"  🔗 Found {stats['triplets']} relationships")
     if cfg.graph_file.with_suffix(".jsonl.bak").exists():
         print(f"  💾 Old graph backed up to graph.jsonl.bak")
@@ -275,20 +276,21 @@ def cmd_viz(args):
     
     seen = set()
     print("graph LR")
-    for line in cfg.graph_file.read_text().strip().split("\n"):
-        if not line:
-            continue
-        try:
-            t = json.loads(line)
-            s = t["subject"].replace(" ", "_").replace("#", "Nr").replace(".", "")
-            o = t["object"].replace(" ", "_").replace("#", "Nr").replace(".", "")
-            p = t["predicate"]
-            key = f"{s}-{p}-{o}"
-            if key not in seen:
-                seen.add(key)
-                print(f"    {s} -->|{p}| {o}")
-        except:
-            continue
+    with open(cfg.graph_file, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                t = fastjson.loads(line)
+                s = t["subject"].replace(" ", "_").replace("#", "Nr").replace(".", "")
+                o = t["object"].replace(" ", "_").replace("#", "Nr").replace(".", "")
+                p = t["predicate"]
+                key = f"{s}-{p}-{o}"
+                if key not in seen:
+                    seen.add(key)
+                    print(f"    {s} -->|{p}| {o}")
+            except:
+                continue
 
 
 def cmd_evaluate(args):
@@ -320,7 +322,7 @@ def cmd_evaluate(args):
 def cmd_beliefs(args):
     """View and manage the self-model (identity-level beliefs)."""
     cfg = load_config(args.config)
-    model_path = cfg.memory_dir / "self-model.yaml"
+    model_path = cfg.memory_dir / "self-model.json"
 
     if args.bootstrap:
         # Bootstrap from MEMORY.md or provided text
@@ -346,7 +348,7 @@ def cmd_beliefs(args):
 
         print("🧠 Bootstrapping self-model from MEMORY.md + entities...")
         model = engine.bootstrap_sync(text)
-        print(f"✅ Created {len(model.beliefs)} beliefs in memory/self-model.yaml\n")
+        print(f"✅ Created {len(model.beliefs)} beliefs in memory/self-model.json\n")
         print(model.format_readable())
 
     elif args.drift:
@@ -360,34 +362,38 @@ def cmd_beliefs(args):
         if not daily_path.exists():
             print(f"❌ No daily log for {date_str}")
             return
-        if not model_path.exists():
+        engine = SelfModelEngine(None, model_path)
+        if not engine.exists():
             print("❌ No self-model yet. Run: garden beliefs --bootstrap")
             return
-
-        llm = get_provider(cfg.extraction.provider, model=cfg.extraction.model)
-        engine = SelfModelEngine(llm, model_path)
+        engine.llm = get_provider(cfg.extraction.provider, model=cfg.extraction.model)
 
         events = daily_path.read_text()
         print(f"🔍 Detecting identity drift from {date_str}...")
-        drifts = engine.detect_drift_sync(events)
+        model = engine.load()
+        drifts = engine.detect_drift_sync(events, model=model)
         print(engine.format_drifts(drifts))
 
         if drifts and args.apply:
-            model = engine.apply_drifts(drifts, significance_threshold=args.threshold)
+            engine.apply_drifts(drifts, significance_threshold=args.threshold, model=model)
             print(f"\n✅ Applied {len([d for d in drifts if d.significance >= args.threshold])} drifts to self-model.")
 
     else:
         # Show current beliefs
-        from .self_model import SelfModel
+        from .self_model import SelfModelEngine
 
-        if not model_path.exists():
+        engine = SelfModelEngine(None, model_path)
+        if not engine.exists():
             print("No self-model yet. Bootstrap with: garden beliefs --bootstrap")
             return
 
-        model = SelfModel.from_yaml(model_path.read_text())
+        model = engine.load()
 
         if args.json:
             print(json.dumps([b.to_dict() for b in model.active_beliefs()], indent=2))
+        elif args.yaml:
+            # The full model, streamed as the emitter produces it
+            model.dump_to(sys.stdout)
         elif args.weak:
             weak = model.weakening()
             if weak:
@@ -588,7 +594,8 @@ def cmd_stats(args):
     # Count triplets
     triplet_count = 0
     if cfg.graph_file.exists():
-        triplet_count = sum(1 for line in cfg.graph_file.read_text().strip().split("\n") if line)
+        with open(cfg.graph_file, "rb") as f:
+            triplet_count = sum(1 for line in f if line.strip())
     
     # Count surprises
     surprise_count = 0
@@ -616,7 +623,7 @@ def cmd_stats(args):
             print(f"    {t}: {c}")
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         prog="garden",
         description="🌱 MindGardener — A hippocampus for AI agents",
@@ -718,6 +725,7 @@ def main():
     p_beliefs.add_argument("--date", "-d", help="Date for drift detection (default: today)")
     p_beliefs.add_argument("--threshold", type=float, default=0.3, help="Min significance to apply (default: 0.3)")
     p_beliefs.add_argument("--json", action="store_true", help="Output as JSON")
+    p_beliefs.add_argument("--yaml", action="store_true", help="Export the full self-model as YAML")
     p_beliefs.add_argument("--weak", action="store_true", help="Show only weakening beliefs")
     p_beliefs.set_defaults(func=cmd_beliefs)
     
@@ -792,7 +800,7 @@ def main():
     p_core.add_argument("--min-age", type=int, default=30, help="Min age in days before pruning")
     p_core.set_defaults(func=cmd_core)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -801,10 +809,6 @@ def main():
     args.func(args)
 
 
-if __name__ == "__main__":
-    main()
-
-
 def cmd_inbox(args):
     """Manage the quick-capture inbox."""
     cfg = load_config(args.config)
@@ -887,3 +891,7 @@ def cmd_core(args):
         access_data = load_access_log(cfg.memory_dir)
         total_accesses = sum(access_data.get("counts", {}).values())
         print(f"\n📊 Total accesses logged: {total_accesses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,18 @@ import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on libyaml being built
+    from yaml import SafeLoader
+
+# Shared knobs for bulk entity-file loading (recall, evaluate, reindex).
+# File count at which loading goes concurrent; below it the pool costs more
+# than it saves.
+PARALLEL_MIN_FILES = 256
+# Reads are I/O-bound, so a few threads hide cold-cache disk latency
+LOAD_WORKERS = 8
+
 
 @dataclass
 class ExtractionConfig:
@@ -59,7 +71,7 @@ def load_config(config_path: str | Path | None = None) -> EngramConfig:
     for p in paths_to_try:
         if p.exists():
             with open(p) as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=SafeLoader) or {}
             
             if "workspace" in data:
                 cfg.workspace = Path(data["workspace"])
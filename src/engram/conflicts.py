@@ -12,6 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from . import fastjson
 from .filelock import file_lock, safe_append
 
 
@@ -90,16 +91,17 @@ def find_existing_fact(
         return None
     
     matches = []
-    for line in graph_file.read_text().strip().split('\n'):
-        if not line:
-            continue
-        try:
-            fact = json.loads(line)
-            if (fact.get("subject") == subject and 
-                fact.get("predicate") == predicate):
-                matches.append(fact)
-        except json.JSONDecodeError:
-            continue
+    with open(graph_file, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                fact = fastjson.loads(line)
+                if (fact.get("subject") == subject and 
+                    fact.get("predicate") == predicate):
+                    matches.append(fact)
+            except json.JSONDecodeError:
+                continue
     
     if not matches:
         return None
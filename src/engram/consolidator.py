@@ -114,11 +114,12 @@ class Consolidator:
     def _generate_markdown_update(self, result: PredictionResult, date_str: str) -> str:
         """Fallback: generate markdown update directly from PE scores."""
         lines = [f"## Consolidated {date_str}"]
+        high, medium, _ = result.surprise_buckets()
         
-        for e in result.high_surprise:
+        for e in high:
             lines.append(f"- 🔴 **{e.event}** (PE: {e.prediction_error:.1f})")
         
-        for e in result.medium_surprise:
+        for e in medium:
             lines.append(f"- 🟡 {e.event} (PE: {e.prediction_error:.1f})")
 
         if result.model_updates:
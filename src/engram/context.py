@@ -7,15 +7,20 @@ per turn based on a query and token budget.
 Returns a manifest documenting what was loaded and what was skipped.
 """
 
-import json
+import heapq
 import os
 import re
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from . import fastjson
 from .config import EngramConfig
-from .recall import fuzzy_score, extract_wikilinks, search_graph
+from .filelock import atomic_append
+from .recall import (
+    fuzzy_score, extract_wikilinks, search_graph, entity_entries, read_entity_texts,
+)
 
 
 CHARS_PER_TOKEN = 4
@@ -30,6 +35,21 @@ def estimate_tokens(text: str) -> int:
 _estimate_tokens = estimate_tokens
 
 
+def _head_lines(text: str, n: int) -> str:
+    """First n lines of text, same as "\n".join(text.split("\n")[:n]).
+
+    Scans for the n-th newline instead of splitting the whole text.
+    """
+    if n <= 0:
+        return ""
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text
+    return text[:end]
+
+
 def assemble_context(
     query: str,
     config: EngramConfig,
@@ -69,7 +89,9 @@ def assemble_context(
     tokens_used = 0
     
     # --- Phase 1: Entity recall (highest priority) ---
-    entity_matches = _score_entities(query, config)
+    # Only the top max_entities are used (the top one at least, for hops)
+    limit = max(max_entities, 1) if max_entities >= 0 else None
+    entity_matches = _score_entities(query, config, limit)
     
     for score, name, content, filepath in entity_matches[:max_entities]:
         est = estimate_tokens(content)
@@ -84,7 +106,7 @@ def assemble_context(
             })
         else:
             # Try truncated version (first 20 lines)
-            truncated = "\n".join(content.split("\n")[:20])
+            truncated = _head_lines(content, 20)
             est_trunc = estimate_tokens(truncated)
             if tokens_used + est_trunc <= token_budget:
                 context_parts.append(f"## Entity: {name} (truncated)\n{truncated}")
@@ -105,33 +127,29 @@ def assemble_context(
                     "reason": "token_budget_exceeded",
                 })
     
-    # --- Phase 2: Linked entities (1-hop graph traversal) ---
+    # --- Phase 2: Linked entities (breadth-first wikilink traversal) ---
     if max_hops >= 1 and entity_matches:
-        top_content = entity_matches[0][2] if entity_matches else ""
-        linked = extract_wikilinks(top_content)
+        _, top_name, top_content, _ = entity_matches[0]
         
-        for link in linked[:5]:
-            link_file = config.entities_dir / f"{link.replace(' ', '-')}.md"
-            if link_file.exists():
-                link_content = link_file.read_text()
-                # Summary only for linked entities (first 8 lines)
-                summary = "\n".join(link_content.split("\n")[:8])
-                est = estimate_tokens(summary)
-                if tokens_used + est <= token_budget:
-                    context_parts.append(f"## Linked: {link}\n{summary}")
-                    tokens_used += est
-                    manifest_loaded.append({
-                        "type": "linked_entity",
-                        "name": link,
-                        "tokens": est,
-                    })
-                else:
-                    manifest_skipped.append({
-                        "type": "linked_entity",
-                        "name": link,
-                        "tokens": est,
-                        "reason": "token_budget_exceeded",
-                    })
+        for link, link_content in _expand_links(top_name, top_content, config, max_hops):
+            # Summary only for linked entities (first 8 lines)
+            summary = _head_lines(link_content, 8)
+            est = estimate_tokens(summary)
+            if tokens_used + est <= token_budget:
+                context_parts.append(f"## Linked: {link}\n{summary}")
+                tokens_used += est
+                manifest_loaded.append({
+                    "type": "linked_entity",
+                    "name": link,
+                    "tokens": est,
+                })
+            else:
+                manifest_skipped.append({
+                    "type": "linked_entity",
+                    "name": link,
+                    "tokens": est,
+                    "reason": "token_budget_exceeded",
+                })
     
     # --- Phase 3: Graph connections ---
     graph_results = search_graph(query, config) if include_graph else []
@@ -247,13 +265,12 @@ def assemble_context(
     }
 
 
-def _score_entities(query: str, config: EngramConfig) -> list[tuple]:
-    """Score and rank all entities against query."""
+def _score_entities(query: str, config: EngramConfig, limit: int | None = None) -> list[tuple]:
+    """Score and rank all entities against query, keeping the best `limit`."""
     if not config.entities_dir.exists():
         return []
     
     query_lower = query.lower()
-    query_words = set(query_lower.split())
     
     # Resolve aliases
     try:
@@ -263,39 +280,76 @@ def _score_entities(query: str, config: EngramConfig) -> list[tuple]:
         if resolved != query:
             query = resolved
             query_lower = query.lower()
-            query_words = set(query_lower.split())
     except ImportError:
         pass
     
+    # Same sorted listing and stat-validated text cache that recall() uses,
+    # so repeated queries don't re-read or re-lowercase unchanged files
+    entries = entity_entries(config.entities_dir)
+    texts = read_entity_texts([f for _, f in entries], config)
+    
+    # A word-only content hit scores 0.1, which never clears the > 0.1 cut
+    # and never beats a name score that does, so only the full-query
+    # substring test can change the result.
     matches = []
-    for entity_file in sorted(config.entities_dir.glob("*.md")):
-        name = entity_file.stem.replace("-", " ")
-        content = entity_file.read_text()
-        
-        name_score = fuzzy_score(query, name)
-        content_score = 0.0
-        if query_lower in content.lower():
-            content_score = 0.5
-        elif any(w in content.lower() for w in query_words if len(w) >= 3):
-            content_score = 0.1
-        
-        score = max(name_score, content_score)
+    for (name, entity_file), (content, content_lower) in zip(entries, texts):
+        score = fuzzy_score(query, name)
+        if score < 0.5 and query_lower in content_lower:
+            score = 0.5
         if score > 0.1:
             matches.append((score, name, content, entity_file))
     
+    if limit is not None:
+        return heapq.nlargest(limit, matches)
     matches.sort(reverse=True)
     return matches
 
 
+# Wikilinks followed per entity during traversal
+LINKS_PER_ENTITY = 5
+
+
+def _expand_links(seed_name: str, seed_content: str, config: EngramConfig,
+                  max_hops: int) -> Iterator[tuple[str, str]]:
+    """Breadth-first walk over wikilinks from the seed entity.
+    
+    Yields (link, content) for each linked entity file that exists, at
+    most once per link, nearest hops first. Every edge has unit cost, so
+    a FIFO queue with a visited set visits each entity at its shortest
+    hop distance.
+    """
+    queue = deque([(seed_content, 0)])
+    visited: set[str] = set()
+    while queue:
+        content, depth = queue.popleft()
+        for link in extract_wikilinks(content)[:LINKS_PER_ENTITY]:
+            if link in visited:
+                continue
+            visited.add(link)
+            link_file = config.entities_dir / f"{link.replace(' ', '-')}.md"
+            try:
+                link_content = read_entity_texts([link_file], config)[0][0]
+            except FileNotFoundError:
+                continue
+            yield link, link_content
+            if depth + 1 < max_hops:
+                queue.append((link_content, depth + 1))
+        if depth == 0:
+            # A direct self-link is still listed; deeper hops never return
+            visited.add(seed_name)
+            visited.add(seed_name.replace(" ", "-"))
+
+
 def _extract_relevant_lines(content: str, query: str, context_lines: int = 3) -> str:
     """Extract lines from content that are relevant to the query."""
-    query_words = set(query.lower().split())
+    words = [w for w in set(query.lower().split()) if len(w) >= 3]
     lines = content.split("\n")
+    # Lowercasing never adds or removes newlines, so the lines stay aligned
+    lines_lower = content.lower().split("\n")
     relevant_indices = set()
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        if any(w in line_lower for w in query_words if len(w) >= 3):
+    for i, line_lower in enumerate(lines_lower):
+        if any(w in line_lower for w in words):
             # Include surrounding context
             for j in range(max(0, i - context_lines), min(len(lines), i + context_lines + 1)):
                 relevant_indices.add(j)
@@ -310,8 +364,7 @@ def _log_manifest(config: EngramConfig, manifest: dict):
     """Append manifest to the manifest log."""
     log_file = config.memory_dir / "context-manifests.jsonl"
     try:
-        with open(log_file, "a") as f:
-            f.write(json.dumps(manifest) + "\n")
+        atomic_append(log_file, fastjson.dumps_bytes(manifest) + b"\n")
     except OSError:
         pass  # Non-critical
 
@@ -334,9 +387,10 @@ def _score_entity(query: str, name: str, content: str, query_words: set) -> floa
     name_score = fuzzy_score(query, name)
     content_score = 0.0
     query_lower = query.lower()
-    if query_lower in content.lower():
+    content_lower = content.lower()
+    if query_lower in content_lower:
         content_score = 0.5
-    elif any(w in content.lower() for w in query_words if len(w) >= 3):
+    elif any(w in content_lower for w in query_words if len(w) >= 3):
         content_score = 0.1
     return max(name_score, content_score)
 
@@ -345,9 +399,10 @@ def _score_daily(query: str, content: str, query_words: set, days_ago: int = 0)
     """Score daily log relevance. Test-compatible wrapper."""
     query_lower = query.lower()
     score = 0.0
-    if query_lower in content.lower():
+    content_lower = content.lower()
+    if query_lower in content_lower:
         score = 0.5
-    elif any(w in content.lower() for w in query_words if len(w) >= 3):
+    elif any(w in content_lower for w in query_words if len(w) >= 3):
         score = 0.3
     # Recency decay
     if days_ago > 0:
@@ -526,11 +526,12 @@ def run_surprise(date_str: str):
             print(f"  {emoji} [{score:.1f}] {s['event']}")
             print(f"       {s['reason']}")
         
+        now = datetime.now().isoformat()
         with file_lock(SURPRISE_FILE):
             with open(SURPRISE_FILE, "a") as f:
                 for s in result["surprises"]:
                     s["date"] = date_str
-                    s["timestamp"] = datetime.now().isoformat()
+                    s["timestamp"] = now
                     f.write(json.dumps(s) + "\n")
     else:
         print(f"No surprises for {date_str}")
@@ -0,0 +1,146 @@
+"""Entity corpus — every entity file packed into one mmappable blob.
+
+Scanning thousands of small markdown files costs an open + read + close per
+file. The corpus stores them structure-of-arrays style in three files next
+to the graph:
+
+    entities.names    newline-delimited file names, in sorted order
+    entities.offsets  int64 arrays: N+1 byte offsets, then N mtimes, N sizes
+    entities.dat      concatenated UTF-8 contents
+
+Built at reindex time. Readers check each entry's (mtime_ns, size) against
+the live file and fall back to reading it directly when they differ, so a
+stale corpus is never trusted.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from array import array
+from pathlib import Path
+from typing import Optional
+
+NAMES_FILE = "entities.names"
+OFFSETS_FILE = "entities.offsets"
+DATA_FILE = "entities.dat"
+
+
+class Corpus:
+    """Read-only view of a built corpus."""
+
+    def __init__(self, names: list[str], offsets: array, mtimes: array,
+                 sizes: array, mm: Optional[mmap.mmap]):
+        self.names = names
+        self.offsets = offsets
+        self.mtimes = mtimes
+        self.sizes = sizes
+        self._mm = mm
+        self._pos = {name: i for i, name in enumerate(names)}
+
+    def raw(self, i: int) -> bytes:
+        if self._mm is None:
+            return b""
+        return self._mm[self.offsets[i]:self.offsets[i + 1]]
+
+    def get(self, name: str, mtime_ns: int, size: int) -> Optional[str]:
+        """Content of entity file `name` if the stored copy matches its stat."""
+        i = self._pos.get(name)
+        if i is None or self.mtimes[i] != mtime_ns or self.sizes[i] != size:
+            return None
+        return self.raw(i).decode()
+
+    def entry(self, name: str) -> Optional[tuple[int, int, bytes]]:
+        """(mtime_ns, size, raw bytes) stored for `name`, if any."""
+        i = self._pos.get(name)
+        if i is None:
+            return None
+        return self.mtimes[i], self.sizes[i], self.raw(i)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_corpus(corpus_dir: Path) -> Optional[Corpus]:
+    """Open the corpus in corpus_dir, or None if it's missing or malformed."""
+    try:
+        names_text = (corpus_dir / NAMES_FILE).read_text()
+        offsets_blob = (corpus_dir / OFFSETS_FILE).read_bytes()
+        data_fd = os.open(corpus_dir / DATA_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+
+    try:
+        names = names_text.split("\n") if names_text else []
+        n = len(names)
+        packed = array("q")
+        packed.frombytes(offsets_blob)
+        if len(packed) != 3 * n + 1:
+            return None
+        offsets, mtimes, sizes = packed[:n + 1], packed[n + 1:2 * n + 1], packed[2 * n + 1:]
+        if offsets[-1] != os.fstat(data_fd).st_size:
+            return None
+        mm = mmap.mmap(data_fd, 0, access=mmap.ACCESS_READ) if offsets[-1] else None
+    except ValueError:
+        return None
+    finally:
+        os.close(data_fd)
+    return Corpus(names, offsets, mtimes, sizes, mm)
+
+
+def build_corpus(entities_dir: Path, corpus_dir: Path) -> int:
+    """Pack every entity file into the corpus. Returns the entity count.
+
+    Entries whose stat matches the previous corpus are copied from it
+    instead of being read again.
+    """
+    with os.scandir(entities_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".md") and not e.name.startswith(".")),
+            key=lambda e: e.name,
+        )
+
+    old = load_corpus(corpus_dir)
+    names: list[str] = []
+    offsets = array("q", [0])
+    mtimes = array("q")
+    sizes = array("q")
+    tmp_data = corpus_dir / (DATA_FILE + ".tmp")
+    try:
+        with open(tmp_data, "wb") as out:
+            for entry in entries:
+                # Stat before reading: if the file changes in between, the
+                # recorded stat is older than the content and readers re-read.
+                st = entry.stat()
+                prev = old.entry(entry.name) if old else None
+                if prev and prev[0] == st.st_mtime_ns and prev[1] == st.st_size:
+                    data = prev[2]
+                else:
+                    with open(entry.path, "rb") as f:
+                        data = f.read()
+                out.write(data)
+                names.append(entry.name)
+                offsets.append(offsets[-1] + len(data))
+                mtimes.append(st.st_mtime_ns)
+                sizes.append(st.st_size)
+    finally:
+        if old:
+            old.close()
+
+    tmp_names = corpus_dir / (NAMES_FILE + ".tmp")
+    tmp_names.write_text("\n".join(names))
+    tmp_offsets = corpus_dir / (OFFSETS_FILE + ".tmp")
+    tmp_offsets.write_bytes((offsets + mtimes + sizes).tobytes())
+    # Data first: a reader racing the swap sees a size mismatch and bails
+    os.replace(tmp_data, corpus_dir / DATA_FILE)
+    os.replace(tmp_names, corpus_dir / NAMES_FILE)
+    os.replace(tmp_offsets, corpus_dir / OFFSETS_FILE)
+    return len(names)
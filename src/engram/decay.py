@@ -5,13 +5,14 @@ Temporal decay for MindGardener facts.
 Facts lose relevance over time unless reinforced.
 """
 
-import json
+import io
 import math
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from .filelock import file_lock
+from . import fastjson
+from .filelock import safe_write_bytes
 
 
 # Default decay rate (half-life in days)
@@ -81,16 +82,17 @@ def apply_decay_to_graph(
     
     scored_facts = []
     
-    for line in graph_file.read_text().strip().split('\n'):
-        if not line:
-            continue
-        try:
-            fact = json.loads(line)
-            score = score_fact(fact, half_life_days)
-            fact["_decay_score"] = round(score, 3)
-            scored_facts.append(fact)
-        except:
-            continue
+    with open(graph_file, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                fact = fastjson.loads(line)
+                score = score_fact(fact, half_life_days)
+                fact["_decay_score"] = round(score, 3)
+                scored_facts.append(fact)
+            except:
+                continue
     
     # Sort by score (lowest first = most decayed)
     scored_facts.sort(key=lambda f: f.get("_decay_score", 0))
@@ -116,11 +118,13 @@ def prune_decayed(
     
     if not dry_run and prune:
         # Rewrite graph without pruned facts
-        with file_lock(graph_file):
-            with open(graph_file, "w") as out:
-                for fact in keep:
-                    del fact["_decay_score"]  # Remove temp field
-                    out.write(json.dumps(fact) + "\n")
+        buf = io.BytesIO()
+        write = buf.write
+        for fact in keep:
+            del fact["_decay_score"]  # Remove temp field
+            write(fastjson.dumps_bytes(fact))
+            write(b"\n")
+        safe_write_bytes(graph_file, buf.getvalue())
     
     return len(keep), len(prune)
 
@@ -139,24 +143,27 @@ def reinforce_fact(
     if not graph_file.exists():
         return False
     
-    lines = graph_file.read_text().strip().split('\n')
+    lines = graph_file.read_bytes().strip().split(b'\n')
     updated = False
+    now = datetime.now().isoformat()
     
-    with file_lock(graph_file):
-        with open(graph_file, "w") as out:
-            for line in lines:
-                if not line:
-                    continue
-                try:
-                    fact = json.loads(line)
-                    if (fact.get("subject") == subject and
-                        fact.get("predicate") == predicate and
-                        fact.get("object") == obj):
-                        fact["reinforcements"] = fact.get("reinforcements", 0) + 1
-                        fact["provenance"]["last_reinforced"] = datetime.now().isoformat()
-                        updated = True
-                    out.write(json.dumps(fact) + "\n")
-                except:
-                    out.write(line + "\n")
+    buf = io.BytesIO()
+    write = buf.write
+    for line in lines:
+        if not line:
+            continue
+        try:
+            fact = fastjson.loads(line)
+            if (fact.get("subject") == subject and
+                fact.get("predicate") == predicate and
+                fact.get("object") == obj):
+                fact["reinforcements"] = fact.get("reinforcements", 0) + 1
+                fact["provenance"]["last_reinforced"] = now
+                updated = True
+            write(fastjson.dumps_bytes(fact))
+        except:
+            write(line)
+        write(b"\n")
+    safe_write_bytes(graph_file, buf.getvalue())
     
     return updated
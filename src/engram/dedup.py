@@ -12,13 +12,16 @@ Approach:
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import shutil
+import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+from .graph import load_adjacency
+
 
 # Known alias patterns — common ways LLMs split the same entity
 ALIAS_PATTERNS = [
@@ -31,8 +34,46 @@ ALIAS_PATTERNS = [
 ]
 
 
+_UNSAFE_CHARS = re.compile(r'[^\w\s-]')
+_TIMELINE_ENTRY = re.compile(r'(### \[\[\d{4}-\d{2}-\d{2}\]\].*?)(?=### \[\[|\Z)', re.DOTALL)
+_DATE_HEADER = re.compile(r'### \[\[(\d{4}-\d{2}-\d{2})\]\]')
+
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '-')
+    return _UNSAFE_CHARS.sub('', name).strip().replace(' ', '-')
+
+
+def _read_lower(path: str) -> str:
+    with open(path) as f:
+        return f.read().lower()
+
+
+def _trigrams(text: str) -> set[str]:
+    return set(map(''.join, zip(text, text[1:], text[2:])))
+
+
+def _containing(needles: list[str], texts: list[str]) -> list[set[int]]:
+    """For each needle, the indices of the texts it occurs in.
+    
+    A needle can only occur in texts that contain each of its trigrams, so
+    one trigram per needle (the one fewest needles share) is indexed over
+    the texts, and only the texts holding it get the substring check.
+    Needles shorter than a trigram are checked against every text.
+    """
+    needle_grams = [_trigrams(needle) for needle in needles]
+    shared = Counter(g for grams in needle_grams for g in grams)
+    keys = [min(grams, key=shared.__getitem__) if grams else None for grams in needle_grams]
+    postings: dict[str, list[int]] = {key: [] for key in keys if key is not None}
+    vocab = postings.keys()
+    for j, text in enumerate(texts):
+        for gram in vocab & _trigrams(text):
+            postings[gram].append(j)
+    
+    everything = range(len(texts))
+    return [
+        {j for j in (everything if key is None else postings[key]) if needle in texts[j]}
+        for needle, key in zip(needles, keys)
+    ]
 
 
 def find_duplicates(entities_dir: Path, graph_file: Path | None = None,
@@ -44,8 +85,12 @@ def find_duplicates(entities_dir: Path, graph_file: Path | None = None,
     """
     duplicates = []
     
-    entity_files = list(entities_dir.glob("*.md"))
-    names = {f.stem.replace('-', ' ').lower(): f for f in entity_files}
+    # One scandir pass with plain string paths; same files as glob("*.md")
+    with os.scandir(entities_dir) as it:
+        names = {
+            sys.intern(os.path.splitext(e.name)[0].replace('-', ' ').lower()): e.path
+            for e in it if e.name.endswith(".md")
+        }
     
     # 1. Check configured aliases
     if aliases:
@@ -63,45 +108,39 @@ def find_duplicates(entities_dir: Path, graph_file: Path | None = None,
                     ))
 
     # 2. Substring matching (steipete ⊂ Peter Steinberger page content)
-    for name_a, file_a in names.items():
-        content_a = file_a.read_text().lower()
-        for name_b, file_b in names.items():
-            if name_a >= name_b:  # avoid self-compare and double-count
-                continue
-            content_b = file_b.read_text().lower()
-            
-            # Check if one name appears in the other's content
-            if name_a in content_b and name_b in content_a:
-                duplicates.append((str(file_a), str(file_b), f"mutual references"))
+    # Report each pair once, smaller name first, in directory order
+    order = list(names)
+    contents = [_read_lower(names[name]) for name in order]
+    found_in = _containing(order, contents)
+    mutual = sorted(
+        (a, b)
+        for a, in_b in enumerate(found_in)
+        for b in in_b
+        if order[a] < order[b] and a in found_in[b]
+    )
+    for a, b in mutual:
+        duplicates.append((str(names[order[a]]), str(names[order[b]]), f"mutual references"))
             
     # 3. Graph-based: shared triplet neighbors
     if graph_file and graph_file.exists():
-        neighbors: dict[str, set] = {}
-        for line in graph_file.read_text().strip().split('\n'):
-            if not line:
-                continue
-            try:
-                t = json.loads(line)
-                s, o = t.get("subject", "").lower(), t.get("object", "").lower()
-                neighbors.setdefault(s, set()).add(o)
-                neighbors.setdefault(o, set()).add(s)
-            except:
-                pass
+        adj = load_adjacency(graph_file)
         
-        # Find entities with high neighbor overlap
-        entity_names = list(names.keys())
-        for i, name_a in enumerate(entity_names):
-            for name_b in entity_names[i+1:]:
-                na = neighbors.get(name_a, set())
-                nb = neighbors.get(name_b, set())
-                if na and nb:
-                    overlap = len(na & nb)
-                    union = len(na | nb)
-                    if union > 0 and overlap / union > 0.5:
-                        duplicates.append((
-                            str(names[name_a]), str(names[name_b]),
-                            f"high graph overlap ({overlap}/{union} shared neighbors)"
-                        ))
+        # Find entities with high neighbor overlap. Only entity pairs that
+        # share a neighbor can qualify, so count those straight off the
+        # adjacency, then report them in entity-file order.
+        connected = [name for name in names if name in adj.ids and adj.degree(adj.ids[name])]
+        order = {adj.ids[name]: k for k, name in enumerate(connected)}
+        found = []
+        for (a, b), overlap in adj.shared_neighbor_counts(set(order)).items():
+            union = adj.degree(a) + adj.degree(b) - overlap
+            if overlap / union > 0.5:
+                i, j = sorted((order[a], order[b]))
+                found.append((i, j, overlap, union))
+        for i, j, overlap, union in sorted(found):
+            duplicates.append((
+                str(names[connected[i]]), str(names[connected[j]]),
+                f"high graph overlap ({overlap}/{union} shared neighbors)"
+            ))
     
     return duplicates
 
@@ -146,9 +185,7 @@ def merge_entity_files(primary_path: Path, secondary_path: Path,
                     insert_at = i + 1
                     while insert_at < len(lines) and not lines[insert_at].startswith('## '):
                         insert_at += 1
-                    for fact in sec_facts:
-                        lines.insert(insert_at, f"- {fact}")
-                        insert_at += 1
+                    lines[insert_at:insert_at] = [f"- {fact}" for fact in sec_facts]
                     primary = '\n'.join(lines)
                     break
         else:
@@ -158,26 +195,29 @@ def merge_entity_files(primary_path: Path, secondary_path: Path,
         changes.append(f"Added {len(sec_facts)} facts from {secondary_path.stem}")
     
     # Extract and append timeline entries from secondary
-    sec_timeline_entries = re.findall(
-        r'(### \[\[\d{4}-\d{2}-\d{2}\]\].*?)(?=### \[\[|\Z)', 
-        secondary, re.DOTALL
-    )
-    for entry in sec_timeline_entries:
-        date_match = re.search(r'### \[\[(\d{4}-\d{2}-\d{2})\]\]', entry)
-        if date_match and date_match.group(0) not in primary:
-            primary = primary.rstrip() + '\n' + entry.strip() + '\n'
+    # Dates already present, as a set: same answer as searching primary for
+    # each "### [[date]]" header, without rescanning the growing text
+    primary_dates = set(_DATE_HEADER.findall(primary))
+    new_entries = []
+    for entry in _TIMELINE_ENTRY.findall(secondary):
+        date_match = _DATE_HEADER.match(entry)  # entries start at their header
+        if date_match and date_match.group(1) not in primary_dates:
+            primary_dates.add(date_match.group(1))
+            new_entries.append(entry.strip())
             changes.append(f"Added timeline entry {date_match.group(1)}")
+    if new_entries:
+        primary = primary.rstrip() + ''.join('\n' + e for e in new_entries) + '\n'
     
     # Add alias note
     alias_note = f"\n**Also known as:** {secondary_path.stem.replace('-', ' ')}"
     if alias_note.strip() not in primary:
         # Add after the Type line
-        primary = re.sub(
-            r'(\*\*Type:\*\*.*)', 
-            r'\1' + alias_note,
-            primary,
-            count=1
-        )
+        type_idx = primary.find('**Type:**')
+        if type_idx != -1:
+            eol = primary.find('\n', type_idx)
+            if eol == -1:
+                eol = len(primary)
+            primary = primary[:eol] + alias_note + primary[eol:]
     
     # Write merged file
     primary_path.write_text(primary)
@@ -17,15 +17,18 @@ becomes a potential source of new knowledge.
 
 from __future__ import annotations
 
-import json
 import re
-from dataclasses import dataclass, field
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from .config import EngramConfig
-from .filelock import safe_write, safe_append, file_lock
+from .config import EngramConfig, LOAD_WORKERS, PARALLEL_MIN_FILES
+from . import fastjson
+from .filelock import safe_write, atomic_append
 from .recall import fuzzy_score
 
 
@@ -127,6 +130,13 @@ class EvaluationResult:
         }
 
 
+MAX_CLAIMS = 20
+_SENTENCE = re.compile(r'[^.!?\n]+')
+_META_PREFIXES = ("?", "!", "Let me", "I'll", "I will", "Sure",
+                  "Okay", "Here", "Note:", "---")
+_CLAIM_MARKER = re.compile(r'[A-Z][a-z]|\d|\[\[')
+
+
 def _extract_claims(text: str) -> list[str]:
     """Extract factual claims from agent output text.
     
@@ -134,50 +144,141 @@ def _extract_claims(text: str) -> list[str]:
     Simple heuristic: sentences containing proper nouns or entity-like patterns.
     """
     claims = []
-    # Split into sentences
-    sentences = re.split(r'[.!?\n]', text)
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
+    # Sentences are the non-empty runs between terminators, found lazily
+    for match in _SENTENCE.finditer(text):
+        sentence = match.group().strip()
         if len(sentence) < 10:
             continue
         # Skip questions, commands, meta-commentary
-        if sentence.startswith(("?", "!", "Let me", "I'll", "I will", "Sure", 
-                                "Okay", "Here", "Note:", "---")):
+        if sentence.startswith(_META_PREFIXES):
             continue
         # Must contain something that looks like a factual claim
         # (has a proper noun, number, or entity-like pattern)
-        if (re.search(r'[A-Z][a-z]+', sentence) or 
-            re.search(r'\d+', sentence) or
-            '[[' in sentence):
-            claims.append(sentence.strip())
+        if _CLAIM_MARKER.search(sentence):
+            claims.append(sentence)
+            if len(claims) == MAX_CLAIMS:
+                break
     
-    return claims[:20]  # Cap at 20 claims
+    return claims
+
+
+@dataclass
+class ParsedEntity:
+    """An entity file parsed once, reused across every claim check."""
+    name: str
+    name_lower: str = ""  # interned canonical key
+    type: str = ""
+    facts: list[str] = field(default_factory=list)
+    facts_lower: list[str] = field(default_factory=list)
+    bullet_lines: list[str] = field(default_factory=list)  # every "- " line, stripped
+    bullet_lines_lower: list[str] = field(default_factory=list)
+    shingles: frozenset[str] = frozenset()  # 4-grams of the bullet text
+
+
+SHINGLE_SIZE = 4
+
+_TYPE_LINE = re.compile(r'\*\*Type:\*\*\s*(\w+)')
+
+
+def _shingles(text: str) -> frozenset[str]:
+    """Overlapping character n-grams used as a cheap match prefilter."""
+    return frozenset(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+
+
+def parse_entity(name: str, content: str) -> ParsedEntity:
+    """Parse type, facts and bullet lines out of an entity file in one pass."""
+    parsed = ParsedEntity(name=name, name_lower=sys.intern(name.lower()))
+    section = ""
+    for line in content.split("\n"):
+        if line.startswith("## "):
+            section = line[3:].strip()
+            continue
+        if not parsed.type and "**Type:**" in line:
+            type_match = _TYPE_LINE.search(line)
+            if type_match:
+                parsed.type = type_match.group(1)
+        stripped = line.strip()
+        if stripped.startswith("- "):
+            parsed.bullet_lines.append(stripped)
+            parsed.bullet_lines_lower.append(stripped.lower())
+            if section == "Facts":
+                fact = stripped.lstrip("- ")
+                parsed.facts.append(fact)
+                parsed.facts_lower.append(fact.lower())
+    parsed.shingles = _shingles("\n".join(parsed.bullet_lines_lower))
+    return parsed
 
 
-def _match_entity(claim: str, entities_dir: Path) -> Optional[tuple[str, str]]:
-    """Find the best matching entity for a claim.
+# Parsed entities keyed by path and validated on stat. ParsedEntity is never
+# modified after parse_entity(), so cached instances are shared between calls.
+PARSE_CACHE_SIZE = 4096
+_PARSE_CACHE: dict[str, tuple[int, int, ParsedEntity]] = {}
+
+
+def _load_entities(entities_dir: Path) -> dict[str, ParsedEntity]:
+    """Parse every entity file, reusing earlier parses of unchanged files.
     
-    Returns (entity_name, entity_content) or None.
+    Keyed by display name.
     """
+    files = list(entities_dir.glob("*.md"))
+    stats = [f.stat() for f in files]
+    parsed: list[Optional[ParsedEntity]] = []
+    missing = []
+    for i, (f, st) in enumerate(zip(files, stats)):
+        hit = _PARSE_CACHE.get(str(f))
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            parsed.append(hit[2])
+        else:
+            parsed.append(None)
+            missing.append(i)
+    
+    if len(missing) >= PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+            texts = list(ex.map(Path.read_text, (files[i] for i in missing)))
+    else:
+        texts = [files[i].read_text() for i in missing]
+    for i, text in zip(missing, texts):
+        f = files[i]
+        parsed[i] = parse_entity(f.stem.replace("-", " "), text)
+        if len(_PARSE_CACHE) >= PARSE_CACHE_SIZE:
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[str(f)] = (stats[i].st_mtime_ns, stats[i].st_size, parsed[i])
+    
+    return {p.name: p for p in parsed}
+
+
+def _match_entity(claim: str, entities: dict[str, ParsedEntity],
+                  claim_lower: str | None = None) -> Optional[ParsedEntity]:
+    """Find the best matching entity for a claim."""
     best_score = 0.0
     best_match = None
+    if claim_lower is None:
+        claim_lower = claim.lower()
     
-    for entity_file in entities_dir.glob("*.md"):
-        name = entity_file.stem.replace("-", " ")
+    for name, parsed in entities.items():
         # Check if entity name appears in claim
-        if name.lower() in claim.lower():
-            content = entity_file.read_text()
-            return (name, content)
+        if parsed.name_lower in claim_lower:
+            return parsed
         
         score = fuzzy_score(claim, name)
         if score > best_score and score > 0.3:
             best_score = score
-            best_match = (name, entity_file.read_text())
+            best_match = parsed
     
     return best_match
 
 
+_PROPER_NOUN = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+
+# Capitalized words that start sentences or name dates, never entities
+_NOT_ENTITIES = frozenset({
+    "the", "this", "that", "these", "when", "where", "what", "which", "here", "there",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+})
+
+
 def evaluate_output(
     output_text: str,
     config: EngramConfig,
@@ -207,26 +308,24 @@ def evaluate_output(
         evaluated_at=datetime.now().isoformat(),
     )
     
-    claims = _extract_claims(output_text)
+    claims = _extract_claims(output_text) if output_text.strip() else []
     if not claims:
         result.overall_confidence = 0.5  # No checkable claims
         return result
     
-    # Load all entity names for new-entity detection
-    known_entities = set()
-    entity_contents: dict[str, str] = {}
-    for entity_file in config.entities_dir.glob("*.md"):
-        name = entity_file.stem.replace("-", " ")
-        known_entities.add(name.lower())
-        entity_contents[name.lower()] = entity_file.read_text()
+    # Parse every entity once; claims are checked against the parsed form
+    entities = _load_entities(config.entities_dir)
+    known_entities = {parsed.name_lower for parsed in entities.values()}
+    new_entity_names: set[str] = set()
     
     # Check each claim
     for claim in claims:
-        match = _match_entity(claim, config.entities_dir)
+        claim_lower = claim.lower()
+        match = _match_entity(claim, entities, claim_lower)
         
         if match:
-            entity_name, entity_content = match
-            fc = _check_claim_against_entity(claim, entity_name, entity_content)
+            entity_name = match.name
+            fc = _check_claim_against_entity(claim, entity_name, match, claim_lower)
             result.fact_checks.append(fc)
             
             # If claim contains new info about existing entity, mark for write-back
@@ -239,19 +338,14 @@ def evaluate_output(
                 ))
         else:
             # Check for proper nouns that might be new entities
-            proper_nouns = re.findall(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', claim)
-            for noun in proper_nouns:
-                if (noun.lower() not in known_entities and 
+            for noun in _PROPER_NOUN.findall(claim):
+                noun_lower = noun.lower()
+                if (noun_lower not in known_entities and 
                     len(noun) > 2 and
-                    noun.lower() not in {"the", "this", "that", "these", "when", 
-                                          "where", "what", "which", "here", "there",
-                                          "monday", "tuesday", "wednesday", "thursday",
-                                          "friday", "saturday", "sunday",
-                                          "january", "february", "march", "april",
-                                          "may", "june", "july", "august", "september",
-                                          "october", "november", "december"}):
+                    noun_lower not in _NOT_ENTITIES):
                     # Possible new entity
-                    if not any(ne.get("name") == noun for ne in result.new_entities):
+                    if noun not in new_entity_names:
+                        new_entity_names.add(noun)
                         result.new_entities.append({
                             "name": noun,
                             "type": "unknown",
@@ -275,66 +369,83 @@ def evaluate_output(
     return result
 
 
+# Verdicts keyed by (claim, entity name). Each entry remembers the
+# ParsedEntity it was computed from and only counts as a hit for that same
+# instance, so a re-parsed (changed) entity file invalidates it.
+CHECK_CACHE_SIZE = 4096
+_CHECK_CACHE: OrderedDict[tuple[str, str], tuple[ParsedEntity, FactCheck]] = OrderedDict()
+
+
 def _check_claim_against_entity(claim: str, entity_name: str, 
-                                 entity_content: str) -> FactCheck:
+                                 entity: ParsedEntity | str,
+                                 claim_lower: str | None = None) -> FactCheck:
     """Check a single claim against an entity's content.
     
-    Uses text matching — no LLM needed.
+    Uses text matching — no LLM needed. Accepts raw entity text or a
+    ParsedEntity; callers checking many claims should parse once.
     """
-    claim_lower = claim.lower()
-    content_lower = entity_content.lower()
-    
-    # Extract facts from entity
-    facts_section = re.search(r'## Facts\n(.*?)(?=\n## |\Z)', entity_content, re.DOTALL)
-    facts = []
-    if facts_section:
-        facts = [line.strip().lstrip("- ") for line in facts_section.group(1).split("\n") 
-                 if line.strip().startswith("- ")]
-    
-    # Extract type
-    type_match = re.search(r'\*\*Type:\*\*\s*(\w+)', entity_content)
-    entity_type = type_match.group(1) if type_match else ""
+    if isinstance(entity, str):
+        return _check_claim(claim, entity_name, parse_entity(entity_name, entity), claim_lower)
+    
+    key = (claim, entity_name)
+    hit = _CHECK_CACHE.get(key)
+    if hit is not None and hit[0] is entity:
+        _CHECK_CACHE.move_to_end(key)
+        return replace(hit[1])
+    fc = _check_claim(claim, entity_name, entity, claim_lower)
+    _CHECK_CACHE[key] = (entity, fc)
+    if len(_CHECK_CACHE) > CHECK_CACHE_SIZE:
+        _CHECK_CACHE.popitem(last=False)
+    return replace(fc)
+
+
+def _check_claim(claim: str, entity_name: str, entity: ParsedEntity,
+                 claim_lower: str | None = None) -> FactCheck:
+    if claim_lower is None:
+        claim_lower = claim.lower()
+    entity_type = entity.type
     
     # Check for direct confirmation (claim text found in entity)
     claim_words = {w for w in claim_lower.split() if len(w) >= 4}
     
-    # Strong confirmation: multiple claim words found in facts
-    fact_matches = 0
-    best_fact = ""
-    for fact in facts:
-        fact_lower = fact.lower()
-        matching_words = sum(1 for w in claim_words if w in fact_lower)
-        if matching_words > fact_matches:
-            fact_matches = matching_words
-            best_fact = fact
-    
-    if fact_matches >= 3:
-        return FactCheck(
-            claim=claim,
-            verdict="confirmed",
-            confidence=min(1.0, 0.5 + fact_matches * 0.1),
-            source=entity_name,
-            evidence=best_fact,
-        )
+    # Word matching needs at least two claim words (each >= 4 chars) inside
+    # a bullet line, which implies at least two shared 4-grams. Entities
+    # below that can't confirm, so skip straight to the cheaper checks.
+    if len(_shingles(claim_lower) & entity.shingles) >= 2:
+        # Strong confirmation: multiple claim words found in facts
+        fact_matches = 0
+        best_fact = ""
+        for fact, fact_lower in zip(entity.facts, entity.facts_lower):
+            matching_words = sum(1 for w in claim_words if w in fact_lower)
+            if matching_words > fact_matches:
+                fact_matches = matching_words
+                best_fact = fact
+    
+        if fact_matches >= 3:
+            return FactCheck(
+                claim=claim,
+                verdict="confirmed",
+                confidence=min(1.0, 0.5 + fact_matches * 0.1),
+                source=entity_name,
+                evidence=best_fact,
+            )
     
-    # Check timeline for event confirmation
-    timeline_matches = 0
-    for line in entity_content.split("\n"):
-        if line.strip().startswith("- "):
-            line_lower = line.lower()
+        # Check timeline for event confirmation
+        timeline_matches = 0
+        for line, line_lower in zip(entity.bullet_lines, entity.bullet_lines_lower):
             matching = sum(1 for w in claim_words if w in line_lower)
             if matching >= 2:
                 timeline_matches += 1
-                best_fact = line.strip().lstrip("- ")
-    
-    if timeline_matches > 0:
-        return FactCheck(
-            claim=claim,
-            verdict="confirmed",
-            confidence=0.6,
-            source=entity_name,
-            evidence=best_fact,
-        )
+                best_fact = line.lstrip("- ")
+    
+        if timeline_matches > 0:
+            return FactCheck(
+                claim=claim,
+                verdict="confirmed",
+                confidence=0.6,
+                source=entity_name,
+                evidence=best_fact,
+            )
     
     # Check for contradiction (claim says X, entity says not-X)
     # Simple pattern: "is not" vs "is", type mismatches
@@ -352,7 +463,7 @@ def _check_claim_against_entity(claim: str, entity_name: str,
                 )
     
     # No match found — claim mentions entity but contains new info
-    if entity_name.lower() in claim_lower:
+    if entity.name_lower in claim_lower:
         return FactCheck(
             claim=claim,
             verdict="new",
@@ -379,56 +490,54 @@ def write_back(
     Only writes facts above the confidence threshold.
     Returns list of actions taken.
     """
+    from .core import sanitize_filename
+    from .fix import insert_facts
+    
     actions = []
     
+    # Group by entity so each file is read and written once
+    grouped: dict[str, list[NewFact]] = {}
     for nf in result.new_facts:
-        if nf.confidence < min_confidence:
-            continue
-        
-        from .core import sanitize_filename
-        filepath = config.entities_dir / f"{sanitize_filename(nf.entity_name)}.md"
+        if nf.confidence >= min_confidence:
+            grouped.setdefault(nf.entity_name, []).append(nf)
+    
+    for entity_name, new_facts in grouped.items():
+        filepath = config.entities_dir / f"{sanitize_filename(entity_name)}.md"
         
         if not filepath.exists():
-            actions.append(f"SKIP: {nf.entity_name} — entity file not found")
+            actions.append(f"SKIP: {entity_name} — entity file not found")
             continue
         
         content = filepath.read_text()
+        content_lower = content.lower()
+        to_add = []
         
-        # Don't duplicate
-        if nf.fact.lower() in content.lower():
-            actions.append(f"SKIP: {nf.entity_name} — fact already exists")
-            continue
-        
-        if dry_run:
-            actions.append(f"WOULD ADD to {nf.entity_name}: {nf.fact}")
-            continue
-        
-        # Add to facts section
-        if "## Facts" in content:
-            content = content.replace(
-                "## Facts\n",
-                f"## Facts\n- {nf.fact} (auto-evaluated, conf: {nf.confidence:.2f})\n",
-                1
-            )
-        else:
-            if "## Timeline" in content:
-                content = content.replace(
-                    "## Timeline",
-                    f"## Facts\n- {nf.fact} (auto-evaluated, conf: {nf.confidence:.2f})\n\n## Timeline"
-                )
+        for nf in new_facts:
+            # Don't duplicate
+            if nf.fact.lower() in content_lower:
+                actions.append(f"SKIP: {entity_name} — fact already exists")
+                continue
+            
+            if dry_run:
+                actions.append(f"WOULD ADD to {entity_name}: {nf.fact}")
+                continue
+            
+            to_add.append(f"{nf.fact} (auto-evaluated, conf: {nf.confidence:.2f})")
+            content_lower += "\n" + nf.fact.lower()
+            actions.append(f"ADDED to {entity_name}: {nf.fact}")
         
-        safe_write(filepath, content)
-        actions.append(f"ADDED to {nf.entity_name}: {nf.fact}")
+        if to_add:
+            safe_write(filepath, insert_facts(content, to_add))
     
     # Log evaluation
     log_file = config.memory_dir / "evaluations.jsonl"
-    log_entry = json.dumps({
+    log_entry = fastjson.dumps_bytes({
         "evaluated_at": result.evaluated_at,
         "overall_confidence": result.overall_confidence,
         "confirmed": len(result.confirmed),
         "contradicted": len(result.contradicted),
-        "new_facts_written": len([a for a in actions if a.startswith("ADDED")]),
+        "new_facts_written": sum(1 for a in actions if a.startswith("ADDED")),
     })
-    safe_append(log_file, log_entry + "\n")
+    atomic_append(log_file, log_entry + b"\n")
     
     return actions
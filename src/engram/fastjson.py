@@ -0,0 +1,44 @@
+"""
+JSON helpers that use orjson when it's installed.
+
+orjson is an optional speedup (`pip install mindgardener[fast]`). Without it
+everything falls back to the stdlib json module with identical semantics for
+the plain dicts/lists we store in JSONL files. The fallback also matches
+orjson's output: compact separators and unescaped UTF-8.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching the stdlib exception either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+_COMPACT = dict(ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a compact single-line JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, **_COMPACT)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, ready for os.write()."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, **_COMPACT).encode()
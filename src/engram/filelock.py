@@ -62,9 +62,73 @@ def safe_append(path: Path, content: str):
             f.write(content)
 
 
+def write_locked(fd: int, data: bytes):
+    """Write all of data to an O_APPEND fd under an exclusive flock on it.
+    
+    Every append takes the lock, whatever its size: POSIX only promises
+    atomic writes for pipes, so an unlocked append to a regular file could
+    land between the chunks of another writer's partial writes.
+    """
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def atomic_append(path: Path, data: bytes, durable: bool = False):
+    """Append raw bytes as one run that concurrent appenders can't split.
+    
+    Locks the file itself (see write_locked) rather than a side .lock
+    file, so there is nothing to create or clean up. The file is opened
+    per call, so a rotated or replaced file is picked up on the next
+    append. Pass durable=True to fdatasync before returning.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        write_locked(fd, data)
+        if durable:
+            os.fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_append_line(path: Path, line: str):
+    """Append a single line (see atomic_append)."""
+    atomic_append(path, (line if line.endswith('\n') else line + '\n').encode())
+
+
 def safe_write(path: Path, content: str):
     """Write to a file atomically (write to temp, rename)."""
     tmp_path = path.with_suffix('.tmp')
     with file_lock(path):
         tmp_path.write_text(content)
         tmp_path.rename(path)
+
+
+def safe_write_bytes(path: Path, data: bytes):
+    """Bytes counterpart of safe_write()."""
+    tmp_path = path.with_suffix('.tmp')
+    with file_lock(path):
+        tmp_path.write_bytes(data)
+        tmp_path.rename(path)
+
+
+@contextmanager
+def safe_write_stream(path: Path):
+    """Binary file handle whose contents replace path atomically on exit.
+    
+    Streaming counterpart of safe_write_bytes(): the temp file is renamed
+    over path only if the block completes, and removed otherwise.
+    """
+    tmp_path = path.with_suffix('.tmp')
+    with file_lock(path):
+        try:
+            with open(tmp_path, 'wb') as f:
+                yield f
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
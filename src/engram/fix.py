@@ -15,6 +15,8 @@ from pathlib import Path
 
 from .filelock import safe_write
 
+_TYPE_FIELD = re.compile(r'\*\*Type:\*\*\s*\w+')
+
 
 def fix_type(entities_dir: Path, entity_name: str, new_type: str) -> str:
     """Change an entity's type."""
@@ -33,7 +35,7 @@ def fix_type(entities_dir: Path, entity_name: str, new_type: str) -> str:
             return f"Entity '{entity_name}' not found"
     
     content = filepath.read_text()
-    old = re.search(r'\*\*Type:\*\*\s*\w+', content)
+    old = _TYPE_FIELD.search(content)
     if old:
         content = content.replace(old.group(), f"**Type:** {new_type}")
         safe_write(filepath, content)
@@ -65,6 +67,22 @@ def fix_name(entities_dir: Path, old_name: str, new_name: str) -> str:
     return f"Renamed: {old_name} → {new_name}"
 
 
+def insert_facts(content: str, facts: list[str]) -> str:
+    """Insert fact bullets at the top of the Facts section in one splice.
+    
+    Creates the section before Timeline (or at the end) if it's missing.
+    """
+    block = "".join(f"- {fact}\n" for fact in facts)
+    idx = content.find("## Facts\n")
+    if idx != -1:
+        idx += len("## Facts\n")
+        return content[:idx] + block + content[idx:]
+    idx = content.find("## Timeline")
+    if idx != -1:
+        return content[:idx] + "## Facts\n" + block + "\n" + content[idx:]
+    return content + "\n## Facts\n" + block
+
+
 def add_fact(entities_dir: Path, entity_name: str, fact: str) -> str:
     """Add a fact to an entity."""
     from .core import sanitize_filename
@@ -85,14 +103,7 @@ def add_fact(entities_dir: Path, entity_name: str, fact: str) -> str:
     if fact in content:
         return f"Fact already exists in {filepath.stem}"
     
-    if "## Facts" in content:
-        content = content.replace("## Facts\n", f"## Facts\n- {fact}\n", 1)
-    else:
-        # Add Facts section before Timeline
-        if "## Timeline" in content:
-            content = content.replace("## Timeline", f"## Facts\n- {fact}\n\n## Timeline")
-        else:
-            content += f"\n## Facts\n- {fact}\n"
+    content = insert_facts(content, [fact])
     
     safe_write(filepath, content)
     return f"Added fact to {filepath.stem}: {fact}"
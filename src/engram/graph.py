@@ -0,0 +1,91 @@
+"""Graph adjacency — graph.jsonl neighbours in compressed sparse row form.
+
+A dict of sets per entity costs a hash table per node. The adjacency here
+keeps every node's neighbours in two flat int arrays instead:
+
+    names    node id -> lowercased entity name (interned)
+    indptr   N+1 offsets; node i's neighbours are indices[indptr[i]:indptr[i+1]]
+    indices  neighbour ids, sorted and unique within each row
+
+Edges are undirected: each triplet links its subject and object both ways.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from pathlib import Path
+
+from . import fastjson
+
+
+class Adjacency:
+    """Read-only undirected adjacency over lowercased entity names."""
+
+    def __init__(self, names: list[str], indptr: array, indices: array):
+        self.names = names
+        self.indptr = indptr
+        self.indices = indices
+        self.ids = {name: i for i, name in enumerate(names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def neighbors(self, i: int) -> array:
+        """Sorted neighbour ids of node i."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def degree(self, i: int) -> int:
+        return self.indptr[i + 1] - self.indptr[i]
+
+    def shared_neighbor_counts(self, nodes: set[int]) -> dict[tuple[int, int], int]:
+        """Count common neighbours for every pair (a, b), a < b, drawn from `nodes`.
+
+        Walks each node's neighbour list once, so pairs with nothing in
+        common are never visited.
+        """
+        counts: dict[tuple[int, int], int] = {}
+        indptr, indices = self.indptr, self.indices
+        for v in range(len(self.names)):
+            row = [n for n in indices[indptr[v]:indptr[v + 1]] if n in nodes]
+            for j, a in enumerate(row):
+                for b in row[j + 1:]:
+                    counts[a, b] = counts.get((a, b), 0) + 1
+        return counts
+
+
+def load_adjacency(graph_file: Path) -> Adjacency:
+    """Build the adjacency from graph.jsonl, skipping malformed lines."""
+    ids: dict[str, int] = {}
+    names: list[str] = []
+    edges: set[tuple[int, int]] = set()
+
+    def node(name: str) -> int:
+        i = ids.get(name)
+        if i is None:
+            i = ids[name] = len(names)
+            names.append(sys.intern(name))
+        return i
+
+    # Streamed line by line: only one triplet is decoded at a time
+    with open(graph_file, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                t = fastjson.loads(line)
+                s = node(t.get("subject", "").lower())
+                o = node(t.get("object", "").lower())
+            except Exception:
+                continue
+            edges.add((s, o))
+            edges.add((o, s))
+
+    indptr = array("i", [0] * (len(names) + 1))
+    indices = array("i")
+    for s, o in sorted(edges):
+        indices.append(o)
+        indptr[s + 1] += 1
+    for i in range(len(names)):
+        indptr[i + 1] += indptr[i]
+    return Adjacency(names, indptr, indices)
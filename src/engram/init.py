@@ -19,7 +19,7 @@ DEFAULT_CONFIG = """# MindGardener Configuration
 workspace: .
 
 # LLM Provider: gemini | openai | anthropic | ollama | compatible
-provider: gemini
+provider: {provider}
 
 # Model to use for extraction
 # gemini: gemini-2.0-flash (default, cheapest)
@@ -92,53 +92,59 @@ def init_workspace(path: Path | None = None, provider: str = "gemini",
     
     actions = []
     
+    # One makedirs for memory/ + memory/entities/, then one directory listing
+    # each for the workspace root and memory/ instead of a stat per file.
+    memory_dir = path / "memory"
+    entities_dir = memory_dir / "entities"
+    os.makedirs(entities_dir, exist_ok=True)
+    with os.scandir(path) as it:
+        existing_top = {e.name for e in it}
+    with os.scandir(memory_dir) as it:
+        existing_memory = {e.name for e in it}
+    
     # Config file
     config_path = path / "garden.yaml"
-    if config_path.exists() and not force:
+    if "garden.yaml" in existing_top and not force:
         actions.append(f"⏭️  garden.yaml already exists (use --force to overwrite)")
     else:
-        config = DEFAULT_CONFIG.replace("provider: gemini", f"provider: {provider}")
+        config = DEFAULT_CONFIG.format(provider=provider)
         config_path.write_text(config)
         actions.append(f"✅ Created garden.yaml (provider: {provider})")
     
-    # Memory directory
-    memory_dir = path / "memory"
-    memory_dir.mkdir(exist_ok=True)
+    # Memory + entities directories
     actions.append(f"✅ Created memory/")
-    
-    # Entities directory
-    entities_dir = memory_dir / "entities"
-    entities_dir.mkdir(exist_ok=True)
     actions.append(f"✅ Created memory/entities/")
     
     # Sample daily log
     today = date.today().isoformat()
     daily_path = memory_dir / f"{today}.md"
-    if not daily_path.exists():
-        daily_path.write_text(SAMPLE_DAILY.replace("{date}", today))
+    if f"{today}.md" not in existing_memory:
+        daily_path.write_text(SAMPLE_DAILY.format(date=today))
         actions.append(f"✅ Created memory/{today}.md (sample daily log)")
     else:
         actions.append(f"⏭️  memory/{today}.md already exists")
     
     # MEMORY.md
     memory_file = path / "MEMORY.md"
-    if not memory_file.exists():
+    if "MEMORY.md" not in existing_top:
         memory_file.write_text(SAMPLE_MEMORY)
         actions.append(f"✅ Created MEMORY.md (long-term memory)")
     else:
         actions.append(f"⏭️  MEMORY.md already exists")
     
-    # .gitignore for lock files
+    # .gitignore for lock files and the caches reindex rebuilds
+    # (entities.* is the packed entity corpus, a full copy of entities/)
     gitignore = path / ".gitignore"
-    ignore_entries = ["*.lock", "*.tmp", "__pycache__/"]
-    if gitignore.exists():
+    ignore_entries = [
+        "*.lock", "*.tmp", "__pycache__/",
+        "entities.names", "entities.offsets", "entities.dat", "graph.idx.json",
+    ]
+    if ".gitignore" in existing_top:
         existing = gitignore.read_text()
         new_entries = [e for e in ignore_entries if e not in existing]
         if new_entries:
             with open(gitignore, "a") as f:
-                f.write("\n# MindGardener\n")
-                for e in new_entries:
-                    f.write(f"{e}\n")
+                f.write("\n# MindGardener\n" + "\n".join(new_entries) + "\n")
             actions.append(f"✅ Updated .gitignore")
     else:
         gitignore.write_text("# MindGardener\n" + "\n".join(ignore_entries) + "\n")
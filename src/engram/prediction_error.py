@@ -26,16 +26,23 @@ Reference: Complementary Learning Systems theory (McClelland et al., 1995)
 
 from __future__ import annotations
 
+import asyncio
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import re
+import string
+from dataclasses import dataclass, field
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from . import fastjson
+from .filelock import atomic_append
 from .providers import LLMProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionErrorEvent:
     """A single event with its prediction error score."""
     event: str
@@ -52,14 +59,39 @@ class PredictionErrorEvent:
         return self.prediction_error >= threshold
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Hand-written rather than asdict(): no recursive deep copy per event
+        return {
+            "event": self.event,
+            "prediction_error": self.prediction_error,
+            "predicted": self.predicted,
+            "reason": self.reason,
+            "category": self.category,
+            "entities": list(self.entities),
+            "date": self.date,
+            "timestamp": self.timestamp,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "PredictionErrorEvent":
-        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        # Fixed-field unpack: unknown keys are ignored, missing ones defaulted
+        return cls(
+            event=d.get("event", ""),
+            prediction_error=d.get("prediction_error", 0.5),
+            predicted=d.get("predicted"),
+            reason=d.get("reason", ""),
+            category=d.get("category", "unknown"),
+            entities=d.get("entities") or [],
+            date=d.get("date", ""),
+            timestamp=d.get("timestamp", ""),
+        )
+
 
+# Surprise bands: high is PE > HIGH_SURPRISE, medium is MEDIUM_SURPRISE..HIGH_SURPRISE
+HIGH_SURPRISE = 0.7
+MEDIUM_SURPRISE = 0.4
 
-@dataclass
+
+@dataclass(slots=True)
 class PredictionResult:
     """Full result of a prediction error cycle."""
     date: str
@@ -68,15 +100,35 @@ class PredictionResult:
     errors: list[PredictionErrorEvent]  # Events with their PE scores
     model_updates: list[str] = field(default_factory=list)  # Suggested MEMORY.md updates
 
+    def surprise_buckets(self) -> tuple[list[PredictionErrorEvent], list[PredictionErrorEvent], float]:
+        """(high, medium, mean) in a single pass over the events.
+        
+        Prefer this over the individual properties when you need more than one.
+        """
+        high = []
+        medium = []
+        total = 0.0
+        for e in self.errors:
+            pe = e.prediction_error
+            total += pe
+            if pe > HIGH_SURPRISE:
+                high.append(e)
+            elif pe >= MEDIUM_SURPRISE:
+                medium.append(e)
+        mean = total / len(self.errors) if self.errors else 0.0
+        return high, medium, mean
+
+    # Each property computes only its own part in one comprehension
+
     @property
     def high_surprise(self) -> list[PredictionErrorEvent]:
         """Events with PE > 0.7 — genuinely novel."""
-        return [e for e in self.errors if e.prediction_error > 0.7]
+        return [e for e in self.errors if e.prediction_error > HIGH_SURPRISE]
 
     @property
     def medium_surprise(self) -> list[PredictionErrorEvent]:
         """Events with PE 0.4-0.7 — noteworthy."""
-        return [e for e in self.errors if 0.4 <= e.prediction_error <= 0.7]
+        return [e for e in self.errors if MEDIUM_SURPRISE <= e.prediction_error <= HIGH_SURPRISE]
 
     @property
     def mean_surprise(self) -> float:
@@ -155,6 +207,67 @@ WHAT ACTUALLY HAPPENED ({date}):
 {actual}
 """
 
+# Used when Stage 1 produced no predictions (e.g. empty MEMORY.md on first run):
+# there is nothing to compare against, so score novelty directly.
+COLD_START_PROMPT = """You are computing prediction errors for a memory consolidation system.
+
+The agent had no predictions for {date} (its world model is empty or new).
+Score each meaningful event by how novel it is:
+- prediction_error: 0.0 = routine, 1.0 = completely new information
+- category: one of [entity_change, new_relationship, status_shift, external_event, routine, skill_gain]
+- entities: list of entity names involved
+
+Output ONLY valid JSON:
+{{
+  "errors": [
+    {{"event": "what happened", "prediction_error": 0.0-1.0, "predicted": null, "reason": "why", "category": "category", "entities": ["Entity1"]}}
+  ],
+  "model_updates": ["Fact worth adding to MEMORY.md"]
+}}
+
+Skip trivial routine events (heartbeats, status checks).
+
+WHAT HAPPENED ({date}):
+{actual}
+"""
+
+
+# Resolved on first use — small logs never need the chunker
+_pre_filter = None
+
+
+def _get_pre_filter():
+    global _pre_filter
+    if _pre_filter is None:
+        from .chunker import pre_filter
+        _pre_filter = pre_filter
+    return _pre_filter
+
+
+def _compile_prompt(fmt: str) -> string.Template:
+    """Turn a str.format prompt into a string.Template, parsed once at import."""
+    text = re.sub(r'(?<!\{)\{(\w+)\}(?!\})', r'${\1}', fmt)
+    return string.Template(text.replace("{{", "{").replace("}}", "}"))
+
+
+_PREDICT_TPL = _compile_prompt(PREDICT_PROMPT)
+_COMPARE_TPL = _compile_prompt(COMPARE_PROMPT)
+_COLD_START_TPL = _compile_prompt(COLD_START_PROMPT)
+
+
+@lru_cache(maxsize=8)
+def _render_predict(date: str, memory: str, entities: str) -> str:
+    return _PREDICT_TPL.substitute(date=date, memory=memory, entities=entities)
+
+
+@lru_cache(maxsize=8)
+def _render_compare(date: str, predictions: str, actual: str) -> str:
+    return _COMPARE_TPL.substitute(date=date, predictions=predictions, actual=actual)
+
+
+def _build_cold_start_prompt(date: str, actual: str) -> str:
+    return _COLD_START_TPL.substitute(date=date, actual=actual)
+
 
 class PredictionErrorEngine:
     """Two-stage prediction error computation for memory consolidation."""
@@ -165,45 +278,82 @@ class PredictionErrorEngine:
         self.memory_file = memory_file
         self.entities_dir = memory_dir / "entities"
         self.scores_file = memory_dir / "prediction-errors.jsonl"
+        # mtime_ns-validated read caches, so repeated cycles skip unchanged files
+        self._mem_cache: Optional[tuple[tuple[int, int], str]] = None
+        self._entity_cache: dict[str, tuple[int, str]] = {}
 
     def _read_memory(self, max_chars: int = 4000) -> str:
-        """Read the agent's world model."""
-        if self.memory_file.exists():
-            return self.memory_file.read_text()[:max_chars]
-        return "(empty world model)"
+        """Read the agent's world model (cached until MEMORY.md changes)."""
+        try:
+            mtime = self.memory_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return "(empty world model)"
+        key = (mtime, max_chars)
+        if self._mem_cache is not None and self._mem_cache[0] == key:
+            return self._mem_cache[1]
+        text = self.memory_file.read_text()[:max_chars]
+        self._mem_cache = (key, text)
+        return text
+
+    def _read_entity(self, path: str, mtime: int) -> str:
+        """Read one entity file, reusing the cached text if its mtime is unchanged."""
+        cached = self._entity_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, "rb") as f:
+            content = f.read().decode()
+        self._entity_cache[path] = (mtime, content)
+        return content
 
     def _read_entities(self, max_chars: int = 2000) -> str:
         """Read recent entity context."""
-        if not self.entities_dir.exists():
+        try:
+            with os.scandir(self.entities_dir) as it:
+                entries = sorted(
+                    (e.name, e.path, e.stat().st_mtime_ns)
+                    for e in it if e.name.endswith(".md") and e.is_file()
+                )
+        except FileNotFoundError:
             return "(no entities)"
         
-        entity_text = ""
-        for f in sorted(self.entities_dir.glob("*.md")):
-            content = f.read_text()
-            if len(entity_text) + len(content) > max_chars:
+        parts: list[str] = []
+        used = 0
+        for name, path, mtime in entries:
+            content = self._read_entity(path, mtime)
+            if used + len(content) > max_chars:
                 break
-            entity_text += f"### {f.stem}\n{content[:500]}\n\n"
-        return entity_text or "(no entities)"
+            part = f"### {name[:-3]}\n{content[:500]}\n\n"
+            parts.append(part)
+            used += len(part)
+        return "".join(parts) or "(no entities)"
+
+    # Upper bound on bytes read from a daily log before pre-filtering,
+    # relative to max_chars. Anything past this would be truncated anyway.
+    DAILY_LOG_READ_FACTOR = 8
 
     def _read_daily_log(self, date_str: str, max_chars: int = 6000) -> str:
-        """Read the daily log for a given date, with pre-filtering for large files."""
+        """Read the daily log for a given date, with pre-filtering for large files.
+        
+        Only the first max_chars * DAILY_LOG_READ_FACTOR bytes are read, so
+        multi-MB transcripts aren't loaded and decoded in full.
+        """
         path = self.memory_dir / f"{date_str}.md"
-        if not path.exists():
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
             return ""
-        
-        content = path.read_text()
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            raw = f.read(max_chars * self.DAILY_LOG_READ_FACTOR)
+        content = raw.decode("utf-8", errors="ignore")
         
         # For large files, pre-filter to remove noise
         if len(content) > max_chars:
-            try:
-                from .chunker import pre_filter
-                content = pre_filter(content)
-            except ImportError:
-                pass
+            content = _get_pre_filter()(content)
         
         # Still too long? Truncate with note
         if len(content) > max_chars:
-            content = content[:max_chars] + "\n\n[... truncated, full log was {len(content)} chars]"
+            content = content[:max_chars] + f"\n\n[... truncated, full log was {size} bytes]"
         
         return content
 
@@ -214,37 +364,56 @@ class PredictionErrorEngine:
         Stage 1: Generate predictions from world model (BEFORE seeing log)
         Stage 2: Compare predictions against actual log
         
+        If Stage 1 returns no predictions (cold start, empty world model),
+        Stage 2 uses a shorter single-stage prompt that scores events for
+        novelty instead of comparing against an empty prediction list.
+        
         For large daily logs, pre-filters noise before sending to LLM.
         """
         if date_str is None:
             date_str = date.today().isoformat()
 
-        daily_log = self._read_daily_log(date_str)
-        if not daily_log:
+        # A missing or empty log never reaches the LLM
+        try:
+            if os.stat(self.memory_dir / f"{date_str}.md").st_size == 0:
+                return PredictionResult(date=date_str, predictions=[], actual_events=[], errors=[])
+        except FileNotFoundError:
             return PredictionResult(date=date_str, predictions=[], actual_events=[], errors=[])
 
-        memory = self._read_memory()
-        entities = self._read_entities()
+        # Read + pre-filter the log in a worker thread while the world model
+        # is loaded. It has to finish before Stage 1: a request already handed
+        # to the provider's worker thread can't be recalled, so a log that
+        # pre-filters to nothing must be caught before anything is sent.
+        log_task = asyncio.ensure_future(asyncio.to_thread(self._read_daily_log, date_str))
+        try:
+            memory = self._read_memory()
+            entities = self._read_entities()
+        except BaseException:
+            log_task.cancel()
+            raise
+        daily_log = await log_task
+        if not daily_log:
+            return PredictionResult(date=date_str, predictions=[], actual_events=[], errors=[])
 
         # === STAGE 1: PREDICT (without seeing the log) ===
-        predict_prompt = PREDICT_PROMPT.format(
-            date=date_str,
-            memory=memory,
-            entities=entities
-        )
+        predict_prompt = _render_predict(date_str, memory, entities)
         predictions_raw = await self.llm.generate_json(predict_prompt)
         predictions = predictions_raw.get("predictions", [])
         prediction_texts = [p.get("event", "") for p in predictions]
 
         # === STAGE 2: COMPARE (now we look at reality) ===
-        compare_prompt = COMPARE_PROMPT.format(
-            date=date_str,
-            predictions=json.dumps(predictions, indent=2),
-            actual=daily_log
-        )
-        comparison = await self.llm.generate_json(compare_prompt)
+        if not predictions:
+            comparison = await self.llm.generate_json(
+                _build_cold_start_prompt(date_str, daily_log)
+            )
+        else:
+            compare_prompt = _render_compare(
+                date_str, json.dumps(predictions, indent=2), daily_log
+            )
+            comparison = await self.llm.generate_json(compare_prompt)
 
-        # Build result
+        # Build result; the whole batch shares one timestamp
+        now = datetime.now().isoformat()
         errors = []
         for e in comparison.get("errors", []):
             pe = PredictionErrorEvent(
@@ -255,7 +424,7 @@ class PredictionErrorEngine:
                 category=e.get("category", "unknown"),
                 entities=e.get("entities", []),
                 date=date_str,
-                timestamp=datetime.now().isoformat()
+                timestamp=now
             )
             errors.append(pe)
 
@@ -274,14 +443,19 @@ class PredictionErrorEngine:
 
     def compute_sync(self, date_str: str | None = None) -> PredictionResult:
         """Synchronous wrapper for compute()."""
-        import asyncio
         return asyncio.run(self.compute(date_str))
 
-    def _save_scores(self, errors: list[PredictionErrorEvent]):
-        """Append prediction error scores to JSONL file."""
-        with open(self.scores_file, "a") as f:
-            for e in errors:
-                f.write(json.dumps(e.to_dict()) + "\n")
+    def _save_scores(self, errors: list[PredictionErrorEvent], durable: bool = False):
+        """Append prediction error scores to JSONL file.
+        
+        The whole batch goes out as one locked O_APPEND write (see
+        filelock.atomic_append), so concurrent engines can't interleave
+        lines. Pass durable=True to fdatasync before returning.
+        """
+        if not errors:
+            return
+        payload = b"".join(fastjson.dumps_bytes(e.to_dict()) + b"\n" for e in errors)
+        atomic_append(self.scores_file, payload, durable=durable)
 
     def load_history(self, days: int = 30) -> list[PredictionErrorEvent]:
         """Load historical prediction error scores."""
@@ -289,12 +463,16 @@ class PredictionErrorEngine:
             return []
         
         events = []
-        for line in self.scores_file.read_text().strip().split('\n'):
-            if line:
+        with open(self.scores_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
                 try:
-                    events.append(PredictionErrorEvent.from_dict(json.loads(line)))
-                except:
-                    pass
+                    d = fastjson.loads(line)
+                    if isinstance(d, dict):  # Valid JSON but not a record: skip
+                        events.append(PredictionErrorEvent.from_dict(d))
+                except (ValueError, TypeError):
+                    pass  # Skip corrupt or incompatible lines
         return events
 
     def learning_rate(self, days: int = 7) -> float:
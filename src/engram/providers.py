@@ -1,21 +1,99 @@
 """LLM provider abstraction — Google, OpenAI, Anthropic."""
 
+import asyncio
+import http.client
+import io
 import json
 import os
 import re
-import urllib.request
+import threading
+import urllib.error
+from collections import OrderedDict
 from typing import Optional
+from urllib.parse import urlsplit
+
+from . import fastjson
+
+
+_POOL_LOCK = threading.Lock()
+_CACHE_LOCK = threading.Lock()
 
 
 class LLMProvider:
     """Base class for LLM providers."""
     
+    # Idle keep-alive connections keyed by (scheme, host:port), created
+    # lazily per instance so back-to-back calls (e.g. PE predict → compare)
+    # reuse one TCP/TLS session. A connection is checked out for the length
+    # of a request, so concurrent calls from worker threads each get their own.
+    _idle: Optional[dict] = None
+    
+    # Environment variable the API key falls back to when none is passed
+    API_KEY_ENV: Optional[str] = None
+    
+    def _post_json(self, url: str, body: dict, headers: dict, timeout: float = 120) -> dict:
+        """POST a JSON body over a pooled connection and decode the JSON reply.
+        
+        HTTP error statuses raise urllib.error.HTTPError, matching what
+        urlopen() used to raise so retry logic keeps working.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        payload = fastjson.dumps_bytes(body)
+        
+        while True:
+            with _POOL_LOCK:
+                if self._idle is None:
+                    self._idle = {}
+                idle = self._idle.setdefault(key, [])
+                conn = idle.pop() if idle else None
+            fresh = conn is None
+            if fresh:
+                conn_cls = (http.client.HTTPSConnection if parts.scheme == "https"
+                            else http.client.HTTPConnection)
+                conn = conn_cls(parts.netloc, timeout=timeout)
+            try:
+                conn.request("POST", path, body=payload, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, ConnectionError):
+                conn.close()
+                if fresh:
+                    raise
+                continue  # Server dropped the idle keep-alive socket; reconnect
+            except BaseException:
+                conn.close()
+                raise
+            break
+        
+        with _POOL_LOCK:
+            if self._idle is None:  # close() ran while this request was out
+                self._idle = {}
+            self._idle.setdefault(key, []).append(conn)
+        
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        return fastjson.loads(data)
+    
+    def close(self):
+        """Close any pooled connections."""
+        with _POOL_LOCK:
+            idle, self._idle = self._idle or {}, None
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+    
     def generate(self, prompt: str, json_mode: bool = True) -> Optional[dict | str]:
         raise NotImplementedError
 
     async def generate_json(self, prompt: str) -> dict:
-        """Async JSON generation (used by PE engine)."""
-        return self.generate(prompt, json_mode=True) or {}
+        """Async JSON generation (used by PE engine).
+        
+        The blocking HTTP call runs in a worker thread so the event loop
+        stays free for other work (e.g. reading the daily log).
+        """
+        return await asyncio.to_thread(self.generate, prompt, True) or {}
 
     def generate_json_sync(self, prompt: str) -> dict:
         """Sync JSON generation (used by PE engine)."""
@@ -25,6 +103,7 @@ class LLMProvider:
 class GoogleProvider(LLMProvider):
     """Google Gemini API."""
     
+    API_KEY_ENV = "GEMINI_API_KEY"
     MODELS = {
         "gemini-2.0-flash": "gemini-2.0-flash",
         "gemini-flash": "gemini-2.0-flash",
@@ -32,31 +111,25 @@ class GoogleProvider(LLMProvider):
     }
     
     def __init__(self, api_key: str = "", model: str = "gemini-2.0-flash", temperature: float = 0.1):
-        self.api_key = api_key or os.environ.get("GEMINI_API_KEY", "")
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV, "")
         self.model = self.MODELS.get(model, model)
         self.temperature = temperature
+        self._url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
+        self._headers = {"Content-Type": "application/json"}
+        self._gen_config = {"temperature": temperature}
+        self._gen_config_json = {**self._gen_config, "responseMimeType": "application/json"}
     
     def generate(self, prompt: str, json_mode: bool = True) -> Optional[dict | str]:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not set")
         
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
-        
-        gen_config = {"temperature": self.temperature}
-        if json_mode:
-            gen_config["responseMimeType"] = "application/json"
-        
-        payload = json.dumps({
+        body = {
             "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": gen_config,
-        })
-        
-        req = urllib.request.Request(url, data=payload.encode(),
-                                    headers={"Content-Type": "application/json"})
+            "generationConfig": self._gen_config_json if json_mode else self._gen_config,
+        }
         
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            data = json.loads(resp.read())
-            text = data["candidates"][0]["content"]["parts"][0]["text"]
+        data = self._post_json(self._url, body, self._headers)
+        text = data["candidates"][0]["content"]["parts"][0]["text"]
         
         if json_mode:
             return _parse_json(text)
@@ -66,19 +139,24 @@ class GoogleProvider(LLMProvider):
 class OpenAIProvider(LLMProvider):
     """OpenAI-compatible API (works with any compatible endpoint)."""
     
+    API_KEY_ENV = "OPENAI_API_KEY"
+    
     def __init__(self, api_key: str = "", model: str = "gpt-4o-mini", 
                  temperature: float = 0.1, base_url: str = "https://api.openai.com/v1"):
-        self.api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV, "")
         self.model = model
         self.temperature = temperature
         self.base_url = base_url
+        self._url = f"{base_url}/chat/completions"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
     
     def generate(self, prompt: str, json_mode: bool = True) -> Optional[dict | str]:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not set")
         
-        url = f"{self.base_url}/chat/completions"
-        
         body: dict = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
@@ -87,17 +165,8 @@ class OpenAIProvider(LLMProvider):
         if json_mode:
             body["response_format"] = {"type": "json_object"}
         
-        req = urllib.request.Request(
-            url, data=json.dumps(body).encode(),
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            }
-        )
-        
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            data = json.loads(resp.read())
-            text = data["choices"][0]["message"]["content"]
+        data = self._post_json(self._url, body, self._headers)
+        text = data["choices"][0]["message"]["content"]
         
         if json_mode:
             return _parse_json(text)
@@ -107,18 +176,24 @@ class OpenAIProvider(LLMProvider):
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude API."""
     
+    API_KEY_ENV = "ANTHROPIC_API_KEY"
+    
     def __init__(self, api_key: str = "", model: str = "claude-sonnet-4-20250514",
                  temperature: float = 0.1):
-        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV, "")
         self.model = model
         self.temperature = temperature
+        self._url = "https://api.anthropic.com/v1/messages"
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+        }
     
     def generate(self, prompt: str, json_mode: bool = True) -> Optional[dict | str]:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
         
-        url = "https://api.anthropic.com/v1/messages"
-        
         system = ""
         if json_mode:
             system = "You MUST respond with valid JSON only. No markdown fences, no explanation."
@@ -132,18 +207,8 @@ class AnthropicProvider(LLMProvider):
         if system:
             body["system"] = system
         
-        req = urllib.request.Request(
-            url, data=json.dumps(body).encode(),
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-            }
-        )
-        
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            data = json.loads(resp.read())
-            text = data["content"][0]["text"]
+        data = self._post_json(self._url, body, self._headers)
+        text = data["content"][0]["text"]
         
         if json_mode:
             return _parse_json(text)
@@ -171,14 +236,8 @@ class OllamaProvider(LLMProvider):
         if json_mode:
             body["format"] = "json"
         
-        req = urllib.request.Request(
-            url, data=json.dumps(body).encode(),
-            headers={"Content-Type": "application/json"}
-        )
-        
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            data = json.loads(resp.read())
-            text = data.get("response", "")
+        data = self._post_json(url, body, {"Content-Type": "application/json"}, timeout=300)
+        text = data.get("response", "")
         
         if json_mode:
             return _parse_json(text)
@@ -188,10 +247,12 @@ class OllamaProvider(LLMProvider):
 class OpenAICompatibleProvider(LLMProvider):
     """Any OpenAI-compatible API — LM Studio, vLLM, Together, Groq, etc."""
     
+    API_KEY_ENV = "LLM_API_KEY"
+    
     def __init__(self, api_key: str = "", model: str = "default",
                  temperature: float = 0.1, base_url: str = "http://localhost:1234/v1",
                  **kwargs):
-        self.api_key = api_key or os.environ.get("LLM_API_KEY", "")
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV, "")
         self.model = model
         self.temperature = temperature
         self.base_url = base_url.rstrip("/")
@@ -211,52 +272,88 @@ class OpenAICompatibleProvider(LLMProvider):
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         
-        req = urllib.request.Request(url, data=json.dumps(body).encode(), headers=headers)
-        
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            data = json.loads(resp.read())
-            text = data["choices"][0]["message"]["content"]
+        data = self._post_json(url, body, headers, timeout=300)
+        text = data["choices"][0]["message"]["content"]
         
         if json_mode:
             return _parse_json(text)
         return text
 
 
+_PROVIDERS = {
+    "google": GoogleProvider,
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+    "ollama": OllamaProvider,
+    "compatible": OpenAICompatibleProvider,  # Any OpenAI-compatible API
+    "lmstudio": OpenAICompatibleProvider,
+    "vllm": OpenAICompatibleProvider,
+    "together": OpenAICompatibleProvider,
+    "groq": OpenAICompatibleProvider,
+}
+
+
+PROVIDER_CACHE_SIZE = 8
+_PROVIDER_CACHE: OrderedDict = OrderedDict()
+
+
+def _cached_provider(provider: str, frozen_kwargs: frozenset) -> LLMProvider:
+    """Return a shared provider, closing the pool of any instance it evicts."""
+    cls = _PROVIDERS[provider]
+    # Keyed on the env fallback too, so a rotated key gets a fresh instance
+    env_key = os.environ.get(cls.API_KEY_ENV) if cls.API_KEY_ENV else None
+    key = (provider, frozen_kwargs, env_key)
+    with _CACHE_LOCK:
+        inst = _PROVIDER_CACHE.get(key)
+        if inst is not None:
+            _PROVIDER_CACHE.move_to_end(key)
+            return inst
+        inst = _PROVIDER_CACHE[key] = cls(**dict(frozen_kwargs))
+        evicted = (_PROVIDER_CACHE.popitem(last=False)[1]
+                   if len(_PROVIDER_CACHE) > PROVIDER_CACHE_SIZE else None)
+    if evicted is not None:
+        evicted.close()
+    return inst
+
+
 def get_provider(provider: str = "google", **kwargs) -> LLMProvider:
     """Factory for LLM providers.
     
     Supported: google, openai, anthropic, ollama, compatible
+    
+    Instances are memoized on (provider, kwargs, API-key env var) so
+    repeated calls share one provider and its keep-alive connections.
+    Changing the env var yields a new instance; the least recently used
+    of more than PROVIDER_CACHE_SIZE instances is closed.
     """
-    providers = {
-        "google": GoogleProvider,
-        "openai": OpenAIProvider,
-        "anthropic": AnthropicProvider,
-        "ollama": OllamaProvider,
-        "compatible": OpenAICompatibleProvider,  # Any OpenAI-compatible API
-        "lmstudio": OpenAICompatibleProvider,
-        "vllm": OpenAICompatibleProvider,
-        "together": OpenAICompatibleProvider,
-        "groq": OpenAICompatibleProvider,
-    }
-    cls = providers.get(provider)
-    if not cls:
-        raise ValueError(f"Unknown provider: {provider}. Use: {list(providers.keys())}")
-    return cls(**kwargs)
+    if provider not in _PROVIDERS:
+        raise ValueError(f"Unknown provider: {provider}. Use: {list(_PROVIDERS.keys())}")
+    try:
+        frozen_kwargs = frozenset(kwargs.items())
+    except TypeError:
+        # Unhashable kwarg values — build a fresh, uncached instance
+        return _PROVIDERS[provider](**kwargs)
+    return _cached_provider(provider, frozen_kwargs)
+
+
+_RE_FENCE_HEAD = re.compile(r'^```(?:json)?\s*\n?')
+_RE_FENCE_TAIL = re.compile(r'\n?```\s*$')
+_RE_JSON_OBJ = re.compile(r'\{[\s\S]*\}')
 
 
 def _parse_json(text: str) -> Optional[dict]:
     """Parse JSON from text, handling markdown fences."""
     text = text.strip()
     if text.startswith("```"):
-        text = re.sub(r'^```(?:json)?\s*\n?', '', text)
-        text = re.sub(r'\n?```\s*$', '', text)
+        text = _RE_FENCE_HEAD.sub('', text)
+        text = _RE_FENCE_TAIL.sub('', text)
     try:
-        return json.loads(text)
+        return fastjson.loads(text)
     except json.JSONDecodeError:
-        match = re.search(r'\{[\s\S]*\}', text)
+        match = _RE_JSON_OBJ.search(text)
         if match:
             try:
-                return json.loads(match.group())
+                return fastjson.loads(match.group())
             except:
                 pass
     return None
@@ -1,34 +1,180 @@
 """Graph-aware recall — query the knowledge graph."""
 
+import heapq
 import json
+import mmap
+import os
 import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from .config import EngramConfig
+from . import fastjson
+from .config import EngramConfig, LOAD_WORKERS, PARALLEL_MIN_FILES
+from .corpus import load_corpus
 
+_WIKILINK = re.compile(r'\[\[([^\]]+)\]\]')
+_DATE_LINK = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TYPE_LINE = re.compile(r'\*\*Type:\*\*\s*(\w+)')
+_TYPE_LINE_B = re.compile(rb'\*\*Type:\*\*\s*(\w+)')
+_TYPE_MARKER = b'**Type:**'
 
-def levenshtein(s1: str, s2: str) -> int:
-    """Compute Levenshtein edit distance between two strings."""
-    if len(s1) < len(s2):
-        return levenshtein(s2, s1)
-    if len(s2) == 0:
-        return len(s1)
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # pragma: no cover - depends on environment
+    _rf_levenshtein = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+# DP cells (len1 * len2) below which the JIT path isn't worth the array
+# conversion; short names stay on the bit-parallel automaton
+NUMBA_MIN_CELLS = 4096
+
+if numba is not None:  # pragma: no cover - depends on environment
+    @numba.njit(cache=True)
+    def _lev_nb(a, b, max_dist):
+        """Two-row DP over code point arrays; max_dist < 0 means no cutoff."""
+        if a.shape[0] < b.shape[0]:
+            a, b = b, a
+        n, m = a.shape[0], b.shape[0]
+        prev = np.arange(m + 1, dtype=np.int32)
+        curr = np.empty(m + 1, dtype=np.int32)
+        for i in range(n):
+            curr[0] = i + 1
+            row_min = curr[0]
+            ai = a[i]
+            for j in range(m):
+                v = prev[j] + (0 if ai == b[j] else 1)
+                if prev[j + 1] + 1 < v:
+                    v = prev[j + 1] + 1
+                if curr[j] + 1 < v:
+                    v = curr[j] + 1
+                curr[j + 1] = v
+                if v < row_min:
+                    row_min = v
+            if max_dist >= 0 and row_min > max_dist:
+                return max_dist + 1
+            prev, curr = curr, prev
+        d = prev[m]
+        if max_dist >= 0 and d > max_dist:
+            return max_dist + 1
+        return d
+
+    def _code_points(s: str):
+        return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
+
+def levenshtein(s1: str, s2: str, max_dist: Optional[int] = None) -> int:
+    """Compute Levenshtein edit distance between two strings.
     
-    prev_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        curr_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Insertion, deletion, substitution
-            curr_row.append(min(
-                prev_row[j + 1] + 1,
-                curr_row[j] + 1,
-                prev_row[j] + (0 if c1 == c2 else 1)
-            ))
-        prev_row = curr_row
-    return prev_row[-1]
+    Uses RapidFuzz's C++ implementation when installed
+    (`pip install mindgardener[fast]`), then a Numba-compiled DP for long
+    strings (`pip install mindgardener[jit]`), otherwise Myers' bit-parallel
+    algorithm in pure Python. With max_dist, any distance above it is
+    reported as max_dist + 1, which lets the computation stop early.
+    """
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.distance(s1, s2, score_cutoff=max_dist)
+    if numba is not None and len(s1) * len(s2) >= NUMBA_MIN_CELLS:  # pragma: no cover
+        return int(_lev_nb(_code_points(s1), _code_points(s2),
+                           -1 if max_dist is None else max_dist))
+    return _levenshtein_py(s1, s2, max_dist)
+
 
+def _levenshtein_py(s1: str, s2: str, max_dist: Optional[int] = None) -> int:
+    return build_levenshtein_nfa(s1).distance(s2, max_dist)
 
+
+class LevenshteinAutomaton:
+    """Bit-parallel Levenshtein automaton for one query string.
+    
+    Myers (1999) / Hyyrö (2001): the query's character masks are built once,
+    then each candidate is stepped through one char at a time with the DP
+    column held as bit vectors of +1/-1 deltas. Python ints are unbounded,
+    so queries longer than 64 chars need no block splitting.
+    """
+    
+    __slots__ = ("query", "k", "_peq", "_mask", "_last")
+    
+    def __init__(self, query: str, k: Optional[int] = None):
+        self.query = query
+        self.k = k
+        peq: dict[str, int] = {}
+        for i, c in enumerate(query):
+            peq[c] = peq.get(c, 0) | (1 << i)
+        self._peq = peq
+        self._mask = (1 << len(query)) - 1
+        self._last = 1 << (len(query) - 1) if query else 0
+    
+    def distance(self, text: str, max_dist: Optional[int] = None) -> int:
+        """Edit distance to text; anything above max_dist comes back as max_dist + 1."""
+        n, m = len(text), len(self.query)
+        if max_dist is not None and abs(n - m) > max_dist:
+            return max_dist + 1
+        if m == 0:
+            return n
+        
+        peq, mask, last = self._peq, self._mask, self._last
+        # Each remaining char can lower the score by at most one, so stop
+        # once score - (n - i - 1) > limit, i.e. score + i > bound
+        limit = max_dist if max_dist is not None else n + m
+        bound = limit + n - 1
+        pv, mv, score = mask, 0, m
+        for i, c in enumerate(text):
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            if score + i > bound:
+                return limit + 1
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+        return score if score <= limit else limit + 1
+    
+    def matches(self, text: str) -> bool:
+        """True if text is within k edits of the query."""
+        if self.k is None:
+            raise ValueError("matches() needs an automaton built with k")
+        return self.distance(text, self.k) <= self.k
+
+
+@lru_cache(maxsize=1024)
+def build_levenshtein_nfa(query: str, k: Optional[int] = None) -> LevenshteinAutomaton:
+    """Cached automaton for query, so repeated comparisons skip the setup."""
+    return LevenshteinAutomaton(query, k)
+
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> tuple[str, str, frozenset[str]]:
+    """Stripped, casefolded and word-split forms of a string, computed once.
+    
+    casefold() rather than lower() so e.g. "Straße" and "STRASSE" compare equal.
+    """
+    stripped = text.strip()
+    folded = stripped.casefold()
+    return stripped, folded, frozenset(folded.split())
+
+
+@lru_cache(maxsize=4096)
 def fuzzy_score(query: str, target: str, threshold: float = 0.6) -> float:
     """Score how well query matches target. Returns 0.0-1.0.
     
@@ -39,10 +185,11 @@ def fuzzy_score(query: str, target: str, threshold: float = 0.6) -> float:
     - Levenshtein distance (normalized)
     - Prefix matching
     - Initials matching (e.g. "PS" → "Peter Steinberger")
+    
+    Scores are memoized per (query, target, threshold).
     """
-    q_orig = query.strip()
-    q = q_orig.lower()
-    t = target.lower().strip()
+    q_orig, q, q_words = _normalize(query)
+    _, t, t_words = _normalize(target)
     
     # Initials matching ("PS" → "Peter Steinberger") — check before lowering
     if len(q_orig) <= 5 and q_orig == q_orig.upper() and q_orig.isalpha():
@@ -61,9 +208,6 @@ def fuzzy_score(query: str, target: str, threshold: float = 0.6) -> float:
         return 0.85
     
     # Word-level matching
-    q_words = set(q.split())
-    t_words = set(t.split())
-    
     if q_words and t_words:
         # Any word exact match
         common = q_words & t_words
@@ -78,29 +222,209 @@ def fuzzy_score(query: str, target: str, threshold: float = 0.6) -> float:
                 if qw.startswith(tw) and len(tw) >= 3:
                     return 0.65
     
-    # Levenshtein distance (normalized)
+    # Levenshtein distance (normalized). The length gap is a lower bound on
+    # the distance, so skip the DP when it alone exceeds the cutoff (one unit
+    # of slack so float rounding never prunes a passing pair).
     max_len = max(len(q), len(t))
-    if max_len > 0:
-        dist = levenshtein(q, t)
+    cutoff = int((1 - threshold) * max_len) + 1
+    if max_len > 0 and abs(len(q) - len(t)) <= cutoff:
+        dist = levenshtein(q, t, cutoff)
         similarity = 1.0 - (dist / max_len)
         if similarity >= threshold:
             return similarity * 0.6  # Scale down so fuzzy never beats exact
     
     # Per-word Levenshtein (handles typos in multi-word names)
-    if len(q_words) > 0 and len(t_words) > 0:
+    # Only the best pair matters, so each comparison is capped at the
+    # distance that could still beat it, and pairs whose length gap alone
+    # exceeds that cap are skipped without running the DP.
+    q_long = [w for w in q_words if len(w) >= 3]
+    t_long = [w for w in t_words if len(w) >= 3]
+    if q_long and t_long:
         best_word_score = 0
-        for qw in q_words:
-            for tw in t_words:
-                if len(qw) >= 3 and len(tw) >= 3:
-                    wdist = levenshtein(qw, tw)
-                    wsim = 1.0 - (wdist / max(len(qw), len(tw)))
-                    best_word_score = max(best_word_score, wsim)
+        for qw in q_long:
+            for tw in t_long:
+                wlen = max(len(qw), len(tw))
+                wcut = int((1 - max(threshold, best_word_score)) * wlen) + 1
+                if abs(len(qw) - len(tw)) > wcut:
+                    continue
+                wdist = levenshtein(qw, tw, wcut)
+                wsim = 1.0 - (wdist / wlen)
+                best_word_score = max(best_word_score, wsim)
         if best_word_score >= threshold:
             return best_word_score * 0.5
     
     return 0.0
 
 
+def _content_scorer(query_lower: str, words: list[str]) -> Callable[[str], float]:
+    """Build a function scoring lowercased content: 0.5 for the full query,
+    0.1 for any of the words, else 0.0.
+    
+    With pyahocorasick installed all patterns are found in one pass over
+    the content; otherwise each pattern is a separate substring check.
+    """
+    if ahocorasick is None or not query_lower or not words:
+        def score(content_lower: str) -> float:
+            if query_lower in content_lower:
+                return 0.5
+            if any(w in content_lower for w in words):
+                return 0.1
+            return 0.0
+        return score
+    
+    automaton = ahocorasick.Automaton()
+    for w in words:
+        automaton.add_word(w, 0.1)
+    automaton.add_word(query_lower, 0.5)
+    automaton.make_automaton()
+    
+    def score(content_lower: str) -> float:
+        best = 0.0
+        for _, value in automaton.iter(content_lower):
+            if value == 0.5:
+                return 0.5
+            best = value
+        return best
+    return score
+
+
+class _EntityIndex:
+    """Entity names in one directory, with a character trie for prefix lookup."""
+    
+    def __init__(self, files: list[Path]):
+        # Interned: the same names key fuzzy_score's cache on every query
+        self.entries = [(sys.intern(f.stem.replace("-", " ")), f) for f in files]
+        self._trie: dict = {}
+        for name, f in self.entries:
+            node = self._trie
+            for ch in _normalize(name)[1]:
+                node = node.setdefault(ch, {})
+            node.setdefault(None, []).append((name, f))
+    
+    def prefix(self, prefix: str) -> list[tuple[str, Path]]:
+        """All (name, path) entries whose normalized name starts with prefix."""
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        hits = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is None:
+                    hits.extend(child)
+                else:
+                    stack.append(child)
+        return hits
+
+
+@lru_cache(maxsize=1)
+def _build_entity_index(entities_dir: Path, names: tuple[str, ...]) -> _EntityIndex:
+    return _EntityIndex([entities_dir / n for n in names])
+
+
+def _entity_index(entities_dir: Path) -> _EntityIndex:
+    """Entity index, rebuilt only when files are added, removed or renamed.
+    
+    Keyed on the directory listing itself rather than its mtime, which
+    can miss a change made within the same timestamp tick.
+    """
+    try:
+        with os.scandir(entities_dir) as it:
+            names = tuple(sorted(e.name for e in it
+                                 if e.name.endswith(".md") and not e.name.startswith(".")))
+    except FileNotFoundError:
+        names = ()
+    return _build_entity_index(entities_dir, names)
+
+
+def entity_entries(entities_dir: Path) -> list[tuple[str, Path]]:
+    """(display name, path) for every entity file, sorted by path.
+    
+    Shares recall's cached index, so repeated calls don't re-list the
+    directory while it is unchanged.
+    """
+    return _entity_index(entities_dir).entries
+
+
+# Entity text and its lowercased form, keyed by path and validated on stat
+ENTITY_CACHE_SIZE = 4096
+_ENTITY_CACHE: dict[str, tuple[int, int, str, str]] = {}
+
+
+def read_entity_texts(files: list[Path], config: EngramConfig) -> list[tuple[str, str]]:
+    """(content, content_lower) for each entity file.
+    
+    Served from the in-process cache, then the packed corpus, while their
+    copy matches the file's (mtime_ns, size); read from disk otherwise.
+    """
+    out: list[Optional[tuple[str, str]]] = [None] * len(files)
+    stats = []
+    corpus = None
+    try:
+        for i, f in enumerate(files):
+            st = f.stat()
+            stats.append(st)
+            hit = _ENTITY_CACHE.get(str(f))
+            if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                out[i] = (hit[2], hit[3])
+                continue
+            if corpus is None:
+                corpus = load_corpus(config.graph_file.parent) or False
+            content = corpus.get(f.name, st.st_mtime_ns, st.st_size) if corpus else None
+            if content is not None:
+                out[i] = _remember(f, st, content)
+    finally:
+        if corpus:
+            corpus.close()
+    
+    missing = [i for i, c in enumerate(out) if c is None]
+    if len(missing) >= PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+            texts = list(ex.map(Path.read_text, (files[i] for i in missing)))
+    else:
+        texts = [files[i].read_text() for i in missing]
+    for i, text in zip(missing, texts):
+        out[i] = _remember(files[i], stats[i], text)
+    return out
+
+
+def _remember(path: Path, st: os.stat_result, content: str) -> tuple[str, str]:
+    if len(_ENTITY_CACHE) >= ENTITY_CACHE_SIZE:
+        del _ENTITY_CACHE[next(iter(_ENTITY_CACHE))]
+    entry = (content, content.lower())
+    _ENTITY_CACHE[str(path)] = (st.st_mtime_ns, st.st_size) + entry
+    return entry
+
+
+# Recent recall() results, keyed on the query and validated against a
+# snapshot of every input file's stat
+RECALL_CACHE_SIZE = 64
+_RECALL_CACHE: OrderedDict[tuple, tuple[tuple, str]] = OrderedDict()
+
+
+def _recall_inputs_signature(config: EngramConfig) -> tuple:
+    """(name, mtime_ns, size) for every file recall() can read: entity pages,
+    the alias file and the graph. Any edit, add or remove changes it."""
+    entities = []
+    try:
+        with os.scandir(config.entities_dir) as it:
+            for e in it:
+                st = e.stat()
+                entities.append((e.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        pass
+    entities.sort()
+    try:
+        st = config.graph_file.stat()
+        graph = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        graph = None
+    return tuple(entities), graph
+
+
 def recall(query: str, config: EngramConfig, hops: int = 1) -> str:
     """
     Query the engram knowledge graph with fuzzy matching.
@@ -111,7 +435,26 @@ def recall(query: str, config: EngramConfig, hops: int = 1) -> str:
     4. Follow wikilinks for N hops
     5. Search graph.jsonl for related triplets
     6. Return formatted context
+    
+    Repeated queries are answered from a small LRU cache for as long as
+    none of the underlying files change.
     """
+    key = (query, hops, config.entities_dir, config.graph_file)
+    signature = _recall_inputs_signature(config)
+    cached = _RECALL_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        _RECALL_CACHE.move_to_end(key)
+        return cached[1]
+    
+    result = _recall(query, config, hops)
+    _RECALL_CACHE[key] = (signature, result)
+    _RECALL_CACHE.move_to_end(key)
+    if len(_RECALL_CACHE) > RECALL_CACHE_SIZE:
+        _RECALL_CACHE.popitem(last=False)
+    return result
+
+
+def _recall(query: str, config: EngramConfig, hops: int) -> str:
     results = []
     
     # Normalize query
@@ -131,28 +474,34 @@ def recall(query: str, config: EngramConfig, hops: int = 1) -> str:
     except ImportError:
         pass
     
-    # Search entity files with fuzzy matching
-    matching_entities = []
-    for entity_file in sorted(config.entities_dir.glob("*.md")):
-        name = entity_file.stem.replace("-", " ")
-        content = entity_file.read_text()
-        
-        # Fuzzy name match
-        name_score = fuzzy_score(query, name)
-        
-        # Content match (lower priority)
-        content_score = 0.0
-        if query_lower in content.lower():
-            content_score = 0.5
-        elif any(w in content.lower() for w in query_words if len(w) >= 3):
-            content_score = 0.1
-        
-        score = max(name_score, content_score)
-        
-        if score > 0.1:  # Minimum threshold
-            matching_entities.append((score, name, content, entity_file))
+    index = _entity_index(config.entities_dir)
     
-    matching_entities.sort(reverse=True)
+    # An exact name match is the best possible score; the trie finds it
+    # without scoring every entity.
+    best = max(
+        ((1.0, name, f) for name, f in index.prefix(_normalize(query)[1])
+         if fuzzy_score(query, name) == 1.0),
+        key=lambda s: s[:2], default=None,
+    )
+    
+    # Otherwise score entity names from file stems alone. Content matches
+    # score at most 0.5, so a stronger name match wins without reading files.
+    if best is None:
+        name_scores = [(fuzzy_score(query, name), name, f) for name, f in index.entries]
+        best = max(name_scores, key=lambda s: s[:2], default=None)
+    if best is not None and best[0] > 0.5:
+        matching_entities = [(best[0], best[1], best[2].read_text(), best[2])]
+    else:
+        # Content pass (lower priority than name matches)
+        content_score = _content_scorer(query_lower, [w for w in query_words if len(w) >= 3])
+        contents = read_entity_texts([f for _, _, f in name_scores], config)
+        
+        matching_entities = []
+        for (name_score, name, entity_file), (content, content_lower) in zip(name_scores, contents):
+            score = max(name_score, content_score(content_lower))
+            
+            if score > 0.1:  # Minimum threshold
+                matching_entities.append((score, name, content, entity_file))
     
     if not matching_entities:
         results.append(f"No entities found matching '{query}'")
@@ -164,7 +513,7 @@ def recall(query: str, config: EngramConfig, hops: int = 1) -> str:
         return "\n".join(results)
     
     # Top match
-    top_score, top_name, top_content, _ = matching_entities[0]
+    top_score, top_name, top_content, _ = heapq.nlargest(1, matching_entities)[0]
     results.append(top_content)
     
     # Follow wikilinks for hop 1
@@ -189,62 +538,92 @@ def recall(query: str, config: EngramConfig, hops: int = 1) -> str:
 
 
 def search_graph(query: str, config: EngramConfig) -> list[str]:
-    """Search graph.jsonl for matching triplets."""
+    """Search graph.jsonl for matching triplets.
+    
+    The file is scanned through mmap, and lines that can't contain the
+    query are rejected on their raw bytes before any JSON decoding.
+    """
     if not config.graph_file.exists():
         return []
     
     query_lower = query.lower()
     matches = []
     
-    for line in config.graph_file.read_text().strip().split("\n"):
-        if not line:
-            continue
-        try:
-            t = json.loads(line)
-            # Check if query matches subject, object, or detail
-            if (query_lower in (t.get("subject") or "").lower() or
-                query_lower in (t.get("object") or "").lower() or
-                query_lower in (t.get("detail") or "").lower()):
-                matches.append(
-                    f"- [{t.get('date', '?')}] {t['subject']} → {t['predicate']} → {t['object']}"
-                    + (f" ({t['detail']})" if t.get("detail") else "")
-                )
-        except json.JSONDecodeError:
-            continue
+    # A byte-level reject is only sound when the line's JSON strings are
+    # verbatim ASCII (no escapes) and the query itself needs no escaping.
+    q_bytes = None
+    if query_lower.isascii() and '"' not in query_lower and "\\" not in query_lower:
+        q_bytes = query_lower.encode()
+    
+    with open(config.graph_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if not line.strip():
+                    continue
+                if (q_bytes is not None and q_bytes not in line.lower()
+                        and line.isascii() and b"\\" not in line):
+                    continue
+                try:
+                    t = fastjson.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                # Check if query matches subject, object, or detail
+                if (query_lower in (t.get("subject") or "").lower() or
+                    query_lower in (t.get("object") or "").lower() or
+                    query_lower in (t.get("detail") or "").lower()):
+                    matches.append(
+                        f"- [{t.get('date', '?')}] {t['subject']} → {t['predicate']} → {t['object']}"
+                        + (f" ({t['detail']})" if t.get("detail") else "")
+                    )
     
     return matches
 
 
 def extract_wikilinks(text: str) -> list[str]:
     """Extract [[wikilinks]] from text."""
-    links = re.findall(r'\[\[([^\]]+)\]\]', text)
+    links = _WIKILINK.findall(text)
     # Deduplicate while preserving order
     seen = set()
     unique = []
     for link in links:
-        if link not in seen and not re.match(r'^\d{4}-\d{2}-\d{2}$', link):
+        if link not in seen and not _DATE_LINK.match(link):
             seen.add(link)
             unique.append(link)
     return unique
 
 
+def _entity_type(raw: bytes) -> str:
+    """**Type:** value of an entity file, decoding only the captured word.
+
+    The bytes regex only knows ASCII \\s and \\w, so fall back to the str
+    regex whenever non-ASCII text could change the answer: an earlier marker
+    the bytes pattern skipped, or a word that runs on into non-ASCII.
+    """
+    m = _TYPE_LINE_B.search(raw)
+    if m and m.start() == raw.find(_TYPE_MARKER) and raw[m.end():m.end() + 1] < b'\x80':
+        return m.group(1).decode()
+    if _TYPE_MARKER not in raw:
+        return "unknown"
+    m = _TYPE_LINE.search(raw.decode())
+    return m.group(1) if m else "unknown"
+
+
+def _entity_summary(f: Path) -> dict:
+    raw = f.read_bytes()
+    return {
+        "name": f.stem.replace("-", " "),
+        "type": _entity_type(raw),
+        "file": str(f),
+        "timeline_entries": raw.count(b'### [['),
+    }
+
+
 def list_entities(config: EngramConfig) -> list[dict]:
     """List all entities with their types."""
-    entities = []
-    for f in sorted(config.entities_dir.glob("*.md")):
-        content = f.read_text()
-        entity_type = "unknown"
-        type_match = re.search(r'\*\*Type:\*\*\s*(\w+)', content)
-        if type_match:
-            entity_type = type_match.group(1)
-        
-        # Count timeline entries
-        timeline_count = len(re.findall(r'### \[\[', content))
-        
-        entities.append({
-            "name": f.stem.replace("-", " "),
-            "type": entity_type,
-            "file": str(f),
-            "timeline_entries": timeline_count,
-        })
-    return entities
+    files = sorted(config.entities_dir.glob("*.md"))
+    if len(files) >= PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+            return list(ex.map(_entity_summary, files))
+    return [_entity_summary(f) for f in files]
@@ -7,30 +7,49 @@ parses wikilinks and relations, and rebuilds the graph.
 No LLM calls — pure regex parsing. Fast and free.
 """
 
+import io
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from .config import EngramConfig
+from . import fastjson
+from .config import EngramConfig, PARALLEL_MIN_FILES
+from .corpus import build_corpus
+from .filelock import safe_write, safe_write_bytes
+
+
+_REL_FORWARD = re.compile(r'(\w[\w\s]*?)\s*→\s*\[\[([^\]]+)\]\](?::\s*(.*))?')
+_REL_BACK = re.compile(r'\[\[([^\]]+)\]\]\s+(\w[\w\s]*?)\s*→\s*this(?::\s*(.*))?')
+_DATE_LINK = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_WIKI = re.compile(r'\[\[([^\]]+)\]\]')
+_DATE_HEADER = re.compile(r'### \[\[(\d{4}-\d{2}-\d{2})\]\]')
+_RELATIONS_HEADER = re.compile(r'^\s*## Relations\s*$', re.M)
+_SECTION_HEADER = re.compile(r'^## ', re.M)
+
+# Bump when the parsing above changes so stale sidecar caches are ignored
+INDEX_VERSION = 2
 
 
 def extract_relations_from_entity(filepath: Path) -> list[dict]:
     """Parse an entity file and extract all relationships."""
-    content = filepath.read_text()
-    name = filepath.stem.replace("-", " ")
-    
+    return _relations_from_content(filepath.stem.replace("-", " "), filepath.read_text())
+
+
+def _relations_from_content(name: str, content: str) -> list[dict]:
     relations = []
     
     # Extract wikilinks from timeline entries
     # Pattern: "verb → [[Target]]: detail" or "[[Source]] verb → this: detail"
-    for match in re.finditer(r'(\w[\w\s]*?)\s*→\s*\[\[([^\]]+)\]\](?::\s*(.*))?', content):
+    for match in _REL_FORWARD.finditer(content):
         predicate = match.group(1).strip()
         target = match.group(2).strip()
         detail = match.group(3).strip() if match.group(3) else ""
         
         # Skip date links
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', target):
+        if _DATE_LINK.match(target):
             continue
         
         relations.append({
@@ -41,12 +60,12 @@ def extract_relations_from_entity(filepath: Path) -> list[dict]:
         })
     
     # Extract "[[Source]] verb → this" patterns
-    for match in re.finditer(r'\[\[([^\]]+)\]\]\s+(\w[\w\s]*?)\s*→\s*this(?::\s*(.*))?', content):
+    for match in _REL_BACK.finditer(content):
         source = match.group(1).strip()
         predicate = match.group(2).strip()
         detail = match.group(3).strip() if match.group(3) else ""
         
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', source):
+        if _DATE_LINK.match(source):
             continue
         
         relations.append({
@@ -56,78 +75,152 @@ def extract_relations_from_entity(filepath: Path) -> list[dict]:
             "detail": detail,
         })
     
-    # Extract simple wikilinks from Relations section
-    in_relations = False
-    for line in content.split("\n"):
-        if line.strip() == "## Relations":
-            in_relations = True
-            continue
-        if line.startswith("## ") and in_relations:
-            break
-        if in_relations:
-            for link in re.findall(r'\[\[([^\]]+)\]\]', line):
-                if not re.match(r'^\d{4}-\d{2}-\d{2}$', link):
-                    # Check if this relation already exists
-                    exists = any(
-                        r["object"] == link or r["subject"] == link 
-                        for r in relations
-                    )
-                    if not exists:
-                        relations.append({
-                            "subject": name,
-                            "predicate": "related_to",
-                            "object": link,
-                            "detail": "",
-                        })
+    # Extract simple wikilinks from Relations section (sliced out once
+    # rather than walking every line of the file)
+    header = _RELATIONS_HEADER.search(content)
+    if header:
+        end = len(content)
+        for next_section in _SECTION_HEADER.finditer(content, header.end()):
+            line_end = content.find("\n", next_section.start())
+            if content[next_section.start():None if line_end < 0 else line_end].strip() != "## Relations":
+                end = next_section.start()
+                break
+        section = content[header.end():end]
+        for link in _WIKI.findall(section):
+            if not _DATE_LINK.match(link):
+                # Check if this relation already exists
+                exists = any(
+                    r["object"] == link or r["subject"] == link 
+                    for r in relations
+                )
+                if not exists:
+                    relations.append({
+                        "subject": name,
+                        "predicate": "related_to",
+                        "object": link,
+                        "detail": "",
+                    })
     
     return relations
 
 
 def extract_dates_from_entity(filepath: Path) -> list[str]:
     """Extract all timeline dates from an entity file."""
+    return _DATE_HEADER.findall(filepath.read_text())
+
+
+def _process_entity(path: str) -> tuple[list[dict], list[str]]:
+    """Read one entity file once and return (relations, sorted dates).
+    
+    ISO dates sort chronologically as strings, so the newest is dates[-1]
+    even when merged timelines aren't in order.
+    """
+    filepath = Path(path)
     content = filepath.read_text()
-    return re.findall(r'### \[\[(\d{4}-\d{2}-\d{2})\]\]', content)
+    return (
+        _relations_from_content(filepath.stem.replace("-", " "), content),
+        sorted(_DATE_HEADER.findall(content)),
+    )
+
+
+def _load_index(index_file: Path) -> dict:
+    """Load the per-entity parse cache, or an empty one if missing/corrupt."""
+    try:
+        data = json.loads(index_file.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("entities", {})
 
 
 def reindex(config: EngramConfig) -> dict:
     """Rebuild graph.jsonl from entity files.
     
+    Parsed relations and dates are cached per entity in a sidecar
+    graph.idx.json keyed on (mtime_ns, size), so only files that changed
+    since the last reindex are read and parsed again. Also refreshes the
+    packed entity corpus used by recall().
+    
     Returns stats dict with counts.
     """
     if not config.entities_dir.exists():
-        return {"entities": 0, "triplets": 0, "error": "No entities directory"}
+        return {"entities": 0, "triplets": 0, "parsed": 0, "error": "No entities directory"}
+    
+    index_file = config.graph_file.with_suffix(".idx.json")
+    cached = _load_index(index_file)
+    index = {}
     
     all_triplets = []
     seen = set()
     entity_count = 0
     
-    for filepath in sorted(config.entities_dir.glob("*.md")):
+    with os.scandir(config.entities_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".md") and not e.name.startswith(".")),
+            key=lambda e: e.name,
+        )
+    
+    changed = []
+    for entry in entries:
+        st = entry.stat()
+        hit = cached.get(entry.name)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            index[entry.name] = hit
+        else:
+            index[entry.name] = [st.st_mtime_ns, st.st_size]
+            changed.append(entry)
+    
+    # Parsing is pure-Python regex work, so big batches go to worker
+    # processes; below the threshold the spawn cost isn't worth it.
+    paths = [e.path for e in changed]
+    if len(paths) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as ex:
+            parsed = list(ex.map(_process_entity, paths, chunksize=32))
+    else:
+        parsed = [_process_entity(p) for p in paths]
+    for entry, (relations, dates) in zip(changed, parsed):
+        index[entry.name] += [relations, dates]
+    parsed_count = len(changed)
+    
+    # One clock read for the whole rebuild
+    now = datetime.now()
+    today, timestamp = now.strftime("%Y-%m-%d"), now.isoformat()
+    for entry in entries:
         entity_count += 1
-        relations = extract_relations_from_entity(filepath)
-        dates = extract_dates_from_entity(filepath)
+        relations, dates = index[entry.name][2:]
         
         # Use the most recent date, or today
-        date_str = dates[-1] if dates else datetime.now().strftime("%Y-%m-%d")
+        date_str = dates[-1] if dates else today
         
         for rel in relations:
             key = (rel["subject"], rel["predicate"], rel["object"])
             if key not in seen:
                 seen.add(key)
-                rel["date"] = date_str
-                rel["timestamp"] = datetime.now().isoformat()
-                rel["source"] = "reindex"
-                all_triplets.append(rel)
+                all_triplets.append({
+                    **rel,
+                    "date": date_str,
+                    "timestamp": timestamp,
+                    "source": "reindex",
+                })
     
     # Write new graph file (backup old one first)
     if config.graph_file.exists():
         backup = config.graph_file.with_suffix(".jsonl.bak")
         config.graph_file.rename(backup)
     
-    with open(config.graph_file, "w") as f:
-        for t in all_triplets:
-            f.write(json.dumps(t) + "\n")
+    buf = io.BytesIO()
+    write = buf.write
+    for t in all_triplets:
+        write(fastjson.dumps_bytes(t))
+        write(b"\n")
+    safe_write_bytes(config.graph_file, buf.getvalue())
+    
+    safe_write(index_file, json.dumps({"version": INDEX_VERSION, "entities": index}))
+    build_corpus(config.entities_dir, config.graph_file.parent)
     
     return {
         "entities": entity_count,
         "triplets": len(all_triplets),
+        "parsed": parsed_count,
     }
@@ -6,6 +6,8 @@ Handles 429 (rate limit), 500/502/503 (server errors), and timeouts.
 
 from __future__ import annotations
 
+import random
+import re
 import time
 import sys
 from functools import wraps
@@ -16,6 +18,30 @@ T = TypeVar('T')
 # HTTP errors worth retrying
 RETRYABLE_ERRORS = {429, 500, 502, 503, 504}
 
+_RETRYABLE_CODE_RE = re.compile(r'\b(?:429|500|502|503|504)\b')
+_TIMEOUT_RE = re.compile(r'timeout', re.IGNORECASE)
+
+
+def _is_retryable(e: Exception) -> bool:
+    """Decide from the exception's HTTP status when it carries one
+    (requests/httpx/openai use status_code, urllib's HTTPError uses code),
+    falling back to scanning the message once."""
+    status = getattr(e, "status_code", None)
+    if status is None:
+        status = getattr(e, "code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_ERRORS
+    if isinstance(e, TimeoutError):
+        return True
+    error_str = str(e)
+    return bool(_RETRYABLE_CODE_RE.search(error_str) or _TIMEOUT_RE.search(error_str))
+
+
+def _backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff plus up to 10% jitter, so callers don't retry in lockstep."""
+    delay = min(base_delay * (2 ** attempt), max_delay)
+    return delay + random.uniform(0, delay * 0.1)
+
 
 def with_retry(max_retries: int = 3, base_delay: float = 2.0,
                max_delay: float = 60.0, verbose: bool = False):
@@ -37,23 +63,16 @@ def with_retry(max_retries: int = 3, base_delay: float = 2.0,
                     return func(*args, **kwargs)
                 except Exception as e:
                     last_error = e
-                    error_str = str(e)
-                    
-                    # Check if retryable
-                    is_retryable = any(
-                        str(code) in error_str 
-                        for code in RETRYABLE_ERRORS
-                    ) or "timeout" in error_str.lower()
                     
-                    if not is_retryable or attempt == max_retries:
+                    if attempt == max_retries or not _is_retryable(e):
                         raise
                     
                     # Exponential backoff with jitter
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    delay = _backoff_delay(attempt, base_delay, max_delay)
                     
                     if verbose:
                         print(f"  ⏳ Retry {attempt + 1}/{max_retries} "
-                              f"after {delay:.1f}s ({error_str[:60]})",
+                              f"after {delay:.1f}s ({str(e)[:60]})",
                               file=sys.stderr)
                     
                     time.sleep(delay)
@@ -80,21 +99,15 @@ def retry_call(func: Callable[..., T], *args,
             return func(*args, **kwargs)
         except Exception as e:
             last_error = e
-            error_str = str(e)
-            
-            is_retryable = any(
-                str(code) in error_str 
-                for code in RETRYABLE_ERRORS
-            ) or "timeout" in error_str.lower()
             
-            if not is_retryable or attempt == max_retries:
+            if attempt == max_retries or not _is_retryable(e):
                 raise
             
-            delay = min(2.0 * (2 ** attempt), 60.0)
+            delay = _backoff_delay(attempt, 2.0, 60.0)
             
             if verbose:
                 print(f"  ⏳ Retry {attempt + 1}/{max_retries} "
-                      f"after {delay:.1f}s ({error_str[:60]})",
+                      f"after {delay:.1f}s ({str(e)[:60]})",
                       file=sys.stderr)
             
             time.sleep(delay)
@@ -21,8 +21,10 @@ event-level surprises. This is novel because:
 - RAG retrieves text. We track identity evolution.
 - MemGPT manages tiers. We model the person.
 
-The self-model is stored as YAML in memory/self-model.yaml and is
-human-readable and editable.
+The self-model is stored as JSON in memory/self-model.json. A legacy
+memory/self-model.yaml (or .yml) is read until the first save writes the
+JSON file, which then takes precedence. SelfModel.to_yaml() remains for
+human-readable export.
 
 Inspired by:
 - Predictive processing / free energy principle (Friston, 2010)
@@ -32,17 +34,68 @@ Inspired by:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import bisect
+import hashlib
+import heapq
+import io
+import os
+import time
 import yaml
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
+from . import fastjson
+from .filelock import atomic_append, safe_write_bytes, safe_write_stream
 from .providers import LLMProvider
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - depends on libyaml being built
+    from yaml import SafeLoader, SafeDumper
 
-@dataclass
+_DUMP_OPTIONS = dict(Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+# Beliefs are slotted, so lowercased claims are memoized by string instead
+_lower = lru_cache(maxsize=4096)(str.lower)
+
+_STATUS_ICON = {
+    "active": "●",
+    "weakening": "◐",
+    "revised": "↻",
+    "archived": "○",
+}
+
+_DRIFT_ICON = {
+    "strengthened": "📈",
+    "weakened": "📉",
+    "contradicted": "⚡",
+    "new": "🆕",
+    "evolved": "🔄",
+}
+
+# Above this many beliefs, find() searches one joined haystack instead of
+# testing each claim in turn
+FIND_HAYSTACK_MIN = 256
+
+# Model paths with these suffixes hold YAML; anything else holds JSON
+YAML_SUFFIXES = (".yaml", ".yml")
+
+MODEL_CACHE_SIZE = 16
+_MODEL_CACHE: OrderedDict[bytes, dict] = OrderedDict()
+
+# Parsed mappings by path, trusted while (mtime_ns, size, inode) is unchanged.
+# Files modified within the last RACY_NS aren't recorded: a same-size rewrite
+# inside one mtime tick would otherwise be invisible (git's "racy clean").
+RACY_NS = 2_000_000_000
+_STAT_CACHE: OrderedDict[Path, tuple[tuple[int, int, int], dict]] = OrderedDict()
+
+
+@dataclass(slots=True)
 class Belief:
     """A single belief about the principal."""
     claim: str
@@ -56,21 +109,56 @@ class Belief:
 
     def net_confidence(self) -> float:
         """Confidence weighted by evidence balance."""
-        total = len(self.evidence_for) + len(self.evidence_against)
+        n_for = len(self.evidence_for)
+        total = n_for + len(self.evidence_against)
         if total == 0:
             return self.confidence
-        balance = len(self.evidence_for) / total
-        return self.confidence * balance
+        return self.confidence * (n_for / total)
+
+    def claim_lower(self) -> str:
+        """Lowercased claim, memoized per claim string."""
+        return _lower(self.claim)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Hand-written rather than asdict(): no recursive deep copy per belief
+        return {
+            "claim": self.claim,
+            "confidence": self.confidence,
+            "category": self.category,
+            "evidence_for": list(self.evidence_for),
+            "evidence_against": list(self.evidence_against),
+            "first_observed": self.first_observed,
+            "last_updated": self.last_updated,
+            "status": self.status,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "Belief":
-        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
-
-
-@dataclass
+        # Copy evidence lists so the belief never aliases its source dict
+        fields = _BELIEF_FIELDS
+        if d.keys() == fields:
+            # Fast path for beliefs as to_dict() writes them: positional
+            # construction, skipping the filtered kwargs dict
+            ev_for, ev_against = d["evidence_for"], d["evidence_against"]
+            scalars = (d["claim"], d["confidence"], d["category"],
+                       d["first_observed"], d["last_updated"], d["status"])
+            if type(ev_for) is list and type(ev_against) is list and _SCALAR_TYPES.issuperset(map(type, scalars)):
+                claim, confidence, category, first_observed, last_updated, status = scalars
+                return cls(claim, confidence, category, ev_for.copy(), ev_against.copy(),
+                           first_observed, last_updated, status)
+        return cls(**{
+            k: list(v) if isinstance(v, list) else v
+            for k, v in d.items() if k in fields
+        })
+
+
+# Known keys for Belief.from_dict; anything else in a stored belief is dropped
+_BELIEF_FIELDS = frozenset(Belief.__dataclass_fields__)
+# Values from_dict may keep as-is on its fast path (none of them is a list)
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@dataclass(slots=True)
 class BeliefDrift:
     """A detected change in beliefs from new evidence."""
     belief_claim: str
@@ -82,24 +170,35 @@ class BeliefDrift:
     significance: float  # 0.0 - 1.0 (how much this changes the identity model)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "belief_claim": self.belief_claim,
+            "drift_type": self.drift_type,
+            "old_confidence": self.old_confidence,
+            "new_confidence": self.new_confidence,
+            "trigger_event": self.trigger_event,
+            "reasoning": self.reasoning,
+            "significance": self.significance,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfModel:
     """The agent's explicit model of its principal's identity."""
     beliefs: list[Belief] = field(default_factory=list)
     last_updated: str = ""
     version: int = 0
+    # find()'s search index, rebuilt whenever the claims it was built from change
+    _haystack: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def active_beliefs(self) -> list[Belief]:
         return [b for b in self.beliefs if b.status == "active"]
 
+    # Single pass over beliefs rather than filtering active_beliefs() again
     def by_category(self, category: str) -> list[Belief]:
-        return [b for b in self.active_beliefs() if b.category == category]
+        return [b for b in self.beliefs if b.category == category and b.status == "active"]
 
     def high_confidence(self, threshold: float = 0.7) -> list[Belief]:
-        return [b for b in self.active_beliefs() if b.confidence >= threshold]
+        return [b for b in self.beliefs if b.confidence >= threshold and b.status == "active"]
 
     def weakening(self) -> list[Belief]:
         return [b for b in self.beliefs if b.status == "weakening"]
@@ -107,21 +206,77 @@ class SelfModel:
     def find(self, claim_fragment: str) -> list[Belief]:
         """Find beliefs matching a substring."""
         fragment_lower = claim_fragment.lower()
-        return [b for b in self.beliefs if fragment_lower in b.claim.lower()]
-
-    def to_yaml(self) -> str:
-        """Serialize to human-readable YAML."""
-        data = {
+        beliefs = self.beliefs
+        if len(beliefs) < FIND_HAYSTACK_MIN or not fragment_lower or "\0" in fragment_lower:
+            return [b for b in beliefs if fragment_lower in b.claim_lower()]
+
+        # Claims may be edited in place, so the haystack is keyed on the
+        # claim strings themselves; comparing them is a cheap identity check
+        claims = [b.claim for b in beliefs]
+        haystack = self._haystack
+        if haystack is None or haystack[0] != claims:
+            # Lowered claims joined by NUL, with each claim's start offset;
+            # a fragment without NUL can't match across a boundary
+            lowered = [_lower(c) for c in claims]
+            starts, pos = [], 0
+            for claim in lowered:
+                starts.append(pos)
+                pos += len(claim) + 1
+            haystack = self._haystack = (claims, "\0".join(lowered), starts)
+        _, text, starts = haystack
+        found = []
+        pos = text.find(fragment_lower)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            found.append(beliefs[i])
+            if i + 1 == len(starts):
+                break
+            pos = text.find(fragment_lower, starts[i + 1])
+        return found
+
+    def _data(self) -> dict:
+        return {
             "version": self.version,
             "last_updated": self.last_updated,
             "beliefs": [b.to_dict() for b in self.beliefs],
         }
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+    def to_yaml(self, encoding: str | None = None) -> str | bytes:
+        """Serialize to human-readable YAML.
+
+        With an encoding, the emitter writes bytes directly (as yaml.dump does).
+        """
+        return yaml.dump(self._data(), encoding=encoding, **_DUMP_OPTIONS)
+
+    def dump_to(self, target: Path | IO[str]):
+        """Stream the YAML straight into target, with no intermediate string.
+
+        target is a path (written as UTF-8 via a temp file, so a failed
+        dump leaves the old file intact) or an open text stream.
+        """
+        if hasattr(target, "write"):
+            yaml.dump(self._data(), target, **_DUMP_OPTIONS)
+            return
+        with safe_write_stream(Path(target)) as f:
+            yaml.dump(self._data(), f, encoding="utf-8", **_DUMP_OPTIONS)
+
+    def to_json(self) -> str:
+        """Serialize to compact JSON, the on-disk format."""
+        return fastjson.dumps(self._data())
 
     @classmethod
     def from_yaml(cls, text: str) -> "SelfModel":
         """Load from YAML string."""
-        data = yaml.safe_load(text) or {}
+        return cls.from_data(yaml.load(text, Loader=SafeLoader) or {})
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> "SelfModel":
+        """Load from JSON string or bytes."""
+        return cls.from_data(fastjson.loads(text) or {})
+
+    @classmethod
+    def from_data(cls, data: dict) -> "SelfModel":
+        """Build from an already-parsed JSON or YAML mapping (left unmodified)."""
         beliefs = [Belief.from_dict(b) for b in data.get("beliefs", [])]
         return cls(
             beliefs=beliefs,
@@ -135,32 +290,65 @@ class SelfModel:
             return "No beliefs in self-model yet."
 
         categories = {}
-        for b in self.active_beliefs():
-            categories.setdefault(b.category, []).append(b)
-
-        lines = [f"## Self-Model (v{self.version}, updated {self.last_updated})\n"]
+        weak = []
+        for b in self.beliefs:
+            if b.status == "active":
+                categories.setdefault(b.category, []).append(b)
+            elif b.status == "weakening":
+                weak.append(b)
+
+        # Each line after the header is written with a leading newline,
+        # which yields exactly "\n".join(lines) without building the list
+        buf = io.StringIO()
+        write = buf.write
+        write(f"## Self-Model (v{self.version}, updated {self.last_updated})\n")
         for cat, beliefs in sorted(categories.items()):
-            lines.append(f"### {cat.title()}")
+            write(f"\n### {cat.title()}")
             for b in sorted(beliefs, key=lambda x: -x.confidence):
-                status_icon = {
-                    "active": "●",
-                    "weakening": "◐",
-                    "revised": "↻",
-                    "archived": "○",
-                }.get(b.status, "?")
-                lines.append(f"  {status_icon} [{b.confidence:.0%}] {b.claim}")
+                status_icon = _STATUS_ICON.get(b.status, "?")
+                write(f"\n  {status_icon} [{b.confidence:.0%}] {b.claim}")
                 if b.evidence_against:
-                    lines.append(f"    ⚠ Counter-evidence: {', '.join(b.evidence_against[-2:])}")
-            lines.append("")
+                    write(f"\n    ⚠ Counter-evidence: {', '.join(b.evidence_against[-2:])}")
+            write("\n")
 
-        weak = self.weakening()
         if weak:
-            lines.append("### ⚠ Weakening Beliefs")
+            write("\n### ⚠ Weakening Beliefs")
             for b in weak:
-                lines.append(f"  ◐ [{b.confidence:.0%}] {b.claim}")
-            lines.append("")
+                write(f"\n  ◐ [{b.confidence:.0%}] {b.claim}")
+            write("\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
+
+    def format_for_prompt(self, top_k: int = 40) -> str:
+        """Compact `claim: confidence` lines for LLM prompts.
+
+        Only the top_k active beliefs by net confidence are included;
+        evidence history is left out to keep the prompt short.
+        """
+        # net_confidence runs once per belief as the key; nlargest avoids a full sort
+        beliefs = heapq.nlargest(top_k, self.active_beliefs(), key=Belief.net_confidence)
+        return "\n".join(f"- {b.claim}: {b.confidence:.2f}" for b in beliefs)
+
+
+def _parse_model(raw: bytes, legacy: bool = False) -> dict:
+    """Parse self-model JSON (or legacy YAML), memoized on a digest of the contents.
+
+    The cached mapping is shared, so callers must not mutate it;
+    SelfModel.from_data copies what it keeps.
+    """
+    key = hashlib.blake2b(raw, digest_size=16, person=b"yaml" if legacy else b"").digest()
+    data = _MODEL_CACHE.get(key)
+    if data is not None:
+        _MODEL_CACHE.move_to_end(key)
+        return data
+    if legacy:
+        data = yaml.load(raw, Loader=SafeLoader) or {}
+    else:
+        data = fastjson.loads(raw) or {}
+    _MODEL_CACHE[key] = data
+    if len(_MODEL_CACHE) > MODEL_CACHE_SIZE:
+        _MODEL_CACHE.popitem(last=False)
+    return data
 
 
 BOOTSTRAP_PROMPT = """You are building an identity model of a person based on their memory files.
@@ -246,26 +434,77 @@ TODAY'S EVENTS:
 """
 
 
+# Literal text around each placeholder, split once at import so building
+# a prompt is plain concatenation rather than a str.format parse
+_BOOTSTRAP_HEAD, _BOOTSTRAP_TAIL = BOOTSTRAP_PROMPT.format(text="\0").split("\0")
+_DRIFT_HEAD, _DRIFT_MID, _DRIFT_TAIL = DRIFT_PROMPT.format(self_model="\0", events="\0").split("\0")
+
+
 class SelfModelEngine:
     """Manages the agent's identity model of its principal."""
 
     def __init__(self, llm: LLMProvider, model_path: Path, drift_log_path: Path | None = None):
         self.llm = llm
+        # The model is read and written at model_path, in YAML if its suffix
+        # says so and JSON otherwise. A JSON model falls back to reading a
+        # .yaml/.yml sibling left by older workspaces until its first save.
         self.model_path = model_path
+        self.is_yaml = model_path.suffix in YAML_SUFFIXES
+        self.legacy_paths = [] if self.is_yaml else [model_path.with_suffix(s) for s in YAML_SUFFIXES]
         self.drift_log_path = drift_log_path or model_path.parent / "belief-drifts.jsonl"
 
+    def exists(self) -> bool:
+        """Whether a self-model has been saved, at model_path or a legacy sibling."""
+        return any(p.exists() for p in (self.model_path, *self.legacy_paths))
+
+    def _stat(self) -> tuple[Path, bool, os.stat_result]:
+        """(path, is_yaml, stat) of the first model file that exists."""
+        try:
+            return self.model_path, self.is_yaml, os.stat(self.model_path)
+        except FileNotFoundError:
+            for path in self.legacy_paths:
+                try:
+                    return path, True, os.stat(path)
+                except FileNotFoundError:
+                    continue
+            raise
+
     def load(self) -> SelfModel:
-        """Load self-model from YAML file."""
-        if self.model_path.exists():
-            return SelfModel.from_yaml(self.model_path.read_text())
-        return SelfModel()
+        """Load self-model from model_path, or a legacy YAML sibling."""
+        try:
+            path, legacy, st = self._stat()
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            hit = _STAT_CACHE.get(path)
+            if hit is not None and hit[0] == sig:
+                return SelfModel.from_data(hit[1])
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return SelfModel()
+
+        data = _parse_model(raw, legacy)
+        # sig predates the read, so a change in between just misses next time
+        if time.time_ns() - st.st_mtime_ns > RACY_NS:
+            _STAT_CACHE[path] = (sig, data)
+            _STAT_CACHE.move_to_end(path)
+            if len(_STAT_CACHE) > MODEL_CACHE_SIZE:
+                _STAT_CACHE.popitem(last=False)
+        return SelfModel.from_data(data)
 
     def save(self, model: SelfModel):
-        """Save self-model to YAML file."""
+        """Save self-model to model_path."""
         model.last_updated = datetime.now().isoformat()
         model.version += 1
-        self.model_path.parent.mkdir(parents=True, exist_ok=True)
-        self.model_path.write_text(model.to_yaml())
+        if self.is_yaml:
+            payload = model.to_yaml(encoding="utf-8")
+        else:
+            payload = fastjson.dumps_bytes(model._data())
+        # Temp file + rename, so readers never see a half-written model
+        try:
+            safe_write_bytes(self.model_path, payload)
+        except FileNotFoundError:
+            # Only pay for mkdir on the first save into a fresh directory
+            self.model_path.parent.mkdir(parents=True, exist_ok=True)
+            safe_write_bytes(self.model_path, payload)
 
     async def bootstrap(self, text: str) -> SelfModel:
         """
@@ -274,7 +513,7 @@ class SelfModelEngine:
         Use this to initialize the self-model from MEMORY.md or
         accumulated daily logs. Only needs to run once.
         """
-        prompt = BOOTSTRAP_PROMPT.format(text=text[:8000])
+        prompt = _BOOTSTRAP_HEAD + text[:8000] + _BOOTSTRAP_TAIL
         result = await self.llm.generate_json(prompt)
 
         now = datetime.now().isoformat()
@@ -295,24 +534,22 @@ class SelfModelEngine:
 
     def bootstrap_sync(self, text: str) -> SelfModel:
         """Synchronous wrapper."""
-        import asyncio
         return asyncio.run(self.bootstrap(text))
 
-    async def detect_drift(self, events: str) -> list[BeliefDrift]:
+    async def detect_drift(self, events: str, model: SelfModel | None = None) -> list[BeliefDrift]:
         """
         Detect identity-level drift from new events.
 
         Compares today's events against the current self-model
         to find belief changes, not just event-level surprises.
+        Pass an already-loaded model to skip reading it from disk.
         """
-        model = self.load()
+        if model is None:
+            model = self.load()
         if not model.beliefs:
             return []
 
-        prompt = DRIFT_PROMPT.format(
-            self_model=model.format_readable(),
-            events=events[:6000],
-        )
+        prompt = _DRIFT_HEAD + model.format_for_prompt() + _DRIFT_MID + events[:6000] + _DRIFT_TAIL
         result = await self.llm.generate_json(prompt)
 
         drifts = []
@@ -332,40 +569,65 @@ class SelfModelEngine:
 
         return drifts
 
-    def detect_drift_sync(self, events: str) -> list[BeliefDrift]:
+    def detect_drift_sync(self, events: str, model: SelfModel | None = None) -> list[BeliefDrift]:
+        """Synchronous wrapper."""
+        return asyncio.run(self.detect_drift(events, model))
+
+    async def detect_and_apply(
+        self, events: str, significance_threshold: float = 0.3,
+    ) -> tuple[list[BeliefDrift], SelfModel]:
+        """Detect drift and apply it, loading the self-model only once."""
+        model = self.load()
+        drifts = await self.detect_drift(events, model)
+        return drifts, self.apply_drifts(drifts, significance_threshold, model)
+
+    def detect_and_apply_sync(
+        self, events: str, significance_threshold: float = 0.3,
+    ) -> tuple[list[BeliefDrift], SelfModel]:
         """Synchronous wrapper."""
-        import asyncio
-        return asyncio.run(self.detect_drift(events))
+        return asyncio.run(self.detect_and_apply(events, significance_threshold))
 
-    def apply_drifts(self, drifts: list[BeliefDrift], significance_threshold: float = 0.3) -> SelfModel:
+    def apply_drifts(
+        self, drifts: list[BeliefDrift], significance_threshold: float = 0.3,
+        model: SelfModel | None = None,
+    ) -> SelfModel:
         """
         Apply detected drifts to the self-model.
 
         Only applies drifts above the significance threshold.
-        Returns the updated model (also saved to disk).
+        Returns the updated model (also saved to disk). A model passed in
+        is updated in place instead of being reloaded.
         """
-        model = self.load()
+        if model is None:
+            model = self.load()
         now = datetime.now().isoformat()
 
-        for drift in drifts:
-            if drift.significance < significance_threshold:
-                continue
+        significant = [d for d in drifts if d.significance >= significance_threshold]
 
-            # Find matching belief
-            matching = [b for b in model.beliefs if b.claim.lower() == drift.belief_claim.lower()]
-            
-            if not matching and drift.drift_type == "new":
+        # First belief per lowercased claim, like a linear scan would find.
+        # An evolved claim only changes case, so its key stays valid.
+        by_claim: dict[str, Belief] = {}
+        if significant:
+            for b in model.beliefs:
+                by_claim.setdefault(b.claim_lower(), b)
+
+        for drift in significant:
+            key = _lower(drift.belief_claim)
+            belief = by_claim.get(key)
+
+            if belief is None and drift.drift_type == "new":
                 # New belief
-                model.beliefs.append(Belief(
+                belief = Belief(
                     claim=drift.belief_claim,
                     confidence=drift.new_confidence,
                     category="unknown",
                     evidence_for=[drift.trigger_event],
                     first_observed=now,
                     last_updated=now,
-                ))
-            elif matching:
-                belief = matching[0]
+                )
+                model.beliefs.append(belief)
+                by_claim[key] = belief
+            elif belief is not None:
                 belief.last_updated = now
 
                 if drift.drift_type == "strengthened":
@@ -393,12 +655,15 @@ class SelfModelEngine:
         """Append drift events to JSONL log for audit."""
         if not drifts:
             return
-        self.drift_log_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.drift_log_path, "a") as f:
-            for d in drifts:
-                entry = d.to_dict()
-                entry["timestamp"] = datetime.now().isoformat()
-                f.write(json.dumps(entry) + "\n")
+        now = datetime.now().isoformat()
+        # One locked append for the whole batch
+        payload = b"".join(fastjson.dumps_bytes({**d.to_dict(), "timestamp": now}) + b"\n" for d in drifts)
+        try:
+            atomic_append(self.drift_log_path, payload)
+        except FileNotFoundError:
+            # As in save(): mkdir only when the directory is actually missing
+            self.drift_log_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_append(self.drift_log_path, payload)
 
     def format_drifts(self, drifts: list[BeliefDrift]) -> str:
         """Format drifts for CLI output."""
@@ -407,13 +672,7 @@ class SelfModelEngine:
 
         lines = ["## Belief Drift Report\n"]
         for d in sorted(drifts, key=lambda x: -x.significance):
-            icon = {
-                "strengthened": "📈",
-                "weakened": "📉",
-                "contradicted": "⚡",
-                "new": "🆕",
-                "evolved": "🔄",
-            }.get(d.drift_type, "❓")
+            icon = _DRIFT_ICON.get(d.drift_type, "❓")
 
             conf_change = f"{d.old_confidence:.0%} → {d.new_confidence:.0%}"
             lines.append(f"{icon} **{d.drift_type.upper()}** [{conf_change}] significance={d.significance:.0%}")
@@ -10,11 +10,13 @@ Formula:
 Grace period: 7 days before decay kicks in for new entities.
 """
 
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from . import fastjson
+from .filelock import atomic_append
+
 
 def load_access_log(memory_dir: Path) -> dict:
     """Load entity access log."""
@@ -26,10 +28,10 @@ def load_access_log(memory_dir: Path) -> dict:
     access_counts = {}
     last_access = {}
     
-    for line in log_path.read_text().strip().split("\n"):
+    for line in log_path.read_bytes().strip().split(b"\n"):
         if not line:
             continue
-        entry = json.loads(line)
+        entry = fastjson.loads(line)
         entity = entry["entity"]
         access_counts[entity] = access_counts.get(entity, 0) + 1
         last_access[entity] = entry["timestamp"]
@@ -50,8 +52,7 @@ def record_access(memory_dir: Path, entity: str, query: Optional[str] = None) ->
         "query": query,
     }
     
-    with open(log_path, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    atomic_append(log_path, fastjson.dumps_bytes(entry) + b"\n")
 
 
 def calculate_importance(
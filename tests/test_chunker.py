@@ -1,9 +1,5 @@
 """Tests for the chunker module."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from engram.chunker import pre_filter, chunk_text, merge_extractions, ChunkConfig
 
 
@@ -1,13 +1,12 @@
 """Tests for concurrency safety — file locking on writes."""
 
-import sys
 import threading
 import time
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
-from engram.filelock import file_lock, safe_write, safe_append
+from engram.filelock import (
+    file_lock, safe_write, safe_write_bytes, safe_append, atomic_append, atomic_append_line,
+)
 
 
 class TestFileLock:
@@ -50,6 +49,7 @@ class TestFileLock:
         lines = [l for l in f.read_text().strip().split("\n") if l]
         assert len(lines) == 100  # No lost writes
     
+    @pytest.mark.slow
     def test_concurrent_writes(self, tmp_path):
         """Two threads writing to same file — last one wins, no corruption."""
         f = tmp_path / "entity.md"
@@ -75,6 +75,44 @@ class TestFileLock:
         assert content.startswith("# Thread")
         assert len(results) == 2
     
+    def test_concurrent_atomic_appends(self, tmp_path):
+        """O_APPEND lines from two threads stay whole, without a side lock file."""
+        f = tmp_path / "evaluations.jsonl"
+        
+        def writer(thread_id):
+            for i in range(50):
+                atomic_append_line(f, f"thread-{thread_id}-line-{i}")
+        
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        lines = f.read_text().splitlines()
+        assert len(lines) == 100
+        assert all(l.startswith("thread-") for l in lines)
+        assert not (tmp_path / "evaluations.jsonl.lock").exists()
+    
+    def test_mixed_size_appends_never_interleave(self, tmp_path):
+        """Small appends can't land inside a large batch's partial writes."""
+        f = tmp_path / "scores.jsonl"
+        big = b"".join(b"B" * 199 + b"\n" for _ in range(200))  # 40 KB, > PIPE_BUF
+        
+        def writer(payload):
+            for _ in range(20):
+                atomic_append(f, payload)
+        
+        threads = [threading.Thread(target=writer, args=(p,)) for p in (big, b"s\n", b"s\n")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        data = f.read_bytes()
+        assert data.count(big) == 20
+        assert data.replace(big, b"") == b"s\n" * 40
+    
     def test_safe_write_atomic(self, tmp_path):
         """safe_write should use temp file → rename (atomic)."""
         f = tmp_path / "entity.md"
@@ -83,6 +121,14 @@ class TestFileLock:
         # No leftover .tmp file
         assert not (tmp_path / "entity.tmp").exists()
     
+    def test_safe_write_bytes_atomic(self, tmp_path):
+        f = tmp_path / "graph.jsonl"
+        f.write_text("old\n")
+        safe_write_bytes(f, b'{"subject":"A"}\n')
+        assert f.read_bytes() == b'{"subject":"A"}\n'
+        assert not (tmp_path / "graph.tmp").exists()
+    
+    @pytest.mark.slow
     def test_lock_timeout(self, tmp_path):
         """Lock should timeout gracefully, not deadlock."""
         f = tmp_path / "test.txt"
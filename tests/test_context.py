@@ -1,10 +1,7 @@
 """Tests for token-budget-aware context assembly."""
 
-import sys
 import json
 from datetime import datetime, timedelta
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 from engram.config import EngramConfig
@@ -146,6 +143,22 @@ class TestAssembleContext:
         # Should include Stockholm or OpenClaw (linked from Marcus)
         assert "Stockholm" in result["context"] or "OpenClaw" in result["context"]
     
+    def test_follows_links_up_to_max_hops(self, workspace):
+        entities = workspace.entities_dir
+        (entities / "Stockholm.md").write_text(
+            "# Stockholm\n**Type:** location\n- In [[Sweden]], home of [[Marcus]]\n"
+        )
+        (entities / "Sweden.md").write_text("# Sweden\n**Type:** location\n")
+        
+        def linked(hops):
+            loaded = assemble_context("Marcus", workspace, token_budget=10000, max_hops=hops)
+            return [i["name"] for i in loaded["manifest"]["loaded"] if i["type"] == "linked_entity"]
+        
+        assert "Sweden" not in linked(1)
+        two_hops = linked(2)
+        assert two_hops.index("Stockholm") < two_hops.index("Sweden")
+        assert "Marcus" not in two_hops
+    
     def test_includes_graph(self, workspace):
         result = assemble_context("Marcus", workspace, token_budget=4000, include_graph=True)
         assert "applied_to" in result["context"] or "Graph" in result["context"]
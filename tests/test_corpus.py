@@ -0,0 +1,61 @@
+"""Tests for the packed entity corpus."""
+
+import pytest
+from engram.corpus import build_corpus, load_corpus
+
+
+@pytest.fixture
+def entities(tmp_path):
+    d = tmp_path / "entities"
+    d.mkdir()
+    (d / "Kadoa.md").write_text("# Kadoa\n**Type:** company\n")
+    (d / "Adrian-Krebs.md").write_text("# Adrian Krebs\n**Type:** person\n- Café regular\n")
+    (d / ".hidden.md").write_text("ignored")
+    return d
+
+
+def _get(corpus, path):
+    st = path.stat()
+    return corpus.get(path.name, st.st_mtime_ns, st.st_size)
+
+
+class TestCorpus:
+    def test_roundtrip(self, entities, tmp_path):
+        assert build_corpus(entities, tmp_path) == 2
+        with load_corpus(tmp_path) as corpus:
+            assert corpus.names == ["Adrian-Krebs.md", "Kadoa.md"]
+            assert _get(corpus, entities / "Adrian-Krebs.md") == (entities / "Adrian-Krebs.md").read_text()
+            assert _get(corpus, entities / "Kadoa.md").startswith("# Kadoa")
+
+    def test_missing_corpus(self, tmp_path):
+        assert load_corpus(tmp_path) is None
+
+    def test_stale_entry_rejected(self, entities, tmp_path):
+        build_corpus(entities, tmp_path)
+        kadoa = entities / "Kadoa.md"
+        kadoa.write_text("# Kadoa\n**Type:** company\n- Series A\n")
+        with load_corpus(tmp_path) as corpus:
+            assert _get(corpus, kadoa) is None
+            assert _get(corpus, entities / "Adrian-Krebs.md") is not None
+
+    def test_rebuild_picks_up_changes(self, entities, tmp_path):
+        build_corpus(entities, tmp_path)
+        kadoa = entities / "Kadoa.md"
+        kadoa.write_text("# Kadoa\n- changed\n")
+        (entities / "OpenClaw.md").write_text("# OpenClaw\n")
+        assert build_corpus(entities, tmp_path) == 3
+        with load_corpus(tmp_path) as corpus:
+            assert _get(corpus, kadoa) == "# Kadoa\n- changed\n"
+
+    def test_truncated_data_ignored(self, entities, tmp_path):
+        build_corpus(entities, tmp_path)
+        with open(tmp_path / "entities.dat", "r+b") as f:
+            f.truncate(5)
+        assert load_corpus(tmp_path) is None
+
+    def test_empty_directory(self, tmp_path):
+        d = tmp_path / "empty"
+        d.mkdir()
+        assert build_corpus(d, tmp_path) == 0
+        with load_corpus(tmp_path) as corpus:
+            assert corpus.names == []
@@ -1,10 +1,7 @@
 """Tests for the decay scoring module."""
 
 import json
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 from engram.decay import (
@@ -1,9 +1,7 @@
 """Tests for the entity deduplication module."""
 
 import json
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 from engram.dedup import find_duplicates, merge_entity_files, run_dedup, sanitize_filename
@@ -50,6 +48,16 @@ class TestFindDuplicates:
         assert len(dupes) >= 1
         assert any("mutual" in d[2] for d in dupes)
     
+    def test_mutual_reference_short_names(self, entity_dir):
+        """Names shorter than the trigram prefilter are still matched."""
+        (entity_dir / "AI.md").write_text("# AI\nSee Machine Learning\n")
+        (entity_dir / "Machine-Learning.md").write_text("# Machine Learning\nA branch of AI\n")
+        (entity_dir / "Rust.md").write_text("# Rust\nNothing shared\n")
+        
+        dupes = find_duplicates(entity_dir)
+        assert [d[2] for d in dupes] == ["mutual references"]
+        assert {Path(f).name for f in dupes[0][:2]} == {"AI.md", "Machine-Learning.md"}
+    
     def test_no_false_positives(self, entity_dir):
         """Unrelated entities should not be flagged."""
         (entity_dir / "Alice.md").write_text("# Alice\n**Type:** person\nWorks at Corp A\n")
@@ -115,6 +123,19 @@ class TestMergeEntityFiles:
         # Fact A should appear only once
         assert merged.count("Fact A") == 1
     
+    def test_merge_alias_note_after_type_line(self, entity_dir):
+        primary = entity_dir / "Primary.md"
+        secondary = entity_dir / "Secondary-Name.md"
+        
+        primary.write_text("# Primary\n**Type:** test\n\n## Facts\n- Fact A\n")
+        secondary.write_text("# Secondary Name\n**Type:** test\n")
+        
+        merge_entity_files(primary, secondary)
+        merged = primary.read_text()
+        
+        assert merged.startswith(
+            "# Primary\n**Type:** test\n**Also known as:** Secondary Name\n")
+    
     def test_merge_delete_secondary(self, entity_dir):
         primary = entity_dir / "Primary.md"
         secondary = entity_dir / "Secondary.md"
@@ -1,9 +1,6 @@
 """Tests for the Context Evaluator — fact-checking + write-back."""
 
-import sys
 import json
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 from engram.config import EngramConfig
@@ -12,6 +9,7 @@ from engram.evaluate import (
     write_back,
     _extract_claims,
     _check_claim_against_entity,
+    parse_entity,
     FactCheck,
     EvaluationResult,
 )
@@ -104,6 +102,36 @@ class TestCheckClaim:
         )
         assert fc.verdict == "new"
     
+    def test_parsed_entity_matches_raw_text(self, workspace):
+        entity_content = (workspace / "memory" / "entities" / "Marcus.md").read_text()
+        parsed = parse_entity("Marcus", entity_content)
+        assert parsed.type == "person"
+        assert "Lives in Stockholm" in parsed.facts
+        assert "- Submitted PR to OpenClaw" in parsed.bullet_lines
+        claim = "Marcus submitted a PR to OpenClaw"
+        assert (_check_claim_against_entity(claim, "Marcus", parsed)
+                == _check_claim_against_entity(claim, "Marcus", entity_content))
+    
+    def test_shingle_prefilter_skips_unrelated_entity(self, workspace):
+        entity_content = (workspace / "memory" / "entities" / "Marcus.md").read_text()
+        parsed = parse_entity("Marcus", entity_content)
+        assert parsed.shingles
+        fc = _check_claim_against_entity("Quantum widgets oscillate rapidly", "Marcus", parsed)
+        assert fc.verdict == "unverified"
+    
+    def test_repeat_check_returns_fresh_result(self, workspace):
+        entity_content = (workspace / "memory" / "entities" / "Marcus.md").read_text()
+        parsed = parse_entity("Marcus", entity_content)
+        claim = "Marcus submitted a PR to OpenClaw"
+        first = _check_claim_against_entity(claim, "Marcus", parsed)
+        first.verdict = "edited"
+        again = _check_claim_against_entity(claim, "Marcus", parsed)
+        assert again.verdict == "confirmed"
+        assert again is not first
+        
+        reparsed = parse_entity("Marcus", "# Marcus\n- Lives in Stockholm\n")
+        assert _check_claim_against_entity(claim, "Marcus", reparsed).verdict != "confirmed"
+    
     def test_type_contradiction(self, workspace):
         entity_content = (workspace / "memory" / "entities" / "OpenClaw.md").read_text()
         fc = _check_claim_against_entity(
@@ -141,6 +169,27 @@ class TestEvaluateOutput:
         detected_names = [ne["name"] for ne in result.new_entities]
         assert "Koylanai" in detected_names or "Adrian Krebs" in detected_names
     
+    def test_reuses_parse_until_file_changes(self, config):
+        from engram.evaluate import _load_entities
+        first = _load_entities(config.entities_dir)
+        second = _load_entities(config.entities_dir)
+        assert second["Marcus"] is first["Marcus"]
+        
+        marcus = config.entities_dir / "Marcus.md"
+        marcus.write_text(marcus.read_text() + "- Moved to Lisbon\n")
+        third = _load_entities(config.entities_dir)
+        assert third["Marcus"] is not first["Marcus"]
+        assert "Moved to Lisbon" in third["Marcus"].bullet_lines[-1]
+        assert third["OpenClaw"] is first["OpenClaw"]
+
+    def test_parallel_load_matches_serial(self, config, monkeypatch):
+        from engram import evaluate as evaluate_mod
+        serial = {k: v.bullet_lines for k, v in evaluate_mod._load_entities(config.entities_dir).items()}
+        monkeypatch.setattr(evaluate_mod, "_PARSE_CACHE", {})
+        monkeypatch.setattr(evaluate_mod, "PARALLEL_MIN_FILES", 1)
+        parallel = {k: v.bullet_lines for k, v in evaluate_mod._load_entities(config.entities_dir).items()}
+        assert parallel == serial
+
     def test_empty_output(self, config):
         result = evaluate_output("", config)
         assert result.overall_confidence == 0.5
@@ -188,6 +237,26 @@ class TestWriteBack:
         assert "Rust" in content
         assert "auto-evaluated" in content
     
+    def test_batches_facts_per_entity(self, config):
+        from engram.evaluate import NewFact
+        result = EvaluationResult(
+            evaluated_at="2026-02-17",
+            new_facts=[
+                NewFact(entity_name="Marcus", fact="Speaks Swedish", confidence=0.8),
+                NewFact(entity_name="Marcus", fact="Plays chess", confidence=0.8),
+                NewFact(entity_name="Marcus", fact="Speaks Swedish", confidence=0.8),
+            ],
+        )
+        
+        actions = write_back(result, config)
+        assert sum(a.startswith("ADDED") for a in actions) == 2
+        assert any("already exists" in a for a in actions)
+        
+        content = (config.entities_dir / "Marcus.md").read_text()
+        assert content.count("Speaks Swedish") == 1
+        assert content.index("Speaks Swedish") < content.index("Founder of the swarm project")
+        assert "Plays chess" in content
+    
     def test_dry_run(self, config):
         from engram.evaluate import NewFact
         result = EvaluationResult(
@@ -1,31 +1,40 @@
 """Tests for quick-fix commands."""
 
-import sys
+import shutil
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 from engram.fix import fix_type, fix_name, add_fact, remove_fact
 
 
-@pytest.fixture
-def entity_dir(tmp_path):
-    entities = tmp_path / "entities"
-    entities.mkdir()
-    
-    (entities / "Greptile.md").write_text(
+ENTITY_FILES = {
+    "Greptile.md": (
         "# Greptile\n**Type:** person\n\n"
         "## Facts\n- Code review bot\n\n"
         "## Timeline\n\n### [[2026-02-16]]\n- Reviewed PR\n"
-    )
-    (entities / "OpenClaw.md").write_text(
+    ),
+    "OpenClaw.md": (
         "# OpenClaw\n**Type:** project\n\n"
         "## Facts\n- 195k stars\n- TypeScript\n\n"
         "## Timeline\n"
-    )
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def _fix_template(tmp_path_factory):
+    """Entity files written once; tests edit their own copy."""
+    entities = tmp_path_factory.mktemp("fix_tmpl")
+    for name, content in ENTITY_FILES.items():
+        (entities / name).write_text(content)
     return entities
 
 
+@pytest.fixture
+def entity_dir(tmp_path, _fix_template):
+    return Path(shutil.copytree(_fix_template, tmp_path / "entities"))
+
+
 class TestFixType:
     def test_change_type(self, entity_dir):
         result = fix_type(entity_dir, "Greptile", "tool")
@@ -0,0 +1,48 @@
+"""Tests for the CSR graph adjacency."""
+
+import json
+
+import pytest
+from engram.graph import load_adjacency
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    triplets = [
+        {"subject": "Marcus", "predicate": "works_at", "object": "Kadoa"},
+        {"subject": "Marcus", "predicate": "knows", "object": "Adrian"},
+        {"subject": "marcus", "predicate": "knows", "object": "Adrian"},  # duplicate edge
+        {"subject": "Steipete", "predicate": "works_at", "object": "Kadoa"},
+        {"subject": "Steipete", "predicate": "knows", "object": "Adrian"},
+    ]
+    f = tmp_path / "graph.jsonl"
+    f.write_text("\n".join(json.dumps(t) for t in triplets) + "\nnot json\n\n")
+    return f
+
+
+def _neighbors(adj, name):
+    return {adj.names[n] for n in adj.neighbors(adj.ids[name])}
+
+
+class TestAdjacency:
+    def test_neighbors_undirected_and_unique(self, graph_file):
+        adj = load_adjacency(graph_file)
+        assert len(adj) == 4
+        assert _neighbors(adj, "marcus") == {"kadoa", "adrian"}
+        assert _neighbors(adj, "kadoa") == {"marcus", "steipete"}
+        assert adj.degree(adj.ids["marcus"]) == 2
+        assert list(adj.neighbors(adj.ids["adrian"])) == sorted(adj.neighbors(adj.ids["adrian"]))
+
+    def test_shared_neighbor_counts(self, graph_file):
+        adj = load_adjacency(graph_file)
+        m, s, k = adj.ids["marcus"], adj.ids["steipete"], adj.ids["kadoa"]
+        counts = adj.shared_neighbor_counts({m, s, k})
+        assert counts[min(m, s), max(m, s)] == 2
+        assert (min(m, k), max(m, k)) not in counts
+
+    def test_empty_graph(self, tmp_path):
+        f = tmp_path / "graph.jsonl"
+        f.write_text("")
+        adj = load_adjacency(f)
+        assert len(adj) == 0
+        assert list(adj.indptr) == [0]
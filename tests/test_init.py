@@ -1,9 +1,5 @@
 """Tests for garden init."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import pytest
 from engram.init import init_workspace
 
@@ -50,6 +46,8 @@ class TestInit:
         init_workspace(tmp_path)
         gitignore = (tmp_path / ".gitignore").read_text()
         assert "*.lock" in gitignore
+        for cache in ("entities.names", "entities.offsets", "entities.dat", "graph.idx.json"):
+            assert cache in gitignore.splitlines()
     
     def test_next_steps(self, tmp_path):
         actions = init_workspace(tmp_path)
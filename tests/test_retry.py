@@ -1,13 +1,17 @@
 """Tests for retry logic."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import pytest
 from engram.retry import with_retry, retry_call
 
 
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping through them."""
+    delays = []
+    monkeypatch.setattr("engram.retry.time.sleep", delays.append)
+    return delays
+
+
 class TestWithRetry:
     def test_succeeds_first_try(self):
         call_count = {"n": 0}
@@ -33,6 +37,17 @@ class TestWithRetry:
         assert fail_then_succeed() == "ok"
         assert call_count["n"] == 3
     
+    def test_backoff_doubles(self, sleeps):
+        @with_retry(max_retries=3, base_delay=1.0)
+        def always_fail():
+            raise Exception("HTTP Error 503: Service Unavailable")
+        
+        with pytest.raises(Exception, match="503"):
+            always_fail()
+        assert len(sleeps) == 3
+        for attempt, delay in enumerate(sleeps):
+            assert 2 ** attempt <= delay <= 2 ** attempt * 1.1
+    
     def test_gives_up_after_max_retries(self):
         @with_retry(max_retries=2, base_delay=0.01)
         def always_fail():
@@ -54,6 +69,47 @@ class TestWithRetry:
         
         assert call_count["n"] == 1  # No retry
 
+    
+    def test_status_code_attribute(self):
+        class StatusError(Exception):
+            def __init__(self, status_code):
+                super().__init__("request failed")
+                self.status_code = status_code
+        
+        calls = []
+        
+        @with_retry(max_retries=2, base_delay=0.01)
+        def flaky(code):
+            calls.append(code)
+            if len(calls) < 2:
+                raise StatusError(code)
+            return "ok"
+        
+        assert flaky(503) == "ok"
+        calls.clear()
+        with pytest.raises(StatusError):
+            flaky(400)
+        assert calls == [400]
+    
+    def test_code_must_be_whole_number(self):
+        calls = []
+        
+        @with_retry(max_retries=3, base_delay=0.01)
+        def fail():
+            calls.append(1)
+            raise Exception("order 14290 rejected")
+        
+        with pytest.raises(Exception):
+            fail()
+        assert len(calls) == 1
+    
+    def test_backoff_jitter_bounded(self):
+        from engram.retry import _backoff_delay
+        
+        for attempt in range(4):
+            delay = _backoff_delay(attempt, 2.0, 10.0)
+            base = min(2.0 * 2 ** attempt, 10.0)
+            assert base <= delay <= base * 1.1
 
 class TestRetryCall:
     def test_functional_retry(self):
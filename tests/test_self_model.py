@@ -1,15 +1,35 @@
 """Tests for identity-level self-model and belief drift detection."""
 
-import sys
 import json
 import yaml
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 import pytest
 from engram.self_model import Belief, BeliefDrift, SelfModel, SelfModelEngine
 
+# Read-only fixture model, serialized once for every test that parses it back
+_FIXTURE_MODEL = SelfModel(
+    beliefs=[
+        Belief(
+            claim="Prefers local-first tools",
+            confidence=0.8,
+            category="preferences",
+            evidence_for=["Built MindGardener"],
+            first_observed="2026-01-01",
+            last_updated="2026-02-01",
+        ),
+        Belief(
+            claim="Targets AI startups",
+            confidence=0.7,
+            category="goals",
+            evidence_against=["Applied to H&M"],
+        ),
+    ],
+    last_updated="2026-02-17",
+    version=3,
+)
+_FIXTURE_YAML = _FIXTURE_MODEL.to_yaml()
+
 
 class TestBelief:
     def test_basic_creation(self):
@@ -55,6 +75,19 @@ class TestBelief:
         assert b2.confidence == b.confidence
         assert b2.evidence_for == b.evidence_for
 
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+        b = Belief(claim="c", confidence=0.5, category="goals", evidence_for=["x"], status="weakening")
+        assert b.to_dict() == asdict(b)
+        assert list(b.to_dict()) == list(asdict(b))
+        assert b.to_dict()["evidence_for"] is not b.evidence_for
+
+    def test_slotted(self):
+        b = Belief(claim="test", confidence=0.5, category="goals")
+        assert not hasattr(b, "__dict__")
+        with pytest.raises(AttributeError):
+            b.unknown = 1
+
     def test_from_dict_extra_keys(self):
         """Unknown keys should be ignored."""
         d = {"claim": "test", "confidence": 0.5, "category": "goals", "unknown_key": 42}
@@ -132,6 +165,24 @@ class TestSelfModel:
         assert len(m.weakening()) == 1
         assert m.weakening()[0].claim == "a"
 
+    def test_filters_see_in_place_edits(self):
+        a = Belief(claim="a", confidence=0.8, category="goals")
+        m = SelfModel(beliefs=[a])
+        assert m.active_beliefs() == [a]
+        assert m.high_confidence() == [a]
+
+        a.status = "archived"
+        assert m.active_beliefs() == []
+        assert m.by_category("goals") == []
+
+        a.status = "weakening"
+        assert m.weakening() == [a]
+
+        b = Belief(claim="b", confidence=0.5, category="goals")
+        m.beliefs[0] = b
+        assert m.active_beliefs() == [b]
+        assert m.high_confidence() == []
+
     def test_find(self):
         m = SelfModel(beliefs=[
             Belief(claim="Prefers local-first tools", confidence=0.8, category="preferences"),
@@ -141,35 +192,78 @@ class TestSelfModel:
         assert len(m.find("TARGETS")) == 1  # Case insensitive
         assert len(m.find("nonexistent")) == 0
 
+    def test_find_after_claim_edit(self):
+        b = Belief(claim="Likes Python", confidence=0.5, category="preferences")
+        model = SelfModel(beliefs=[b])
+        assert model.find("python") == [b]
+        b.claim = "Likes Rust"
+        assert model.find("python") == []
+        assert model.find("RUST") == [b]
+
+    def test_find_large_model(self):
+        beliefs = [Belief(claim=f"Claim {i} about Café", confidence=0.5, category="goals")
+                   for i in range(300)]
+        m = SelfModel(beliefs=beliefs)
+        assert m.find("CLAIM 29") == beliefs[29:30] + beliefs[290:300]
+        assert m.find("about café") == beliefs
+        assert m.find("") == beliefs
+        assert m.find("café\0claim") == []
+        assert m.find("missing") == []
+
+        beliefs[5].claim = "Edited in place"
+        assert m.find("edited") == [beliefs[5]]
+        assert beliefs[5] not in m.find("café")
+
     def test_yaml_roundtrip(self):
-        m = SelfModel(
-            beliefs=[
-                Belief(
-                    claim="Prefers local-first tools",
-                    confidence=0.8,
-                    category="preferences",
-                    evidence_for=["Built MindGardener"],
-                    first_observed="2026-01-01",
-                    last_updated="2026-02-01",
-                ),
-                Belief(
-                    claim="Targets AI startups",
-                    confidence=0.7,
-                    category="goals",
-                    evidence_against=["Applied to H&M"],
-                ),
-            ],
-            last_updated="2026-02-17",
-            version=3,
-        )
-        yaml_str = m.to_yaml()
-        m2 = SelfModel.from_yaml(yaml_str)
+        m2 = SelfModel.from_yaml(_FIXTURE_YAML)
 
         assert len(m2.beliefs) == 2
         assert m2.beliefs[0].claim == "Prefers local-first tools"
         assert m2.beliefs[0].confidence == 0.8
         assert m2.beliefs[1].evidence_against == ["Applied to H&M"]
         assert m2.version == 3
+        assert m2.to_yaml() == _FIXTURE_YAML
+
+    def test_dump_to_matches_to_yaml(self, tmp_path):
+        m = SelfModel(beliefs=[Belief(claim="Café owner", confidence=0.6, category="skills")], version=3)
+        path = tmp_path / "model.yaml"
+        m.dump_to(path)
+        assert path.read_bytes() == m.to_yaml(encoding="utf-8")
+        assert path.read_bytes().decode() == m.to_yaml()
+
+    def test_dump_to_failure_keeps_old_file(self, tmp_path, monkeypatch):
+        import yaml
+        path = tmp_path / "model.yaml"
+        path.write_text("old: true\n")
+        
+        def broken_dump(data, stream, **kwargs):
+            stream.write(b"partial")
+            raise RuntimeError("disk full")
+        
+        monkeypatch.setattr(yaml, "dump", broken_dump)
+        with pytest.raises(RuntimeError):
+            _FIXTURE_MODEL.dump_to(path)
+        assert path.read_text() == "old: true\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_dump_to_stream(self):
+        import io
+        buf = io.StringIO()
+        _FIXTURE_MODEL.dump_to(buf)
+        assert buf.getvalue() == _FIXTURE_YAML
+
+    def test_json_roundtrip(self):
+        m = SelfModel(
+            beliefs=[Belief(claim="Café owner", confidence=0.6, category="skills", evidence_for=["a"])],
+            last_updated="2026-02-17", version=3,
+        )
+        m2 = SelfModel.from_json(m.to_json())
+        assert m2.to_json() == m.to_json()
+        assert m2.beliefs[0].evidence_for == ["a"]
+        assert m2.version == 3
+
+    def test_json_matches_yaml(self):
+        assert SelfModel.from_json(_FIXTURE_MODEL.to_json()).to_yaml() == _FIXTURE_YAML
 
     def test_yaml_empty(self):
         m = SelfModel.from_yaml("")
@@ -194,12 +288,23 @@ class TestSelfModel:
         text = m.format_readable()
         assert "No beliefs" in text
 
+    def test_format_for_prompt(self):
+        m = SelfModel(beliefs=[
+            Belief(claim="Low", confidence=0.4, category="goals"),
+            Belief(claim="High", confidence=0.9, category="goals", evidence_against=["x"] * 3),
+            Belief(claim="Mid", confidence=0.7, category="goals"),
+            Belief(claim="Gone", confidence=0.9, category="goals", status="weakening"),
+        ])
+        # High has net 0.0 from counter-evidence, so it ranks last
+        assert m.format_for_prompt() == "- Mid: 0.70\n- Low: 0.40\n- High: 0.90"
+        assert m.format_for_prompt(top_k=1) == "- Mid: 0.70"
+
 
 class TestSelfModelEngine:
     @pytest.fixture
     def engine_setup(self, tmp_path):
         """Set up engine with mock LLM."""
-        model_path = tmp_path / "memory" / "self-model.yaml"
+        model_path = tmp_path / "memory" / "self-model.json"
         model_path.parent.mkdir(parents=True, exist_ok=True)
         return tmp_path, model_path
 
@@ -223,6 +328,87 @@ class TestSelfModelEngine:
         assert loaded.beliefs[0].claim == "Test belief"
         assert loaded.version == 1
 
+    def test_load_cached_copy_not_shared(self, engine_setup):
+        tmp_path, model_path = engine_setup
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        engine.save(SelfModel(beliefs=[
+            Belief(claim="Test belief", confidence=0.9, category="goals", evidence_for=["a"]),
+        ]))
+
+        first = engine.load()
+        first.beliefs[0].evidence_for.append("b")
+        first.beliefs.append(Belief(claim="Other", confidence=0.5, category="goals"))
+
+        second = engine.load()
+        assert len(second.beliefs) == 1
+        assert second.beliefs[0].evidence_for == ["a"]
+
+    def test_save_creates_directory(self, tmp_path):
+        model_path = tmp_path / "new" / "dir" / "self-model.json"
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        engine.save(SelfModel(beliefs=[Belief(claim="Café owner", confidence=0.6, category="skills")]))
+        assert engine.load().beliefs[0].claim == "Café owner"
+        assert engine.model_path == model_path
+        assert json.loads(model_path.read_bytes())["beliefs"][0]["claim"] == "Café owner"
+
+    def test_save_replaces_file_atomically(self, engine_setup):
+        tmp_path, model_path = engine_setup
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        engine.save(SelfModel())
+        inode = model_path.stat().st_ino
+        engine.save(engine.load())
+        # A rename installs a new inode; in-place writes would keep the old one
+        assert model_path.stat().st_ino != inode
+        assert sorted(p.name for p in model_path.parent.iterdir()) == [model_path.name]
+
+    def test_load_skips_read_for_unchanged_file(self, engine_setup, monkeypatch):
+        import os
+        tmp_path, model_path = engine_setup
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        engine.save(SelfModel(beliefs=[Belief(claim="Old", confidence=0.5, category="goals")]))
+        os.utime(model_path, ns=(1_000_000_000, 1_000_000_000))
+        assert engine.load().beliefs[0].claim == "Old"
+
+        def no_read(self):
+            raise AssertionError("file re-read")
+        monkeypatch.setattr(Path, "read_bytes", no_read)
+        assert engine.load().beliefs[0].claim == "Old"
+        monkeypatch.undo()
+
+        # Same size, new content: the mtime change forces a re-read
+        model_path.write_text(model_path.read_text().replace("Old", "New"))
+        assert engine.load().beliefs[0].claim == "New"
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".yml"])
+    def test_load_legacy_yaml(self, engine_setup, suffix):
+        tmp_path, model_path = engine_setup
+        model_path.with_suffix(suffix).write_text(_FIXTURE_YAML)
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        assert engine.exists()
+        model = engine.load()
+        assert model.beliefs[0].claim == "Prefers local-first tools"
+        assert model.version == 3
+
+        # The next save writes JSON at model_path, which then takes precedence
+        model.beliefs[0].claim = "Migrated"
+        engine.save(model)
+        assert json.loads(model_path.read_bytes())["beliefs"][0]["claim"] == "Migrated"
+        assert engine.load().beliefs[0].claim == "Migrated"
+
+    @pytest.mark.parametrize("name", ["beliefs.yaml", "beliefs.yml"])
+    def test_yaml_model_path_respected(self, tmp_path, name):
+        model_path = tmp_path / name
+        model_path.write_text(_FIXTURE_YAML)
+        engine = SelfModelEngine(llm=None, model_path=model_path)
+        assert engine.model_path == model_path
+        assert engine.exists()
+        model = engine.load()
+        assert model.version == 3
+
+        engine.save(model)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [name]
+        assert SelfModel.from_yaml(model_path.read_text()).version == 4
+
     def test_save_increments_version(self, engine_setup):
         tmp_path, model_path = engine_setup
         engine = SelfModelEngine(llm=None, model_path=model_path)
@@ -259,93 +445,57 @@ class TestSelfModelEngine:
         assert len(new_belief) == 1
         assert new_belief[0].confidence == 0.8
 
-    def test_apply_drifts_strengthen(self, engine_setup):
+    def test_apply_drifts_new_then_strengthen_same_batch(self, engine_setup):
         tmp_path, model_path = engine_setup
         engine = SelfModelEngine(llm=None, model_path=model_path)
-
-        model = SelfModel(beliefs=[
-            Belief(claim="Targets AI startups", confidence=0.6, category="goals"),
-        ])
-        engine.save(model)
-
-        drifts = [BeliefDrift(
-            belief_claim="Targets AI startups",
-            drift_type="strengthened",
-            old_confidence=0.6,
-            new_confidence=0.85,
-            trigger_event="Applied to third AI startup",
-            reasoning="Consistent pattern",
-            significance=0.4,
-        )]
+        engine.save(SelfModel(beliefs=[]))
+
+        drifts = [
+            BeliefDrift(
+                belief_claim="Values remote work", drift_type="new",
+                old_confidence=0.0, new_confidence=0.6,
+                trigger_event="Declined office role", reasoning="", significance=0.6,
+            ),
+            BeliefDrift(
+                belief_claim="values REMOTE work", drift_type="strengthened",
+                old_confidence=0.6, new_confidence=0.8,
+                trigger_event="Moved to Lisbon", reasoning="", significance=0.6,
+            ),
+        ]
         result = engine.apply_drifts(drifts)
-        assert result.beliefs[0].confidence == 0.85
-        assert "Applied to third AI startup" in result.beliefs[0].evidence_for
-
-    def test_apply_drifts_weaken(self, engine_setup):
+        assert len(result.beliefs) == 1
+        assert result.beliefs[0].confidence == 0.8
+        assert result.beliefs[0].evidence_for == ["Declined office role", "Moved to Lisbon"]
+
+    @pytest.mark.parametrize("drift_type, new_confidence, significance, expected", [
+        # expected: (confidence, status, evidence_for, evidence_against)
+        pytest.param("strengthened", 0.85, 0.4, (0.85, "active", ["event"], []), id="strengthen"),
+        pytest.param("weakened", 0.4, 0.5, (0.4, "active", [], ["event"]), id="weaken"),
+        pytest.param("weakened", 0.25, 0.5, (0.25, "weakening", [], ["event"]), id="weaken-below-0.3"),
+        pytest.param("contradicted", 0.2, 0.8, (0.2, "weakening", [], ["event"]), id="contradict"),
+        pytest.param("evolved", 0.75, 0.7, (0.75, "revised", ["event"], []), id="evolve"),
+        pytest.param("strengthened", 0.55, 0.1, (0.5, "active", [], []), id="below-threshold"),
+    ])
+    def test_apply_drifts_existing(self, engine_setup, drift_type, new_confidence, significance, expected):
         tmp_path, model_path = engine_setup
         engine = SelfModelEngine(llm=None, model_path=model_path)
-
-        model = SelfModel(beliefs=[
-            Belief(claim="Targets AI startups", confidence=0.8, category="goals"),
-        ])
-        engine.save(model)
+        engine.save(SelfModel(beliefs=[
+            Belief(claim="Targets AI startups", confidence=0.5, category="goals"),
+        ]))
 
         drifts = [BeliefDrift(
             belief_claim="Targets AI startups",
-            drift_type="weakened",
-            old_confidence=0.8,
-            new_confidence=0.4,
-            trigger_event="Applied to H&M (non-AI)",
-            reasoning="Breaking the AI-only pattern",
-            significance=0.5,
-        )]
-        result = engine.apply_drifts(drifts)
-        assert result.beliefs[0].confidence == 0.4
-        assert "Applied to H&M (non-AI)" in result.beliefs[0].evidence_against
-
-    def test_apply_drifts_contradict(self, engine_setup):
-        tmp_path, model_path = engine_setup
-        engine = SelfModelEngine(llm=None, model_path=model_path)
-
-        model = SelfModel(beliefs=[
-            Belief(claim="Dislikes networking", confidence=0.7, category="habits"),
-        ])
-        engine.save(model)
-
-        drifts = [BeliefDrift(
-            belief_claim="Dislikes networking",
-            drift_type="contradicted",
-            old_confidence=0.7,
-            new_confidence=0.2,
-            trigger_event="Initiated 5 networking DMs in one day",
-            reasoning="Direct contradiction of assumed behavior",
-            significance=0.8,
-        )]
-        result = engine.apply_drifts(drifts)
-        assert result.beliefs[0].confidence == 0.2
-        assert result.beliefs[0].status == "weakening"
-
-    def test_apply_drifts_below_threshold(self, engine_setup):
-        tmp_path, model_path = engine_setup
-        engine = SelfModelEngine(llm=None, model_path=model_path)
-
-        model = SelfModel(beliefs=[
-            Belief(claim="Test", confidence=0.5, category="goals"),
-        ])
-        engine.save(model)
-
-        drifts = [BeliefDrift(
-            belief_claim="Test",
-            drift_type="strengthened",
+            drift_type=drift_type,
             old_confidence=0.5,
-            new_confidence=0.55,
-            trigger_event="Minor event",
-            reasoning="Tiny confirmation",
-            significance=0.1,  # Below default 0.3 threshold
+            new_confidence=new_confidence,
+            trigger_event="event",
+            reasoning="",
+            significance=significance,
         )]
         result = engine.apply_drifts(drifts, significance_threshold=0.3)
-        # Should not have changed
-        assert result.beliefs[0].confidence == 0.5
+        b = result.beliefs[0]
+        assert (b.confidence, b.status, b.evidence_for, b.evidence_against) == expected
+        assert len(result.beliefs) == 1
 
     def test_drift_log(self, engine_setup):
         tmp_path, model_path = engine_setup
@@ -370,6 +520,89 @@ class TestSelfModelEngine:
         assert entry["belief_claim"] == "Test"
         assert "timestamp" in entry
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_drift_log_compact_utf8(self, engine_setup, monkeypatch, use_orjson):
+        from engram import fastjson
+        if use_orjson and fastjson.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(fastjson, "orjson", None)
+        tmp_path, model_path = engine_setup
+        drift_log = tmp_path / "memory" / "belief-drifts.jsonl"
+        engine = SelfModelEngine(llm=None, model_path=model_path, drift_log_path=drift_log)
+        engine._log_drifts([BeliefDrift("Café owner", "new", 0.0, 0.7, "event", "reason", 0.5)])
+
+        line = drift_log.read_bytes()
+        assert "Café owner".encode() in line
+        assert b", " not in line and b": " not in line
+        assert json.loads(line)["belief_claim"] == "Café owner"
+
+    def test_drift_log_creates_directory(self, engine_setup):
+        tmp_path, model_path = engine_setup
+        drift_log = tmp_path / "logs" / "nested" / "belief-drifts.jsonl"
+        engine = SelfModelEngine(llm=None, model_path=model_path, drift_log_path=drift_log)
+        drift = BeliefDrift("Test", "new", 0.0, 0.7, "event", "reason", 0.5)
+        engine._log_drifts([drift])
+        engine._log_drifts([drift])
+        assert len(drift_log.read_text().splitlines()) == 2
+
+    def test_drift_log_batch(self, engine_setup):
+        tmp_path, model_path = engine_setup
+        drift_log = tmp_path / "memory" / "belief-drifts.jsonl"
+        engine = SelfModelEngine(llm=None, model_path=model_path, drift_log_path=drift_log)
+
+        drifts = [
+            BeliefDrift(
+                belief_claim=f"Claim {i}", drift_type="new", old_confidence=0.0,
+                new_confidence=0.7, trigger_event="event", reasoning="r" * 500,
+                significance=0.5,
+            )
+            for i in range(20)
+        ]
+        engine._log_drifts(drifts)
+        engine._log_drifts(drifts[:1])
+
+        entries = [json.loads(line) for line in drift_log.read_text().splitlines()]
+        assert [e["belief_claim"] for e in entries] == [f"Claim {i}" for i in range(20)] + ["Claim 0"]
+        assert len({e["timestamp"] for e in entries[:20]}) == 1
+
+    def test_detect_drift_sync_repeated(self, engine_setup):
+        from unittest.mock import AsyncMock, MagicMock
+        tmp_path, model_path = engine_setup
+        llm = MagicMock()
+        llm.generate_json = AsyncMock(return_value={"drifts": [{
+            "belief_claim": "Test belief", "drift_type": "strengthened",
+            "old_confidence": 0.5, "new_confidence": 0.7, "significance": 0.4,
+        }]})
+        engine = SelfModelEngine(llm=llm, model_path=model_path)
+        engine.save(SelfModel(beliefs=[Belief(claim="Test belief", confidence=0.5, category="goals")]))
+
+        first = engine.detect_drift_sync("events")
+        second = engine.detect_drift_sync("more events")
+        assert [d.drift_type for d in first + second] == ["strengthened", "strengthened"]
+        assert "Test belief: 0.50" in llm.generate_json.call_args.args[0]
+
+    def test_detect_and_apply_loads_once(self, engine_setup, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+        tmp_path, model_path = engine_setup
+        llm = MagicMock()
+        llm.generate_json = AsyncMock(return_value={"drifts": [{
+            "belief_claim": "Test belief", "drift_type": "strengthened",
+            "old_confidence": 0.5, "new_confidence": 0.8, "trigger_event": "shipped",
+            "significance": 0.5,
+        }]})
+        engine = SelfModelEngine(llm=llm, model_path=model_path)
+        engine.save(SelfModel(beliefs=[Belief(claim="Test belief", confidence=0.5, category="goals")]))
+
+        loads = []
+        original = engine.load
+        monkeypatch.setattr(engine, "load", lambda: loads.append(1) or original())
+        drifts, model = engine.detect_and_apply_sync("events")
+        assert len(loads) == 1
+        assert len(drifts) == 1
+        assert model.beliefs[0].confidence == 0.8
+        assert original().beliefs[0].confidence == 0.8
+
     def test_format_drifts_empty(self):
         engine = SelfModelEngine(llm=None, model_path=Path("/tmp/unused"))
         text = engine.format_drifts([])
@@ -5,52 +5,91 @@ Tests core pipeline with mocked LLM calls.
 """
 
 import json
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, AsyncMock
+import os
+import re
+import shutil
+from dataclasses import asdict
+
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from engram.config import EngramConfig
+from engram.prediction_error import (
+    COMPARE_PROMPT, PREDICT_PROMPT, PredictionErrorEngine, PredictionErrorEvent,
+    PredictionResult, _render_compare, _render_predict,
+)
+from engram.recall import list_entities
 
 
 # ---- Fixtures ----
 
-@pytest.fixture
-def workspace(tmp_path):
-    """Minimal engram workspace."""
-    memory_dir = tmp_path / "memory"
-    memory_dir.mkdir()
-    entities_dir = memory_dir / "entities"
-    entities_dir.mkdir()
-    
-    daily = memory_dir / "2026-02-16.md"
-    daily.write_text("""# 2026-02-16 Daily Notes
+_DAILY = b"""# 2026-02-16 Daily Notes
 ## Research
 - Talked to Adrian Krebs at Kadoa about web scraping
 - Adrian is the CTO of Kadoa
 - Submitted PR #18444 to OpenClaw (infinite retry loop fix)
-""")
-    
-    memory_file = tmp_path / "MEMORY.md"
-    memory_file.write_text("# Long-term Memory\n- Working on OpenClaw contributions\n")
-    
+"""
+
+_MEMORY = b"# Long-term Memory\n- Working on OpenClaw contributions\n"
+
+
+def _paths(root):
+    memory_dir = root / "memory"
     return {
-        "root": tmp_path,
+        "root": root,
         "memory_dir": memory_dir,
-        "entities_dir": entities_dir,
-        "memory_file": memory_file,
+        "entities_dir": memory_dir / "entities",
+        "memory_file": root / "MEMORY.md",
     }
 
 
+@pytest.fixture(scope="module")
+def _workspace_template(tmp_path_factory):
+    """Build the workspace once; each test gets its own copy."""
+    ws = _paths(tmp_path_factory.mktemp("smoke_tmpl"))
+    ws["entities_dir"].mkdir(parents=True)
+    (ws["memory_dir"] / "2026-02-16.md").write_bytes(_DAILY)
+    ws["memory_file"].write_bytes(_MEMORY)
+    return ws["root"]
+
+
+def _copy_workspace(template, root):
+    shutil.copytree(template, root, dirs_exist_ok=True)
+    return _paths(root)
+
+
+@pytest.fixture
+def workspace(tmp_path, _workspace_template):
+    """Minimal engram workspace."""
+    return _copy_workspace(_workspace_template, tmp_path)
+
+
 # ---- PE Engine Tests (class-based, direct) ----
 
-def make_mock_llm():
-    """Mock LLM provider matching engram's LLMProvider interface."""
-    from engram.providers import LLMProvider
+_PREDICT_RE = re.compile(r"predict", re.I)
+_COMPARE_RE = re.compile(r"compare|prediction error", re.I)
+
+
+class _StubLLM:
+    """Plain stand-in for LLMProvider: answers by prompt kind, records prompts."""
     
-    llm = MagicMock(spec=LLMProvider)
+    def __init__(self, predict_response, compare_response):
+        self.predict_response = predict_response
+        self.compare_response = compare_response
+        self.prompts = []
     
+    def generate_json_sync(self, prompt):
+        self.prompts.append(prompt)
+        # Case-insensitive search without lowercasing a copy of the prompt
+        if _PREDICT_RE.search(prompt) and not _COMPARE_RE.search(prompt):
+            return self.predict_response
+        return self.compare_response
+    
+    async def generate_json(self, prompt):
+        return self.generate_json_sync(prompt)
+
+
+def make_mock_llm():
+    """Stub LLM provider matching engram's LLMProvider interface."""
     predict_response = {
         "predictions": [
             {"event": "Continued OpenClaw work", "confidence": 0.8, "reasoning": "Active contributor"},
@@ -69,21 +108,24 @@ def make_mock_llm():
         "model_updates": ["Add Kadoa as a new contact/company"]
     }
     
-    def side_effect(prompt):
-        if "predict" in prompt.lower() and "compare" not in prompt.lower() and "prediction error" not in prompt.lower():
-            return predict_response
-        return compare_response
-    
-    llm.generate_json_sync = MagicMock(side_effect=side_effect)
-    llm.generate_json = AsyncMock(side_effect=side_effect)
-    
-    return llm
+    return _StubLLM(predict_response, compare_response)
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    return make_mock_llm()
+
+
+@pytest.fixture(scope="module")
+def computed_result(tmp_path_factory, _workspace_template, mock_llm):
+    """One compute_sync run, shared by tests that only inspect its result."""
+    ws = _copy_workspace(_workspace_template, tmp_path_factory.mktemp("computed"))
+    engine = PredictionErrorEngine(mock_llm, ws["memory_dir"], ws["memory_file"])
+    return engine.compute_sync("2026-02-16")
 
 
 class TestPredictionErrorEvent:
     def test_should_consolidate(self):
-        from engram.prediction_error import PredictionErrorEvent
-        
         high = PredictionErrorEvent(event="test", prediction_error=0.8)
         low = PredictionErrorEvent(event="test", prediction_error=0.3)
         
@@ -91,8 +133,6 @@ class TestPredictionErrorEvent:
         assert not low.should_consolidate(threshold=0.5)
     
     def test_serialization_roundtrip(self):
-        from engram.prediction_error import PredictionErrorEvent
-        
         event = PredictionErrorEvent(
             event="test event",
             prediction_error=0.7,
@@ -107,58 +147,84 @@ class TestPredictionErrorEvent:
         assert restored.prediction_error == 0.7
         assert restored.entities == ["Alice", "Bob"]
     
+    def test_from_dict_ignores_unknown_keys(self):
+        restored = PredictionErrorEvent.from_dict(
+            {"event": "e", "prediction_error": 0.9, "entities": None, "extra": 1})
+        assert restored.event == "e"
+        assert restored.entities == []
+        assert restored.category == "unknown"
+    
+    def test_to_dict_matches_asdict(self):
+        event = PredictionErrorEvent(event="e", prediction_error=0.4, entities=["A"])
+        assert event.to_dict() == asdict(event)
+        assert not hasattr(event, "__dict__")  # slots
+    
     def test_default_threshold(self):
-        from engram.prediction_error import PredictionErrorEvent
-        
         # Default threshold is 0.5
         at_threshold = PredictionErrorEvent(event="test", prediction_error=0.5)
         assert at_threshold.should_consolidate()  # >= 0.5
 
 
 class TestPredictionErrorEngine:
-    def test_compute_scores(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
-        
-        llm = make_mock_llm()
-        engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
-        result = engine.compute_sync("2026-02-16")
-        
+    def test_compute_scores(self, computed_result):
+        result = computed_result
         assert len(result.errors) == 2
         assert result.errors[0].prediction_error == 0.7
         assert result.errors[1].prediction_error == 0.3
     
-    def test_mean_surprise(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
-        
+    def test_mean_surprise(self, computed_result):
+        assert abs(computed_result.mean_surprise - 0.5) < 0.01  # (0.7 + 0.3) / 2
+    
+    def test_high_vs_medium_surprise(self, computed_result):
+        result = computed_result
+        assert len(result.high_surprise) == 0   # Nothing > 0.7
+        assert len(result.medium_surprise) == 1  # 0.7 is in [0.4, 0.7]
+    
+    def test_no_daily_log(self, workspace):
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
-        result = engine.compute_sync("2026-02-16")
+        result = engine.compute_sync("2099-01-01")
         
-        assert abs(result.mean_surprise - 0.5) < 0.01  # (0.7 + 0.3) / 2
+        assert len(result.errors) == 0
+        assert result.mean_surprise == 0.0
     
-    def test_high_vs_medium_surprise(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
-        
+    def test_empty_daily_log_skips_llm(self, workspace):
+        (workspace["memory_dir"] / "2026-02-17.md").write_bytes(b"")
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
-        result = engine.compute_sync("2026-02-16")
+        result = engine.compute_sync("2026-02-17")
         
-        assert len(result.high_surprise) == 0   # Nothing > 0.7
-        assert len(result.medium_surprise) == 1  # 0.7 is in [0.4, 0.7]
+        assert result.errors == []
+        assert llm.prompts == []
     
-    def test_no_daily_log(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
+    def test_prefiltered_empty_log_sends_no_request(self, workspace, monkeypatch):
+        from engram.providers import LLMProvider
+        
+        sent = []
         
+        class RecordingProvider(LLMProvider):
+            def generate(self, prompt, json_mode=True):
+                sent.append(prompt)
+                return {}
+        
+        engine = PredictionErrorEngine(RecordingProvider(), workspace["memory_dir"], workspace["memory_file"])
+        monkeypatch.setattr(engine, "_read_daily_log", lambda date_str: "")
+        
+        assert engine.compute_sync("2026-02-16").errors == []
+        assert sent == []
+    
+    def test_cold_start_uses_short_prompt(self, workspace):
         llm = make_mock_llm()
+        llm.predict_response = {"predictions": []}
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
-        result = engine.compute_sync("2099-01-01")
+        result = engine.compute_sync("2026-02-16")
         
-        assert len(result.errors) == 0
-        assert result.mean_surprise == 0.0
+        assert len(result.errors) == 2
+        second_prompt = llm.prompts[1]
+        assert "PREDICTIONS MADE" not in second_prompt
+        assert "no predictions" in second_prompt
     
     def test_scores_persisted(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
-        
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
         engine.compute_sync("2026-02-16")
@@ -173,19 +239,78 @@ class TestPredictionErrorEngine:
         assert "prediction_error" in first
         assert "event" in first
     
-    def test_model_updates(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
+    def test_scores_follow_rotated_file(self, workspace):
+        llm = make_mock_llm()
+        engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
+        engine.compute_sync("2026-02-16")
+        engine.compute_sync("2026-02-16")
+        assert len(engine.load_history()) == 4
         
+        rotated = engine.scores_file.with_suffix(".jsonl.1")
+        engine.scores_file.rename(rotated)
+        engine.compute_sync("2026-02-16")
+        assert len(engine.load_history()) == 2
+        assert len(rotated.read_text().splitlines()) == 4
+    
+    def test_large_score_batch_written_whole(self, workspace):
+        engine = PredictionErrorEngine(make_mock_llm(), workspace["memory_dir"], workspace["memory_file"])
+        errors = [PredictionErrorEvent(event="x" * 500, prediction_error=0.5) for _ in range(20)]
+        engine._save_scores(errors)
+        
+        history = engine.load_history()
+        assert len(history) == 20
+        assert all(e.event == "x" * 500 for e in history)
+    
+    def test_read_caches_invalidate_on_mtime(self, workspace):
+        engine = PredictionErrorEngine(make_mock_llm(), workspace["memory_dir"], workspace["memory_file"])
+        entity = workspace["entities_dir"] / "Kadoa.md"
+        entity.write_text("# Kadoa\n")
+        assert "OpenClaw" in engine._read_memory()
+        assert "# Kadoa" in engine._read_entities()
+        
+        workspace["memory_file"].write_text("# Long-term Memory\n- Moved to Berlin\n")
+        entity.write_text("# Kadoa v2\n")
+        for path in (workspace["memory_file"], entity):
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        
+        assert "Berlin" in engine._read_memory()
+        assert "# Kadoa v2" in engine._read_entities()
+    
+    def test_large_daily_log_truncated(self, workspace):
+        engine = PredictionErrorEngine(make_mock_llm(), workspace["memory_dir"], workspace["memory_file"])
+        log = workspace["memory_dir"] / "2026-02-17.md"
+        log.write_text("".join(f"- Unique event number {i}\n" for i in range(5000)))
+        
+        content = engine._read_daily_log("2026-02-17", max_chars=1000)
+        assert content.startswith("- Unique event number 0\n")
+        assert content.endswith(f"full log was {log.stat().st_size} bytes]")
+    
+    def test_load_history_skips_corrupt_lines(self, workspace):
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
-        result = engine.compute_sync("2026-02-16")
+        engine.compute_sync("2026-02-16")
+        with open(engine.scores_file, "a") as f:
+            f.write("not json\n\n")
         
-        assert len(result.model_updates) == 1
-        assert "Kadoa" in result.model_updates[0]
+        history = engine.load_history()
+        assert [e.prediction_error for e in history] == [0.7, 0.3]
     
-    def test_learning_rate_empty(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
+    def test_load_history_skips_non_object_lines(self, workspace):
+        llm = make_mock_llm()
+        engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
+        engine.compute_sync("2026-02-16")
+        with open(engine.scores_file, "a") as f:
+            f.write('5\nnull\n[]\n"text"\n')
         
+        assert [e.prediction_error for e in engine.load_history()] == [0.7, 0.3]
+        assert engine.learning_rate() == pytest.approx(0.5)
+    
+    def test_model_updates(self, computed_result):
+        assert len(computed_result.model_updates) == 1
+        assert "Kadoa" in computed_result.model_updates[0]
+    
+    def test_learning_rate_empty(self, workspace):
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
         
@@ -193,8 +318,6 @@ class TestPredictionErrorEngine:
         assert engine.learning_rate() == 0.0
     
     def test_learning_rate_after_compute(self, workspace):
-        from engram.prediction_error import PredictionErrorEngine
-        
         llm = make_mock_llm()
         engine = PredictionErrorEngine(llm, workspace["memory_dir"], workspace["memory_file"])
         engine.compute_sync("2026-02-16")
@@ -204,33 +327,42 @@ class TestPredictionErrorEngine:
         assert abs(lr - 0.5) < 0.01
 
 
+class TestPromptTemplates:
+    def test_templates_match_format(self):
+        assert _render_predict("2026-02-16", "mem {x} $y", "ents") == PREDICT_PROMPT.format(
+            date="2026-02-16", memory="mem {x} $y", entities="ents")
+        assert _render_compare("2026-02-16", "[]", "log") == COMPARE_PROMPT.format(
+            date="2026-02-16", predictions="[]", actual="log")
+
+
 class TestPredictionResult:
     def test_empty_result(self):
-        from engram.prediction_error import PredictionResult
-        
         result = PredictionResult(date="2026-02-16", predictions=[], actual_events=[], errors=[])
         assert result.mean_surprise == 0.0
         assert result.high_surprise == []
         assert result.medium_surprise == []
+    
+    def test_surprise_buckets_single_pass(self):
+        errors = [PredictionErrorEvent(event=str(pe), prediction_error=pe)
+                  for pe in (0.9, 0.7, 0.4, 0.2)]
+        result = PredictionResult(date="2026-02-16", predictions=[], actual_events=[], errors=errors)
+        high, medium, mean = result.surprise_buckets()
+        
+        assert [e.event for e in high] == ["0.9"]
+        assert [e.event for e in medium] == ["0.7", "0.4"]
+        assert mean == pytest.approx(0.55)
 
 
 class TestRecall:
     def test_recall_function(self, workspace):
         """Test the recall module's entity listing."""
-        from engram.recall import list_entities
-        from engram.config import EngramConfig
-        
         # Create a test entity
         entity_file = workspace["entities_dir"] / "TestEntity.md"
         entity_file.write_text("# TestEntity\n**Type:** test\n\n## Facts\n- A test entity\n")
         
-        config = EngramConfig.__new__(EngramConfig)
-        config.workspace = workspace["root"]
-        config.memory_dir = workspace["memory_dir"]
-        config.entities_dir = workspace["entities_dir"]
-        config.graph_file = workspace["memory_dir"] / "graph.jsonl"
-        config.long_term_memory = workspace["memory_file"]
-        config.surprise_file = workspace["memory_dir"] / "surprise-scores.jsonl"
+        # The default layout resolves to exactly this workspace's paths
+        config = EngramConfig(workspace=workspace["root"]).resolve()
+        assert config.entities_dir == workspace["entities_dir"]
         
         entities = list_entities(config)
         assert len(entities) >= 1